@@ -0,0 +1,63 @@
+"""Repeated `Button(...).exists()` with Helium vs a compiled selector
+
+Loads a generated page with `--buttons` buttons below a "Password" label in headless
+Chrome and times `--checks` existence checks of `Button("Log In", below="Password")`,
+using Helium's element and `Browser.compile`.
+
+    python benchmarks/bench_selectors.py --buttons 300 --checks 20
+"""
+
+import argparse
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ak_selenium import Chrome
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--buttons", type=int, default=300)
+    parser.add_argument("--checks", type=int, default=20)
+    args = parser.parse_args()
+
+    buttons = "".join(f"<button>Item {i}</button>" for i in range(args.buttons))
+    html = (
+        f"<html><body><div>{buttons}</div><p>Password</p>"
+        "<input type='password'><button>Log In</button></body></html>"
+    )
+    with TemporaryDirectory() as tmp:
+        page = Path(tmp) / "page.html"
+        page.write_text(html)
+
+        chrome = Chrome(headless=True, half_screen=False)
+        try:
+            chrome.get(page.as_uri())
+            element = chrome.Element.Button("Log In", below="Password")
+            compiled = chrome.compile(element)
+
+            start = time.perf_counter()
+            for _ in range(args.checks):
+                assert element.exists()
+            helium_time = (time.perf_counter() - start) / args.checks
+
+            start = time.perf_counter()
+            assert compiled.exists()
+            first = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(args.checks):
+                assert compiled.exists()
+            compiled_time = (time.perf_counter() - start) / args.checks
+
+            print(f"{args.checks} checks of {element!r} on a page with {args.buttons} buttons")
+            print(f"  {'helium':<20} {helium_time * 1000:10.2f} ms/check")
+            print(
+                f"  {'compiled':<20} {compiled_time * 1000:10.2f} ms/check"
+                f"  (first resolve {first * 1000:.2f} ms, {compiled.cache_hits} cache hits)"
+            )
+        finally:
+            chrome.driver.quit()
+
+
+if __name__ == "__main__":
+    main()
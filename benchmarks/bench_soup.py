@@ -0,0 +1,75 @@
+"""Repeated `Browser.soup` access before and after the versioned soup cache
+
+Loads a generated page with `--rows` table rows in headless Chrome and reads the soup
+`--reads` times, comparing a fresh `page_source` + `html.parser` parse per access
+(the previous behaviour) with the cached `Browser.soup`, for every installed parser.
+
+    python benchmarks/bench_soup.py --rows 5000 --reads 20
+"""
+
+import argparse
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from bs4 import BeautifulSoup
+
+from ak_selenium import Chrome
+
+
+def installed_parsers() -> list[str]:
+    parsers = ["html.parser"]
+    for name in ("lxml", "html5lib"):
+        try:
+            __import__(name)
+            parsers.append(name)
+        except ImportError:
+            pass
+    return parsers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--reads", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = "".join(
+        f"<tr><td>{i}</td><td><a href='/item/{i}'>Item {i}</a></td></tr>"
+        for i in range(args.rows)
+    )
+    with TemporaryDirectory() as tmp:
+        page = Path(tmp) / "page.html"
+        page.write_text(f"<html><body><table>{rows}</table></body></html>")
+
+        chrome = Chrome(headless=True, half_screen=False)
+        try:
+            chrome.get(page.as_uri())
+
+            start = time.perf_counter()
+            for _ in range(args.reads):
+                BeautifulSoup(chrome.driver.page_source, "html.parser").find("table")
+            baseline = (time.perf_counter() - start) / args.reads
+
+            print(f"{args.reads} soup reads of a {args.rows}-row page")
+            print(f"  {'page_source + html.parser per read':<40} {baseline * 1000:10.2f} ms/read")
+            for name in installed_parsers():
+                chrome.SOUP_PARSER = name
+                start = time.perf_counter()
+                chrome.soup.find("table")
+                first = time.perf_counter() - start
+
+                start = time.perf_counter()
+                for _ in range(args.reads):
+                    chrome.soup.find("table")
+                cached = (time.perf_counter() - start) / args.reads
+                print(
+                    f"  {'cached soup, ' + name:<40} {cached * 1000:10.2f} ms/read"
+                    f"  (first parse {first * 1000:.2f} ms)"
+                )
+        finally:
+            chrome.driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Import time and time to the first ready browser, broken down by phase
+
+Each run is a fresh interpreter, so nothing is cached in `sys.modules`. Phases:
+`import ak_selenium`, `from ak_selenium import Chrome` (Selenium, requests,
+BeautifulSoup), useragent lookup, building `ChromeOptions`, starting ChromeDriver
+and Chrome, preparing the driver (CDP overrides, resource policy) and the first
+`get` of a local page. `--imports-only` skips the browser phases.
+
+    python benchmarks/bench_startup.py --runs 5
+    python benchmarks/bench_startup.py --runs 20 --imports-only
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = """
+import json, sys, time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+phases = {}
+
+def timed(name, function):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+    return wrapper
+
+start = time.perf_counter()
+import ak_selenium
+phases["import ak_selenium"] = time.perf_counter() - start
+
+start = time.perf_counter()
+from ak_selenium import Chrome
+phases["import Chrome"] = time.perf_counter() - start
+
+if not IMPORTS_ONLY:
+    Chrome.USERAGENT_RESOLVER.resolve = timed("useragent", Chrome.USERAGENT_RESOLVER.resolve)
+    Chrome.options = property(timed("options", Chrome.options.fget))
+    Chrome._driver = timed("driver start", Chrome._driver)
+    Chrome._prepare = timed("prepare", Chrome._prepare)
+
+    start = time.perf_counter()
+    chrome = Chrome(headless=True, half_screen=False)
+    phases["Chrome()"] = time.perf_counter() - start
+    phases["driver start"] -= phases["options"]
+    try:
+        with TemporaryDirectory() as tmp:
+            page = Path(tmp) / "page.html"
+            page.write_text("<html><body><h1>Ready</h1></body></html>")
+            start = time.perf_counter()
+            chrome.get(page.as_uri())
+            phases["first get"] = time.perf_counter() - start
+    finally:
+        chrome.driver.quit()
+
+print(json.dumps(phases))
+"""
+
+BROWSER_PHASES = ("useragent", "options", "driver start", "prepare", "first get")
+
+
+def run_once(imports_only: bool) -> dict[str, float]:
+    code = f"IMPORTS_ONLY = {imports_only}\n{CHILD}"
+    child = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, text=True)
+    if child.returncode != 0:
+        sys.exit(child.returncode)  # The child's traceback is already on stderr
+    return json.loads(child.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--imports-only", action="store_true")
+    args = parser.parse_args()
+
+    runs = [run_once(args.imports_only) for _ in range(args.runs)]
+    phases = ["import ak_selenium", "import Chrome"]
+    if not args.imports_only:
+        phases += [*BROWSER_PHASES, "Chrome()"]
+
+    print(f"{args.runs} fresh interpreters, median / min / max")
+    for phase in phases:
+        samples = [run[phase] * 1000 for run in runs]
+        print(
+            f"  {phase:<20} {statistics.median(samples):8.1f} / {min(samples):8.1f}"
+            f" / {max(samples):8.1f} ms"
+        )
+    if not args.imports_only:
+        totals = ("import ak_selenium", "import Chrome", "Chrome()", "first get")
+        ready = [sum(run[phase] for phase in totals) for run in runs]
+        print(f"  {'first page ready':<20} {statistics.median(ready) * 1000:8.1f} ms total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Per-command latency of the WebDriver HTTP transport vs the DevTools websocket
+
+Loads a generated page in headless Chrome and times `--calls` repetitions of each
+hot-path command (a trivial script, `extract`, cookie reads and a versioned soup
+check) with `Browser.TRANSPORT = "webdriver"` and `"cdp"`.
+
+    python benchmarks/bench_transport.py --calls 200 --rows 200
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ak_selenium import Chrome
+
+COMMANDS = {
+    "evaluate('return 1')": lambda chrome: chrome.evaluate("return 1"),
+    "extract({'title': 'h1'})": lambda chrome: chrome.extract({"title": "h1"}),
+    "cookie read": lambda chrome: chrome._get_cookies(),
+    "soup (unchanged page)": lambda chrome: chrome.soup,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = "".join(f"<tr><td>{i}</td></tr>" for i in range(args.rows))
+    with TemporaryDirectory() as tmp:
+        page = Path(tmp) / "page.html"
+        page.write_text(f"<html><body><h1>Title</h1><table>{rows}</table></body></html>")
+
+        chrome = Chrome(headless=True, half_screen=False)
+        try:
+            chrome.get(page.as_uri())
+
+            print(f"{args.calls} calls per command, median / p95 latency")
+            for name, command in COMMANDS.items():
+                timings: dict[str, list[float]] = {}
+                for transport in ("webdriver", "cdp"):
+                    chrome.TRANSPORT = transport
+                    command(chrome)  # Warm up: connect, prime the soup cache
+                    samples = []
+                    for _ in range(args.calls):
+                        start = time.perf_counter()
+                        command(chrome)
+                        samples.append(time.perf_counter() - start)
+                    timings[transport] = samples
+
+                line = f"  {name:<28}"
+                for transport, samples in timings.items():
+                    median = statistics.median(samples) * 1000
+                    p95 = statistics.quantiles(samples, n=20)[-1] * 1000
+                    line += f" {transport:>9}: {median:7.3f} / {p95:7.3f} ms"
+                speedup = statistics.median(timings["webdriver"]) / statistics.median(timings["cdp"])
+                print(f"{line}   x{speedup:.1f}")
+        finally:
+            chrome.driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Startup cost of resolving the browser useragent
+
+Compares the old per-construction `latest_useragent` call with `UserAgentResolver`
+in its cold, warm (memo), disk-cached and background modes. The network lookup is
+replaced by a stub that sleeps for `--latency` seconds, so no browser or network
+access is needed.
+
+    python benchmarks/bench_useragent.py --latency 0.8 --starts 5
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from ak_selenium.useragent import UserAgentResolver
+
+
+def stub_fetch(latency: float):
+    def _fetch(browser: str) -> str:
+        time.sleep(latency)
+        return f"Mozilla/5.0 (Benchmark) {browser}/999.0"
+
+    return _fetch
+
+
+def timed(fn, starts: int) -> float:
+    start = time.perf_counter()
+    for _ in range(starts):
+        fn()
+    return (time.perf_counter() - start) / starts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.8, help="stubbed lookup latency (s)")
+    parser.add_argument("--starts", type=int, default=5, help="browser starts to simulate")
+    args = parser.parse_args()
+
+    fetch = stub_fetch(args.latency)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Path(tmp) / "useragent.json"
+
+        results = {
+            "uncached (latest_useragent per start)": timed(lambda: fetch("Chrome"), args.starts)
+        }
+
+        sync = UserAgentResolver(cache_path=cache, fetch=fetch, background=False)
+        results["resolver, cold (first start only)"] = timed(lambda: sync.resolve("Chrome"), 1)
+        results["resolver, warm memo"] = timed(lambda: sync.resolve("Chrome"), args.starts)
+        results["resolver, disk cache (new process)"] = timed(
+            lambda: UserAgentResolver(cache_path=cache, fetch=fetch).resolve("Chrome"),
+            args.starts,
+        )
+
+        cache.unlink()
+        background = UserAgentResolver(cache_path=cache, fetch=fetch, background=True)
+        results["resolver, empty cache + background"] = timed(
+            lambda: background.resolve("Chrome", fallback="fallback"), args.starts
+        )
+        background.wait()
+
+    print(f"useragent resolution per browser start (stub latency {args.latency:.2f}s)")
+    for name, seconds in results.items():
+        print(f"  {name:<40} {seconds * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
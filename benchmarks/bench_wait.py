@@ -0,0 +1,61 @@
+"""Wait latency of polling vs MutationObserver waits
+
+Opens a local page in headless Chrome, schedules an element to appear after `--delay`
+seconds and measures how long `wait_for_locator` takes beyond that delay, for both
+`mode="poll"` (WebDriverWait, 0.5s interval) and `mode="observer"`.
+
+    python benchmarks/bench_wait.py --trials 20 --delay 0.3
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ak_selenium import Chrome
+
+PAGE = "<html><body><div id='root'>waiting</div></body></html>"
+SCHEDULE = """
+setTimeout(function () {
+    var el = document.createElement('button');
+    el.id = 'ready';
+    el.textContent = 'Ready';
+    document.getElementById('root').appendChild(el);
+}, arguments[0]);
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.3, help="seconds until the element appears")
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        page = Path(tmp) / "wait.html"
+        page.write_text(PAGE)
+
+        chrome = Chrome(headless=True, half_screen=False)
+        try:
+            print(f"extra latency after the element appears ({args.trials} trials)")
+            for mode in ("poll", "observer"):
+                samples = []
+                for _ in range(args.trials):
+                    chrome.get(page.as_uri())
+                    start = time.perf_counter()
+                    chrome.driver.execute_script(SCHEDULE, int(args.delay * 1000))
+                    chrome.wait_for_locator(("id", "ready"), mode=mode)
+                    samples.append(time.perf_counter() - start - args.delay)
+                samples.sort()
+                print(
+                    f"  {mode:<9} mean {statistics.mean(samples) * 1000:8.1f} ms"
+                    f"  p50 {samples[len(samples) // 2] * 1000:8.1f} ms"
+                    f"  p95 {samples[int(len(samples) * 0.95) - 1] * 1000:8.1f} ms"
+                )
+        finally:
+            chrome.driver.quit()
+
+
+if __name__ == "__main__":
+    main()
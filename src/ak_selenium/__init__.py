@@ -85,10 +85,53 @@ graph TB
 
 """
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
+import importlib
+from typing import TYPE_CHECKING
 
-from ak_selenium.browser import RequestsSession
-from ak_selenium.chrome import Chrome
-from ak_selenium.firefox import Firefox
-from ak_selenium.helium_attribs import Action, Element
+# Public names are imported on first access, so `import ak_selenium` stays cheap and only the
+# parts in use pay for Selenium, Helium, requests and BeautifulSoup. `name -> module`
+_LAZY: dict[str, str] = {
+    "By": "selenium.webdriver.common.by",
+    "Keys": "selenium.webdriver.common.keys",
+    "AsyncBrowser": "ak_selenium.aio",
+    "RequestsSession": "ak_requests",
+    "ResponseCache": "ak_selenium.cache",
+    "Chrome": "ak_selenium.chrome",
+    "Firefox": "ak_selenium.firefox",
+    "Action": "ak_selenium.helium_attribs",
+    "Element": "ak_selenium.helium_attribs",
+    "HybridFetcher": "ak_selenium.hybrid",
+    "ResourcePolicy": "ak_selenium.network",
+    "BrowserPool": "ak_selenium.pool",
+    "ProfileTemplate": "ak_selenium.profiles",
+}
+
+__all__ = list(_LAZY)
+
+if TYPE_CHECKING:
+    from ak_requests import RequestsSession
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+
+    from ak_selenium.aio import AsyncBrowser
+    from ak_selenium.cache import ResponseCache
+    from ak_selenium.chrome import Chrome
+    from ak_selenium.firefox import Firefox
+    from ak_selenium.helium_attribs import Action, Element
+    from ak_selenium.hybrid import HybridFetcher
+    from ak_selenium.network import ResourcePolicy
+    from ak_selenium.pool import BrowserPool
+    from ak_selenium.profiles import ProfileTemplate
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Later lookups skip `__getattr__`
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
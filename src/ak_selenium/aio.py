@@ -0,0 +1,269 @@
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
+
+from ak_requests import RequestsSession
+from bs4 import BeautifulSoup
+from selenium.webdriver.remote.webelement import WebElement
+
+from ak_selenium.browser import Browser, Locator, NavigationResult
+
+T = TypeVar("T")
+
+
+class AsyncBrowser:
+    """asyncio facade over a `Browser`, so one event loop can drive many browsers at once
+
+    Every browser gets a dedicated single-thread executor: WebDriver commands of one browser\
+        run one at a time and in call order, while commands of different browsers run in\
+        parallel without blocking the event loop.
+
+    Timeouts and cancellation: each call accepts a `timeout` in seconds. `get` and the waits\
+        pass it on to the browser, so the driver itself gives up in time, and then await the\
+        result for at most that long plus `CANCEL_GRACE` seconds. When an awaiting task is cancelled\
+        or times out, calls that have not started yet are dropped; a WebDriver command already\
+        in flight cannot be interrupted and finishes in the background before the next call runs.
+
+    Example:
+        ```python
+        import asyncio
+        from ak_selenium import AsyncBrowser, Chrome
+
+        async def title(url: str) -> str:
+            async with await AsyncBrowser.create(Chrome, headless=True) as browser:
+                await browser.get(url, wait_until="h1", timeout=10)
+                return (await browser.soup()).title.text
+
+        print(asyncio.run(asyncio.gather(title("example.com"), title("example.org"))))
+        ```
+    """
+
+    CANCEL_GRACE: float = 5.0
+    """Extra seconds granted to a driver-side timeout before the awaiting task gives up"""
+
+    def __init__(self, browser: Browser, timeout: float | None = None) -> None:
+        """Wrap a running browser
+
+        Args:
+            browser (Browser): Browser to drive. Don't use it directly while the facade is in use.
+            timeout (float | None, optional): Default seconds to await a call. Defaults to None (no limit).
+        """
+        self.browser = browser
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"ak_selenium-{type(browser).__name__}"
+        )
+        self._page_load_timeout: float | None = None
+        return None
+
+    def __str__(self) -> str:
+        return f"""
+        AsyncBrowser.Object
+        Browser: {type(self.browser).__name__}
+        Timeout: {self.timeout}
+        """
+
+    def __repr__(self) -> str:
+        return f"AsyncBrowser({self.browser!r},\
+                timeout={self.timeout})"
+
+    @classmethod
+    async def create(
+        cls, browser_class: type[Browser], timeout: float | None = None, **browser_kwargs
+    ) -> "AsyncBrowser":
+        """Start a browser without blocking the event loop
+
+        Args:
+            browser_class (type[Browser]): `Browser` subclass to start, e.g. `Chrome` or `Firefox`.
+            timeout (float | None, optional): Default seconds to await a call. Defaults to None (no limit).
+            **browser_kwargs: Keyword arguments passed to `browser_class`.
+
+        Returns:
+            AsyncBrowser: The wrapped browser
+        """
+        loop = asyncio.get_running_loop()
+        browser = await loop.run_in_executor(None, functools.partial(browser_class, **browser_kwargs))
+        return cls(browser, timeout=timeout)
+
+    async def __aenter__(self) -> "AsyncBrowser":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Quit the browser once pending calls are done and shut down the executor"""
+        try:
+            await self._call(lambda: self.browser.driver.quit(), _timeout=None)
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        return None
+
+    async def run(
+        self, func: Callable[[Browser], T], *args, timeout: float | None = None, **kwargs
+    ) -> T:
+        """Run any blocking function on the browser's executor
+
+        Example:
+            ```python
+            data = await browser.run(lambda b: b.extract({"title": "h1"}))
+            ```
+
+        Args:
+            func (Callable[[Browser], T]): Called as `func(browser, *args, **kwargs)`.
+            timeout (float | None, optional): Seconds to await the result. Defaults to `AsyncBrowser.timeout`.
+
+        Raises:
+            TimeoutError: The call did not finish within `timeout`.
+
+        Returns:
+            T: Return value of `func`
+        """
+        return await self._call(
+            func, self.browser, *args, _timeout=self._await_timeout(timeout), **kwargs
+        )
+
+    async def get(
+        self,
+        url: str,
+        wait_until: Literal["domcontentloaded", "load", "networkidle"] | Locator | None = None,
+        timeout: float | None = None,
+        idle_time: float = 0.5,
+        max_inflight: int = 0,
+    ) -> NavigationResult:
+        """Navigate to a webpage, see `Browser.get`
+
+        `timeout` also bounds the page load itself (`driver.set_page_load_timeout`).
+
+        Args:
+            url (str): Url to navigate to
+            wait_until (Literal["domcontentloaded", "load", "networkidle"] | Locator | None, optional):\
+                Completion condition. Defaults to None.
+            timeout (float | None, optional): Seconds for the page load and for `wait_until`. Defaults to `Browser.MAX_WAIT_TIME`.
+            idle_time (float, optional): Quiet window for `"networkidle"`, in seconds. Defaults to 0.5.
+            max_inflight (int, optional): Requests allowed to stay open for `"networkidle"`. Defaults to 0.
+
+        Returns:
+            NavigationResult: Status and timing breakdown
+        """
+        timeout = self.browser.MAX_WAIT_TIME if timeout is None else timeout
+
+        def _get() -> NavigationResult:
+            if self._page_load_timeout != timeout:
+                self.browser.driver.set_page_load_timeout(timeout)
+                self._page_load_timeout = timeout
+            return self.browser.get(
+                url,
+                wait_until=wait_until,
+                timeout=timeout,
+                idle_time=idle_time,
+                max_inflight=max_inflight,
+            )
+
+        return await self._call(_get, _timeout=2 * timeout + self.CANCEL_GRACE)
+
+    async def wait_for_locator(
+        self,
+        locator: Locator,
+        timeout: float | None = None,
+        present: bool = True,
+        mode: Literal["poll", "observer"] | None = None,
+    ) -> WebElement | None:
+        """Wait for an element to be present or absent, see `Browser.wait_for_locator`
+
+        Args:
+            locator (Locator): A `(By, value)` tuple or a CSS selector string.
+            timeout (float | None, optional): Seconds to wait. Defaults to `Browser.MAX_WAIT_TIME`.
+            present (bool, optional): Wait for presence (True) or absence (False). Defaults to True.
+            mode (Literal["poll", "observer"] | None, optional): Wait strategy. Defaults to `Browser.WAIT_MODE`.
+
+        Returns:
+            WebElement | None: The element when waiting for presence, None when waiting for absence
+        """
+        timeout = self.browser.MAX_WAIT_TIME if timeout is None else timeout
+        _, element = await self._call(
+            self.browser.wait_for_any,
+            locator,
+            timeout=timeout,
+            present=present,
+            mode=mode,
+            _timeout=timeout + self.CANCEL_GRACE,
+        )
+        return element
+
+    async def wait_for_any(
+        self,
+        *locators: Locator,
+        timeout: float | None = None,
+        present: bool = True,
+        mode: Literal["poll", "observer"] | None = None,
+    ) -> tuple[int, WebElement | None]:
+        """Wait until any of several locators matches, see `Browser.wait_for_any`
+
+        Args:
+            *locators (Locator): `(By, value)` tuples or CSS selector strings.
+            timeout (float | None, optional): Seconds to wait. Defaults to `Browser.MAX_WAIT_TIME`.
+            present (bool, optional): Wait for presence (True) or absence (False). Defaults to True.
+            mode (Literal["poll", "observer"] | None, optional): Wait strategy. Defaults to `Browser.WAIT_MODE`.
+
+        Returns:
+            tuple[int, WebElement | None]: Index of the first satisfied locator and its element
+        """
+        timeout = self.browser.MAX_WAIT_TIME if timeout is None else timeout
+        return await self._call(
+            self.browser.wait_for_any,
+            *locators,
+            timeout=timeout,
+            present=present,
+            mode=mode,
+            _timeout=timeout + self.CANCEL_GRACE,
+        )
+
+    async def soup(self, timeout: float | None = None) -> BeautifulSoup:
+        """Parsed page source, shared and read-only, see `Browser.soup`"""
+        return await self._call(lambda: self.browser.soup, _timeout=self._await_timeout(timeout))
+
+    async def session(self, timeout: float | None = None) -> RequestsSession:
+        """`RequestsSession` in sync with the browser, see `Browser.session`"""
+        return await self._call(
+            lambda: self.browser.session, _timeout=self._await_timeout(timeout)
+        )
+
+    async def scroll(
+        self,
+        direction: Literal["top", "bottom"] = "bottom",
+        alternative_method: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        """Scroll the webpage, see `Browser.scroll`"""
+        return await self._call(
+            self.browser.scroll,
+            direction,
+            alternative_method,
+            _timeout=self._await_timeout(timeout),
+        )
+
+    async def execute_script(self, script: str, *args, timeout: float | None = None) -> Any:
+        """Run synchronous JavaScript in the page and return its result"""
+        return await self._call(
+            lambda: self.browser.driver.execute_script(script, *args),
+            _timeout=self._await_timeout(timeout),
+        )
+
+    async def execute_async_script(self, script: str, *args, timeout: float | None = None) -> Any:
+        """Run asynchronous JavaScript in the page, resolving with the value passed to its callback"""
+        return await self._call(
+            lambda: self.browser.driver.execute_async_script(script, *args),
+            _timeout=self._await_timeout(timeout),
+        )
+
+    async def _call(self, func: Callable[..., T], *args, _timeout: float | None, **kwargs) -> T:
+        """Run `func(*args, **kwargs)` on the executor and await it for at most `_timeout` seconds"""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        return await asyncio.wait_for(future, _timeout)
+
+    def _await_timeout(self, timeout: float | None) -> float | None:
+        return self.timeout if timeout is None else timeout
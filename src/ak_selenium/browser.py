@@ -1,20 +1,171 @@
 import logging
 import os
-from functools import cached_property
-from typing import Literal
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cache, cached_property
+from http.cookiejar import Cookie
+from typing import TYPE_CHECKING, Literal
+from urllib.parse import urlsplit
 
 from ak_requests import RequestsSession
 from bs4 import BeautifulSoup
+from requests.cookies import create_cookie
 from selenium.common import exceptions
 from selenium.webdriver.common.by import By
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
+from ak_selenium import js
+from ak_selenium.cdp import CDPConnection, CDPError
+from ak_selenium.instrument import CommandInstrumentation, CommandStats
+from ak_selenium.network import NetworkIdleTracker, RequestBlocker, ResourcePolicy
+from ak_selenium.useragent import UserAgentResolver
+from ak_selenium.watchdog import Watchdog
+
+if TYPE_CHECKING:
+    import helium
+
+    from ak_selenium.cache import CacheInterceptor
+    from ak_selenium.helium_attribs import HeliumActions, HeliumBinding, HeliumElements
+    from ak_selenium.selector import CompiledSelector
+
 # Disable webdriver-manager logs per https://github.com/SergeyPirogov/webdriver_manager#wdm_log
 os.environ["WDM_LOG"] = str(logging.NOTSET)
 
+Locator = str | tuple[str, str]
+"""A CSS selector, or a Selenium `(By, value)` locator tuple"""
+
+
+def _origin(url: str) -> str | None:
+    """`scheme://host[:port]` of an http(s) URL, None for other URLs"""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _cookie_on_page(url: str, domain: str, path: str) -> bool:
+    """Whether a cookie scoped to `domain` and `path` is sent with requests to `url`
+
+    A cookie without a domain is scoped to the current page and always matches.
+    """
+    parts = urlsplit(url)
+    host, page_path = parts.hostname or "", parts.path or "/"
+    domain = domain.lstrip(".").lower()
+    if domain and host != domain and not host.endswith("." + domain):
+        return False
+    path = path or "/"
+    return page_path == path or page_path.startswith(path if path.endswith("/") else path + "/")
+
+
+def _as_locator(locator: Locator) -> list[str]:
+    if isinstance(locator, str):
+        return [By.CSS_SELECTOR, locator]
+    by, value = locator
+    return [by, value]
+
+
+_FIELD_PATTERN = re.compile(r"^(?P<css>.*?)\s*(?:@(?P<attr>[\w:.-]+))?$", re.DOTALL)
+
+
+def _compile_extract_node(node: str | dict, path: str) -> dict:
+    """Validate one `Browser.extract` spec node and convert it to the form `js.EXTRACT` evaluates"""
+    if isinstance(node, str):
+        match = _FIELD_PATTERN.match(node)
+        assert match is not None
+        return {"kind": "value", "css": match["css"] or None, "attr": match["attr"]}
+
+    if not isinstance(node, dict):
+        raise TypeError(f"Extract spec `{path}` must be a str or dict, got {type(node).__name__}")
+    unknown = set(node) - {"css", "fields", "attr", "first"}
+    if unknown:
+        raise ValueError(f"Extract spec `{path}` has unknown keys: {sorted(unknown)}")
+    if "fields" in node and "attr" in node:
+        raise ValueError(f"Extract spec `{path}` takes either `fields` or `attr`, not both")
+
+    fields = node.get("fields")
+    if fields is not None:
+        if not isinstance(fields, dict):
+            raise TypeError(f"Extract spec `{path}.fields` must be a dict")
+        fields = {
+            key: _compile_extract_node(value, f"{path}.{key}") for key, value in fields.items()
+        }
+    return {
+        "kind": "list",
+        "css": node.get("css") or None,
+        "fields": fields,
+        "attr": node.get("attr"),
+        "first": bool(node.get("first", False)),
+    }
+
+
+@cache
+def default_soup_parser() -> str:
+    """Fastest installed BeautifulSoup parser
+
+    Returns:
+        str: `"lxml"` if lxml is installed, else `"html.parser"`
+    """
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+@dataclass
+class SessionSyncStats:
+    """Cost of keeping `Browser.session` in sync with the browser"""
+
+    accesses: int = 0
+    """Number of `Browser.session` reads"""
+    round_trips: int = 0
+    """WebDriver commands issued to sync the session"""
+    cookie_syncs: int = 0
+    """Reads where the browser cookies changed and were copied to the session"""
+    cookie_skips: int = 0
+    """Reads where the browser cookies were unchanged and the copy was skipped"""
+
+
+@dataclass
+class NavigationResult:
+    """Outcome and timing breakdown of `Browser.get`"""
+
+    url: str
+    """Requested url"""
+    status: Literal["ok", "timeout", "error"] = "ok"
+    """`"timeout"` if navigation or the completion condition timed out, `"error"` on other WebDriver errors"""
+    error: str | None = None
+    """Error message when `status` is not `"ok"`"""
+    http_status: int | None = None
+    """HTTP status of the document, when network events are captured"""
+    navigate_time: float = 0.0
+    """Seconds spent in `driver.get`, which depends on the page load strategy"""
+    wait_time: float = 0.0
+    """Seconds spent waiting for `wait_until` after `driver.get` returned"""
+    total_time: float = 0.0
+    """Seconds from start to finish"""
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    def raise_for_status(self) -> None:
+        """Raise `TimeoutException` or `WebDriverException` if the navigation did not succeed"""
+        match self.status:
+            case "timeout":
+                raise exceptions.TimeoutException(self.error)
+            case "error":
+                raise exceptions.WebDriverException(self.error)
+        return None
+
 
 class Browser:
     """General browser class, not to be used directly but to act as a parent class to other specific `Browser` child classess"""
@@ -22,26 +173,149 @@ class Browser:
     MAX_WAIT_TIME: float = 10
     IMPLICITLY_WAIT_TIME: float = 3
     EXCEPTIONS = exceptions
+    WAIT_MODE: Literal["poll", "observer"] = "poll"
+    """Default strategy of `Browser.wait_for_locator`/`Browser.wait_for_any`: WebDriverWait polling every 0.5s, or a MutationObserver that returns as soon as the DOM changes"""
+    NETWORK_EVENTS: bool = False
+    """Capture CDP `Network.*` events through Chrome's performance log (needed for `get(wait_until="networkidle")`); takes effect at browser start"""
+    TRANSPORT: Literal["webdriver", "cdp"] = "webdriver"
+    """How hot-path calls (script evaluation in `session`/`soup`/`html_of`/`extract`/`evaluate`, cookie reads and writes) reach the browser: ChromeDriver's HTTP endpoint, or a direct DevTools websocket (`Browser.cdp`, Chromium only)"""
+    SOUP_PARSER: str | None = None
+    """BeautifulSoup parser (`"lxml"`, `"html5lib"`, `"html.parser"`). Defaults to `default_soup_parser()`."""
+    USERAGENT_RESOLVER: UserAgentResolver = UserAgentResolver()
+    """Shared, cached source of the latest useragent. Override with a custom `UserAgentResolver` to change the cache location, TTL or refresh mode."""
+
+    _resource_policy: ResourcePolicy | None = None
+    """Requests blocked in every window of this browser, see `Chrome.resource_policy`"""
+
+    _window_handle: str | None = None
+    """Window this browser drives when its driver is shared (see `Chrome.new_context`); None drives the current window"""
 
     def __init__(self, driver) -> None:
 
         self.driver = driver
-        """Selenium webdriver"""
 
-    def wait_for_locator(self, locator: tuple[str, str]) -> None:
+        self.started_at: float = time.monotonic()
+        """`time.monotonic()` timestamp of when the browser was started"""
+
+        self.page_count: int = 0
+        """Number of pages loaded through `Browser.get`"""
+
+        self.restarts: int = 0
+        """Number of `Browser.restart` calls"""
+
+        self.watchdog: Watchdog | None = None
+        """Resource watchdog checked before each `Browser.get`, see `Browser.watch`"""
+
+        self.session_stats = SessionSyncStats()
+        """Round trips spent syncing `Browser.session`"""
+
+        self._session_headers: dict | None = None
+        self._cookie_fingerprint: int | None = None
+        self._synced_cookies: set[tuple] = set()
+        self._soup_cache: tuple[str, str, BeautifulSoup] | None = None
+        self._script_timeout: float = 30  # W3C default script timeout
+
+        self._reserved_handles: set[str] = set()
+        self._cdp: CDPConnection | None = None
+        self._cdp_unavailable: bool = False
+        self._interceptors: list["CacheInterceptor"] = []
+        self._visited_origins: set[str] = set()
+        self._blockers: dict[str, RequestBlocker] = {}
+        self._blocked_lock = threading.Lock()
+
+        self.blocked_requests: Counter[str] = Counter()
+        """Requests blocked by `resource_policy` per CDP resource type (`Image`, `Font`, ...), Chromium only"""
+
+    def wait_for_locator(
+        self,
+        locator: Locator,
+        timeout: float | None = None,
+        present: bool = True,
+        mode: Literal["poll", "observer"] | None = None,
+    ) -> None:
         """
         Wait until the element with the specified locator is present.
 
         Args:
-            locator (tuple): The locator tuple (By, value) of the element to wait for.
+            locator (Locator): The locator tuple (By, value), or CSS selector, of the element to wait for.
+            timeout (float | None, optional): Seconds to wait. Defaults to `MAX_WAIT_TIME`.
+            present (bool, optional): Wait for the element to disappear instead when False. Defaults to True.
+            mode (Literal["poll", "observer"] | None, optional): Wait strategy. Defaults to `WAIT_MODE`.
+
+        Raises:
+            TimeoutException: The condition was not met within `timeout`.
         """
-        (
-            WebDriverWait(self.driver, self.MAX_WAIT_TIME, 0.5).until(
-                EC.presence_of_element_located(locator)
-            )
-        )
+        self.wait_for_any(locator, timeout=timeout, present=present, mode=mode)
         return None
 
+    def wait_for_any(
+        self,
+        *locators: Locator,
+        timeout: float | None = None,
+        present: bool = True,
+        mode: Literal["poll", "observer"] | None = None,
+    ) -> tuple[int, WebElement | None]:
+        """Wait until any of the locators is present (or absent) and report which one won
+
+        In `"poll"` mode all locators are checked in one script every 0.5s, unaffected by the
+        implicit wait. In `"observer"` mode a single async script installs a MutationObserver
+        and returns the moment the DOM satisfies a locator instead. If the page
+        navigates away during the wait, the remaining time falls back to polling.
+
+        Example:
+            ```python
+            index, element = chrome.wait_for_any("#dashboard", ".login-error", mode="observer")
+            ```
+
+        Args:
+            *locators (Locator): Locator tuples (By, value) or CSS selectors.
+            timeout (float | None, optional): Seconds to wait. Defaults to `MAX_WAIT_TIME`.
+            present (bool, optional): Wait for a locator to match nothing instead when False. Defaults to True.
+            mode (Literal["poll", "observer"] | None, optional): Wait strategy. Defaults to `WAIT_MODE`.
+
+        Raises:
+            TimeoutException: No locator satisfied the condition within `timeout`.
+
+        Returns:
+            tuple[int, WebElement | None]: Index of the winning locator and its element (None when waiting for absence)
+        """
+        if not locators:
+            raise ValueError("At least one locator is required")
+        timeout = self.MAX_WAIT_TIME if timeout is None else timeout
+        mode = mode or self.WAIT_MODE
+        _locators = [_as_locator(locator) for locator in locators]
+
+        if mode == "observer":
+            deadline = time.monotonic() + timeout
+            if self._script_timeout < timeout + 1:
+                self.driver.set_script_timeout(timeout + 1)
+                self._script_timeout = timeout + 1
+            try:
+                result: dict = self.driver.execute_async_script(
+                    js.WAIT_FOR_ANY, _locators, present, int(timeout * 1000)
+                )
+            except exceptions.JavascriptException:
+                # The document unloaded during the wait; finish the wait by polling
+                timeout = max(deadline - time.monotonic(), 0)
+            else:
+                if result["index"] < 0:
+                    raise exceptions.TimeoutException(
+                        f"No locator of {locators!r} satisfied the wait within {timeout}s"
+                    )
+                return result["index"], result["element"]
+        elif mode != "poll":
+            raise ValueError(f"Unsupported wait mode: {mode!r}")
+
+        def _condition(driver) -> tuple[int, WebElement | None] | bool:
+            # One script per poll: `find_elements` would sit out the implicit wait for every missing locator
+            try:
+                result: dict | None = driver.execute_script(js.CHECK_ANY, _locators, present)
+            except exceptions.JavascriptException:
+                return False  # The document is being replaced; check again on the next poll
+            return False if result is None else (result["index"], result["element"])
+
+        return WebDriverWait(self.driver, timeout, 0.5).until(_condition)
+
     @staticmethod
     def fill_userinput_form(
         element: WebElement, text: str, clear_existing: bool = True
@@ -61,6 +335,61 @@ class Browser:
 
         return None
 
+    @cached_property
+    def Element(self) -> "HeliumElements":
+        """Helium element selectors bound to this browser, e.g. `chrome.Element.Button("OK").exists()`
+
+        Unlike the module-level `ak_selenium.Element`, which uses Helium's single global driver,\
+            these are safe to use with several browsers in one process, one thread per browser.\
+            Pass elements of the same browser as `below=`/`to_right_of=`/... arguments.
+        """
+        from ak_selenium.helium_attribs import HeliumElements
+
+        return HeliumElements(self._helium)
+
+    @cached_property
+    def Action(self) -> "HeliumActions":
+        """Helium actions bound to this browser, e.g. `chrome.Action.click(chrome.Element.Button("OK"))`
+
+        Strings passed as elements, as in `chrome.Action.click("Sign in")`, are looked up in this browser.
+        """
+        from ak_selenium.helium_attribs import HeliumActions
+
+        return HeliumActions(self._helium)
+
+    def compile(self, element: "helium.HTMLElement | str") -> "CompiledSelector":
+        """Compile a Helium element into a single-round-trip selector cached per DOM version
+
+        Use it for lookups repeated in retry or polling loops, where Helium re-scans the page\
+            from Python on every `.exists()`.
+
+        Example:
+            ```python
+            log_in = chrome.compile(chrome.Element.Button("Log In", below=chrome.Element.TextField("Password")))
+            while not log_in.exists():
+                ...
+            log_in.click()
+            ```
+
+        Args:
+            element (helium.HTMLElement | str): `Button`, `Link`, `ListItem`, `Image` or `Text`\
+                of this browser (see `Browser.Element`), or a string for `Text(string)`.
+
+        Returns:
+            CompiledSelector: The compiled selector
+        """
+        from ak_selenium.selector import CompiledSelector
+
+        if isinstance(element, str):
+            element = self.Element.Text(element)
+        return CompiledSelector(self, element)
+
+    @cached_property
+    def _helium(self) -> "HeliumBinding":
+        from ak_selenium.helium_attribs import HeliumBinding
+
+        return HeliumBinding(self)
+
     @cached_property
     def __base_session(self) -> RequestsSession:
         _s = RequestsSession(log=False, retries=5)
@@ -70,34 +399,189 @@ class Browser:
     def session(self) -> RequestsSession:
         """Generate and return `ak_requests.RequestsSession` from current browser instance
 
+        Headers are read once per driver with a single script. Cookies are fetched on
+        every access but only copied into the session when they changed since the last
+        access. See `Browser.session_stats` for the number of round trips spent.
+
         Returns:
             RequestsSession: ak_requests.RequestsSession
         """
-        driver = self.driver
+        stats = self.session_stats
         s = self.__base_session
-        s.update_cookies(driver.get_cookies())
-        s.update_header(
-            {
-                "Accept-Language": driver.execute_script(
-                    "return window.navigator.language;"
-                ),
-                "X-Forwarded-For": driver.execute_script("return window.navigator.ip;"),
-                "X-Timezone": driver.execute_script(
-                    "return window.navigator.timezone;"
-                ),
-                "User-Agent": driver.execute_script(
-                    "return window.navigator.userAgent;"
-                ),
+        stats.accesses += 1
+
+        if self._session_headers is None:
+            state: dict = self._script(js.SESSION_STATE)
+            stats.round_trips += 1
+            self._session_headers = {
+                "Accept-Language": state.get("language"),
+                "X-Forwarded-For": state.get("ip"),
+                "X-Timezone": state.get("timezone"),
+                "User-Agent": state.get("userAgent"),
             }
-        )
+            s.update_header(self._session_headers)
+
+        cookies: list[dict] = self._get_cookies()
+        stats.round_trips += 1
+        fingerprint = self._fingerprint_cookies(cookies)
+        if fingerprint != self._cookie_fingerprint:
+            self._pull_cookies(s, cookies)
+            self._cookie_fingerprint = fingerprint
+            stats.cookie_syncs += 1
+        else:
+            stats.cookie_skips += 1
         return s
 
+    def push_cookies(self, session: RequestsSession | None = None) -> int:
+        """Copy cookies added, changed or deleted on the requests side back into the browser
+
+        Only cookies that changed in the jar since the last sync are sent. On Chrome they
+        are sent in a single `Network.setCookies` CDP call, for any domain. Other browsers
+        fall back to `add_cookie` and `delete_cookie`, which only reach the current page's
+        cookies; cookies for other domains or paths are skipped. Cookies without a domain are
+        scoped to the current page and stay pending while it is not an http(s) page.
+
+        Args:
+            session (RequestsSession | None, optional): Session to read cookies from. Defaults to `Browser.session`'s session.
+
+        Returns:
+            int: Number of cookies pushed to the browser
+        """
+        driver = self.driver
+        s = session if session is not None else self.__base_session
+        changed = [c for c in s.cookies if self._cookie_key(c) not in self._synced_cookies]
+        jar_ids = {(c.domain, c.path, c.name) for c in s.cookies}
+        removed = {key[:3] for key in self._synced_cookies if key[:3] not in jar_ids}
+        if not changed and not removed:
+            return 0
+
+        current_url: str | None = None
+        if any(not c.domain for c in changed) or any(not domain for domain, _, _ in removed):
+            current_url = driver.current_url
+        page_url = current_url if current_url and _origin(current_url) else None
+
+        pushed, pending = 0, set()
+        if self.supports_cdp:
+            for domain, path, name in removed:
+                if domain or page_url:
+                    scope = {"domain": domain} if domain else {"url": page_url}
+                    self._cdp_cmd("Network.deleteCookies", {"name": name, "path": path, **scope})
+            params = []
+            for cookie in changed:
+                if not cookie.domain and page_url is None:
+                    pending.add(self._cookie_key(cookie))  # No page to scope it to yet
+                    continue
+                params.append(self._cdp_cookie(cookie, page_url))
+            if params:
+                self._cdp_cmd("Network.setCookies", {"cookies": params})
+            pushed = len(params)
+        else:
+            if removed and current_url is None:
+                current_url = driver.current_url
+            for domain, path, name in removed:
+                # `delete_cookie` acts on the current page's cookie of that name, so only
+                # delete when the removed cookie is the one the page sees
+                if current_url and _cookie_on_page(current_url, domain, path):
+                    driver.delete_cookie(name)
+            for cookie in changed:
+                try:
+                    driver.add_cookie(self._webdriver_cookie(cookie))
+                    pushed += 1
+                except exceptions.WebDriverException:
+                    pass  # Cookie is not for the current page's domain
+
+        self._synced_cookies = {self._cookie_key(c) for c in s.cookies} - pending
+        self._cookie_fingerprint = None
+        return pushed
+
+    def sync_cookies(self) -> RequestsSession:
+        """Sync cookies in both directions: push requests-side changes into the browser, then pull the browser cookies into the session
+
+        Returns:
+            RequestsSession: ak_requests.RequestsSession
+        """
+        self.push_cookies()
+        return self.session
+
+    def _pull_cookies(self, s: RequestsSession, cookies: list[dict]) -> None:
+        for c in cookies:
+            s.cookies.set_cookie(
+                create_cookie(
+                    c["name"],
+                    c["value"],
+                    domain=c.get("domain", ""),
+                    path=c.get("path", "/"),
+                    secure=c.get("secure", False),
+                    expires=c.get("expiry"),
+                    rest={"HttpOnly": None} if c.get("httpOnly") else {},
+                )
+            )
+        jar = {self._cookie_key(c) for c in s.cookies}
+        self._synced_cookies = (self._synced_cookies & jar) | {
+            (c.get("domain", ""), c.get("path", "/"), c["name"], c["value"])
+            for c in cookies
+        }
+        return None
+
+    @staticmethod
+    def _cookie_key(cookie: Cookie) -> tuple:
+        return (cookie.domain, cookie.path, cookie.name, cookie.value)
+
+    @staticmethod
+    def _cdp_cookie(cookie: Cookie, current_url: str | None) -> dict:
+        """Convert a jar cookie to a CDP `Network.CookieParam`.
+
+        Leading-dot domains become domain cookies. Cookies with a bare host become host-only
+        cookies for that host, and cookies without a domain are scoped to the current page.
+        """
+        param: dict = {
+            "name": cookie.name,
+            "value": cookie.value or "",
+            "path": cookie.path or "/",
+            "secure": bool(cookie.secure),
+        }
+        if cookie.domain.startswith("."):
+            param["domain"] = cookie.domain
+        elif cookie.domain:
+            scheme = "https" if cookie.secure else "http"
+            param["url"] = f"{scheme}://{cookie.domain}{param['path']}"
+        else:
+            param["url"] = current_url
+        if cookie.expires is not None:
+            param["expires"] = cookie.expires
+        return param
+
+    @staticmethod
+    def _webdriver_cookie(cookie: Cookie) -> dict:
+        _cookie: dict = {
+            "name": cookie.name,
+            "value": cookie.value or "",
+            "path": cookie.path or "/",
+            "secure": bool(cookie.secure),
+        }
+        if cookie.domain.startswith("."):
+            _cookie["domain"] = cookie.domain
+        if cookie.expires is not None:
+            _cookie["expiry"] = cookie.expires
+        return _cookie
+
+    @staticmethod
+    def _fingerprint_cookies(cookies: list[dict]) -> int:
+        return hash(
+            frozenset(
+                (c.get("domain"), c.get("path"), c["name"], c["value"]) for c in cookies
+            )
+        )
+
     @staticmethod
     def find_element_by_text(
         elements: list[WebElement], text: str
     ) -> WebElement | None:
         """Finds a WebElement from a list based on its text content.
 
+        Reads `.text` of each element, one round trip per element. To search the live page,\
+            `Browser.find_by_text` does the matching in a single call.
+
         Args:
             elements (List[WebElement]): The list of WebElements to search through.
             text (str): The text to match against the elements' text content.
@@ -115,10 +599,84 @@ class Browser:
         print(
             "Depreciation Notice: `Browser.find_button_by_text` depreciated. Use `Element.Button` instead"
         )
-        return self.find_element_by_text(
-            self.driver.find_elements(By.TAG_NAME, "button"), text
+        return self.find_by_text(text, tag="button")
+
+    def find_by_text(
+        self,
+        text: str | re.Pattern,
+        match: Literal["exact", "casefold", "contains", "regex"] = "exact",
+        tag: str | None = None,
+        within: Locator | WebElement | None = None,
+    ) -> WebElement | None:
+        """Find the first element whose visible text matches, in a single round trip
+
+        Matching runs in the page instead of reading `.text` of every element from Python.
+
+        Example:
+            ```python
+            chrome.find_by_text("Sign in", tag="button")
+            chrome.find_by_text("total", match="casefold", within="table#summary")
+            chrome.find_by_text(re.compile(r"\\d+ results"), match="regex")
+            ```
+
+        Args:
+            text (str | re.Pattern): Text to look for. A compiled pattern implies `match="regex"`.
+            match (Literal["exact", "casefold", "contains", "regex"], optional): How the stripped,\
+                visible text is compared. Defaults to "exact".
+            tag (str | None, optional): CSS selector limiting the candidates, e.g. `"button"`.\
+                Defaults to None (any element; only the innermost matches are returned).
+            within (Locator | WebElement | None, optional): Only search inside this container. Defaults to None.
+
+        Raises:
+            ValueError: Unknown `match`, or a pattern using flags other than `re.I`, `re.M` and `re.S`.
+
+        Returns:
+            WebElement | None: The first matching element, or None if no match is found.
+        """
+        return self.driver.execute_script(
+            js.FIND_BY_TEXT, *self._text_query(text, match, tag, within), False
+        )
+
+    def find_all_by_text(
+        self,
+        text: str | re.Pattern,
+        match: Literal["exact", "casefold", "contains", "regex"] = "exact",
+        tag: str | None = None,
+        within: Locator | WebElement | None = None,
+    ) -> list[WebElement]:
+        """Find all elements whose visible text matches, in a single round trip. See `Browser.find_by_text`.
+
+        Returns:
+            list[WebElement]: Matching elements in document order
+        """
+        return self.driver.execute_script(
+            js.FIND_BY_TEXT, *self._text_query(text, match, tag, within), True
         )
 
+    @staticmethod
+    def _text_query(
+        text: str | re.Pattern,
+        match: str,
+        tag: str | None,
+        within: Locator | WebElement | None,
+    ) -> tuple:
+        flags = ""
+        if isinstance(text, re.Pattern):
+            match = "regex"
+            js_flags = (("i", re.IGNORECASE), ("m", re.MULTILINE), ("s", re.DOTALL))
+            unsupported = text.flags & ~(re.UNICODE | re.IGNORECASE | re.MULTILINE | re.DOTALL)
+            if unsupported:
+                raise ValueError(f"Unsupported regex flags for in-page matching: {re.RegexFlag(unsupported)!r}")
+            flags = "".join(flag for flag, value in js_flags if text.flags & value)
+            text = text.pattern
+        if match not in ("exact", "casefold", "contains", "regex"):
+            raise ValueError(f"Unsupported text match mode: {match!r}")
+        if match == "casefold":
+            text = text.lower()  # Same as the page's `toLowerCase()`; `str.casefold` would turn "ß" into "ss"
+        if within is not None and not isinstance(within, WebElement):
+            within = _as_locator(within)
+        return text, match, flags, tag, within
+
     def scroll(
         self,
         direction: Literal["top", "bottom"] = "bottom",
@@ -147,8 +705,117 @@ class Browser:
 
     @property
     def soup(self) -> BeautifulSoup:
-        """Returns soup object of current page"""
-        return BeautifulSoup(self.driver.page_source, "html.parser")
+        """Returns soup object of current page
+
+        The parsed tree is cached and only rebuilt after navigation or a DOM mutation,
+        so repeated access on an unchanged page costs one small script call.
+
+        The returned object is shared between accesses and must be treated as read-only:
+        `decompose`, `extract` and other edits would show up in every later `soup` of the
+        same page. Modify a `copy.copy(browser.soup)`, or use `Browser.soup_of`, which
+        always parses a fresh tree.
+        """
+        parser = self.SOUP_PARSER or default_soup_parser()
+        cached = self._soup_cache
+        known_key = cached[1] if cached is not None and cached[0] == parser else None
+
+        try:
+            result: dict = self._script(js.VERSIONED_SOURCE, known_key)
+        except exceptions.JavascriptException:
+            return BeautifulSoup(self.driver.page_source, parser)
+
+        if result["html"] is None:
+            return cached[2]  # type: ignore[index]
+
+        soup = BeautifulSoup(result["html"], parser)
+        self._soup_cache = (parser, result["key"], soup)
+        return soup
+
+    def html_of(
+        self, locator: Locator | dict[str, Locator]
+    ) -> str | None | dict[str, str | None]:
+        """Serialize only the matching element's `outerHTML` instead of the whole page
+
+        Args:
+            locator (Locator | dict[str, Locator]): CSS selector or `(By, value)` tuple,\
+                or a dict of them to fetch several fragments in one call.
+
+        Returns:
+            str | None | dict[str, str | None]: `outerHTML` of the first match (None if nothing matches),\
+                or a dict with the same keys when a dict was passed.
+        """
+        if isinstance(locator, dict):
+            return self._script(
+                js.OUTER_HTML, {key: _as_locator(value) for key, value in locator.items()}
+            )
+        return self._script(js.OUTER_HTML, {"_": _as_locator(locator)})["_"]
+
+    def soup_of(
+        self, locator: Locator | dict[str, Locator]
+    ) -> BeautifulSoup | None | dict[str, BeautifulSoup | None]:
+        """Parse only the matching element instead of the whole page. See `Browser.html_of`.
+
+        Example:
+            ```python
+            table = chrome.soup_of("table#results")
+            parts = chrome.soup_of({"nav": "nav", "footer": (By.TAG_NAME, "footer")})
+            ```
+
+        Args:
+            locator (Locator | dict[str, Locator]): CSS selector or `(By, value)` tuple,\
+                or a dict of them to parse several fragments from one call.
+
+        Returns:
+            BeautifulSoup | None | dict[str, BeautifulSoup | None]: Soup of the first match (None if nothing matches),\
+                or a dict with the same keys when a dict was passed.
+        """
+        parser = self.SOUP_PARSER or default_soup_parser()
+        html = self.html_of(locator)
+        if isinstance(html, dict):
+            return {
+                key: None if value is None else BeautifulSoup(value, parser)
+                for key, value in html.items()
+            }
+        return None if html is None else BeautifulSoup(html, parser)
+
+    def extract(self, spec: dict[str, str | dict], root: Locator | None = None) -> dict | None:
+        """Extract structured data from the page in a single `execute_script` call
+
+        Each key of `spec` maps to either:
+
+        - a string `"<css>"` (text of the first match), `"<css>@<attr>"` (attribute of the
+          first match) or `"@<attr>"` (attribute of the current element). `<attr>` may also be
+          `text`, `textContent`, `html` or `outerHTML`. Missing elements give None.
+        - a dict `{"css": "<css>", "fields": {...}}` giving a list with one dict per match,
+          each built from the nested `fields` spec relative to that match. Without `fields`,
+          the list holds each match's text, or its `"attr"` attribute. Set `"first": True`
+          to return only the first item (or None).
+
+        Example:
+            ```python
+            chrome.extract({
+                "title": "h1",
+                "rows": {"css": "tr", "fields": {"name": "td:nth-child(1)", "href": "a@href"}},
+            })
+            ```
+
+        Args:
+            spec (dict[str, str | dict]): Extraction spec.
+            root (Locator | None, optional): Only extract inside the first match of this locator. Defaults to None (whole page).
+
+        Raises:
+            NoSuchElementException: `root` matched nothing.
+
+        Returns:
+            dict | None: JSON-able data with the same keys as `spec`
+        """
+        compiled = {key: _compile_extract_node(node, key) for key, node in spec.items()}
+        result = self._script(
+            js.EXTRACT, compiled, None if root is None else _as_locator(root)
+        )
+        if result is None:
+            raise exceptions.NoSuchElementException(f"No element matches root locator {root!r}")
+        return result
 
     def halfscreen(self) -> None:
         """Set browser to half screen width"""
@@ -161,6 +828,9 @@ class Browser:
         driver = self.driver
         driver.implicitly_wait(self.IMPLICITLY_WAIT_TIME)
         driver.execute_script("window.focus()")
+        if not self.supports_cdp:
+            return None  # Firefox gets its useragent from a profile pref; `navigator.webdriver` stays visible
+
         driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": useragent})
         driver.execute_cdp_cmd(
             "Page.addScriptToEvaluateOnNewDocument",
@@ -176,18 +846,515 @@ class Browser:
         driver.execute_cdp_cmd(
             "Network.setExtraHTTPHeaders", {"headers": {"User-Agent": useragent}}
         )
+        self._apply_resource_policy()
+
+    def _apply_resource_policy(self) -> None:
+        """Install `_resource_policy` in every window this browser owns, since `Fetch` interception is per target
+
+        Each window gets a `RequestBlocker` on its own DevTools session. Windows whose\
+            websocket is unreachable fall back to the policy's URL patterns through\
+            `Network.setBlockedURLs`.
+        """
+        if self._resource_policy is None or not self.supports_cdp:
+            return None
+        policy = self._resource_policy
+        driver = self._webdriver
+        handles = self._owned_handles(driver.window_handles)
+        for handle, blocker in list(self._blockers.items()):
+            if handle not in handles or blocker.closed:
+                blocker.close()
+                del self._blockers[handle]
+
+        fallback: list[str] = []
+        for handle in handles:
+            blocker = self._blockers.get(handle)
+            if blocker is None:
+                if not policy.fetch_patterns():
+                    continue
+                try:
+                    blocker = RequestBlocker(
+                        CDPConnection.for_driver(driver, handle=handle), self._count_blocked
+                    )
+                except (CDPError, OSError):
+                    fallback.append(handle)
+                    continue
+                self._blockers[handle] = blocker
+            blocker.apply(policy)
+        if not fallback:
+            return None
+
+        urls = policy.blocked_urls()
+        current: str = driver.current_window_handle
+        for handle in fallback:
+            if handle != current:
+                self._switch_to(handle)
+                driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+        if driver.current_window_handle != current:
+            self._switch_to(current)
+        return None
+
+    def _count_blocked(self, resource_type: str) -> None:
+        with self._blocked_lock:  # Called from the reader thread of each window's blocker
+            self.blocked_requests[resource_type] += 1
+        return None
+
+    @property
+    def uptime(self) -> float:
+        """Seconds elapsed since the browser was started"""
+        return time.monotonic() - self.started_at
+
+    def reset(self) -> None:
+        """Return the browser to a clean state so it can be reused.
+
+        Closes every tab but the first (browser contexts are left alone), clears cookies\
+            and web storage and navigates to `about:blank`. On Chromium, all site data\
+            (local storage, IndexedDB, cache storage, service workers, ...) of every origin\
+            loaded through `Browser.get`, of the current page and of every cookie domain is\
+            cleared with CDP `Storage.clearDataForOrigin`, along with the HTTP cache; elsewhere\
+            only the current page's web storage is.
+        """
+        driver = self.driver
+        handles = self._owned_handles(driver.window_handles)
+        main = self._window_handle or handles[0]
+        for handle in handles:
+            if handle != main:
+                self._switch_to(handle)
+                driver.close()
+        self._switch_to(main)
+
+        try:
+            driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();"
+            )
+        except exceptions.WebDriverException:
+            pass  # Storage is not accessible on `about:blank` and `data:` pages
+
+        if self.supports_cdp:
+            origins = set(self._visited_origins)
+            if (origin := _origin(driver.current_url)) is not None:
+                origins.add(origin)
+            for cookie in driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]:
+                domain = cookie["domain"].lstrip(".")
+                origins.update((f"https://{domain}", f"http://{domain}"))
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+                )
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        else:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+        self._visited_origins = set()
+
+        if "_Browser__base_session" in self.__dict__:
+            self.__base_session.cookies.clear()
+        self._cookie_fingerprint = None
+        self._synced_cookies = set()
+
+    def watch(
+        self,
+        max_rss: int | None = None,
+        max_js_heap: int | None = None,
+        max_cpu_percent: float | None = None,
+        interval: float = 30.0,
+    ) -> Watchdog:
+        """Restart the browser between page loads when it uses too much memory or CPU
+
+        Example:
+            ```python
+            watchdog = chrome.watch(max_rss=2 * 1024**3, max_js_heap=512 * 1024**2)
+            ```
+
+        Args:
+            max_rss (int | None, optional): Limit on the RSS of the driver/browser/renderer processes, in bytes. Requires psutil. Defaults to None.
+            max_js_heap (int | None, optional): Limit on the used JS heap of the current page, in bytes. Defaults to None.
+            max_cpu_percent (float | None, optional): Limit on the CPU use between two samples, 100 per core. Requires psutil. Defaults to None.
+            interval (float, optional): Minimum seconds between samples. Defaults to 30.0.
+
+        Raises:
+            NotImplementedError: The browser cannot be restarted (e.g. a `BrowserContext` or a tab of `Chrome.fetch_tabs`).
+
+        Returns:
+            Watchdog: The watchdog, also set as `Browser.watchdog`
+        """
+        self.watchdog = Watchdog(
+            self,
+            max_rss=max_rss,
+            max_js_heap=max_js_heap,
+            max_cpu_percent=max_cpu_percent,
+            interval=interval,
+        )
+        return self.watchdog
+
+    @property
+    def can_restart(self) -> bool:
+        """Whether `Browser.restart` can start a new driver (`Chrome` and `Firefox`, not contexts or tabs)"""
+        return type(self)._launch is not Browser._launch
+
+    def restart(self) -> None:
+        """Quit the browser process and start a fresh one in its place
 
-    def get(self, url: str) -> None:
+        Cookies (all domains on Chromium, the current page's elsewhere), the current page\
+            and its `localStorage`, driver timeouts, instrumentation sinks, attached response\
+            caches and the `session` object are carried over; other tabs and browser contexts\
+            are lost. `uptime` and `page_count` start over.
+
+        Raises:
+            NotImplementedError: The browser cannot start a new driver (e.g. a `BrowserContext`).
+        """
+        driver = self.driver
+        url: str = driver.current_url
+        keep_page = url.startswith(("http://", "https://"))
+        if self.supports_cdp:
+            cookies: list[dict] = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        else:
+            cookies = driver.get_cookies()
+        storage: list[list[str]] = []
+        if keep_page:
+            try:
+                storage = driver.execute_script("return Object.entries(window.localStorage)")
+            except exceptions.WebDriverException:
+                pass  # Storage is not accessible on this page
+        timeouts = driver.timeouts
+        instrumentation = getattr(driver.command_executor, "_ak_instrumentation", None)
+        interceptors = list(self._interceptors)
+        for interceptor in interceptors:
+            interceptor.detach()
+
+        if self._cdp is not None:
+            self._cdp.close()
+        try:
+            driver.quit()
+        except exceptions.WebDriverException:
+            pass  # The browser is already gone, e.g. it crashed
+
+        self._window_handle = None
+        self._reserved_handles = set()
+        self._cdp, self._cdp_unavailable = None, False
+        self._soup_cache = None
+        self._session_headers = None
+        self._cookie_fingerprint = None
+        for name in ("Element", "Action", "_helium"):
+            self.__dict__.pop(name, None)  # Bound to the old driver
+        self._launch()
+
+        driver = self.driver
+        driver.timeouts = timeouts
+        if instrumentation is not None:
+            self.instrumentation.sinks.extend(instrumentation.sinks)
+        if self.supports_cdp and cookies:
+            driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [self._restorable_cookie(c) for c in cookies]},
+            )
+        if keep_page:
+            driver.get(url)
+            if not self.supports_cdp:
+                for cookie in cookies:
+                    try:
+                        driver.add_cookie(cookie)
+                    except exceptions.WebDriverException:
+                        pass  # Cookie is not for the current page's domain
+            if storage:
+                driver.execute_script(
+                    "for (const [k, v] of arguments[0]) window.localStorage.setItem(k, v);", storage
+                )
+            if storage or (cookies and not self.supports_cdp):
+                driver.refresh()
+        for interceptor in interceptors:
+            interceptor.start()
+
+        self.started_at = time.monotonic()
+        self.page_count = 0
+        self.restarts += 1
+        return None
+
+    def _launch(self) -> None:
+        """Start and prepare a new driver for `Browser.restart`"""
+        raise NotImplementedError(f"{type(self).__name__} cannot be restarted")
+
+    @staticmethod
+    def _restorable_cookie(cookie: dict) -> dict:
+        """`Network.getAllCookies` cookie as a `Network.setCookies` parameter"""
+        keys = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "priority")
+        param = {key: cookie[key] for key in keys if key in cookie}
+        if not cookie.get("session") and cookie.get("expires", -1) > 0:
+            param["expires"] = cookie["expires"]
+        return param
+
+    @property
+    def driver(self):
+        """Selenium webdriver
+
+        When the driver is shared between several `Browser` objects (e.g. browser contexts),\
+            accessing it first switches to this browser's window if another one is active.
+        """
+        driver = self._webdriver
+        if self._window_handle is not None and getattr(driver, "_ak_window_handle", None) != self._window_handle:
+            self._switch_to(self._window_handle)
+        return driver
+
+    @driver.setter
+    def driver(self, driver) -> None:
+        self._webdriver = driver
+
+    def _owned_handles(self, handles: list[str]) -> list[str]:
+        """Windows `Browser.reset` may close, i.e. all but those of browser contexts"""
+        return [h for h in handles if h not in self._reserved_handles]
+
+    def _pin_window(self) -> None:
+        """Bind this browser to its current window before opening more windows on the shared driver"""
+        if self._window_handle is None:
+            self._window_handle = self._webdriver.current_window_handle
+            self._webdriver._ak_window_handle = self._window_handle
+        return None
+
+    def _switch_to(self, handle: str) -> None:
+        """Switch windows and record it, so shared-driver browsers know which window is active"""
+        self._webdriver.switch_to.window(handle)
+        self._webdriver._ak_window_handle = handle
+        return None
+
+    @property
+    def instrumentation(self) -> CommandInstrumentation:
+        """Per-command instrumentation of the driver, installed on first access
+
+        Example:
+            ```python
+            from ak_selenium.instrument import LoggingSink
+
+            chrome.instrumentation.add_sink(LoggingSink())
+            ```
+        """
+        return CommandInstrumentation.for_driver(self._webdriver)
+
+    @contextmanager
+    def profile(self) -> Iterator[CommandStats]:
+        """Collect per-command latency, size and call-site statistics for a block
+
+        Example:
+            ```python
+            with chrome.profile() as stats:
+                chrome.get("https://example.com")
+                chrome.session
+            print(stats.report())
+            ```
+        """
+        with self.instrumentation.profile() as stats:
+            yield stats
+
+    @property
+    def supports_cdp(self) -> bool:
+        """Whether the driver accepts Chrome DevTools Protocol commands (Chrome, Edge)"""
+        return isinstance(self.driver, ChromiumDriver)
+
+    @property
+    def cdp(self) -> CDPConnection | None:
+        """Direct DevTools websocket to this browser's window, used when `TRANSPORT` is `"cdp"`
+
+        Opened on first access; None when the browser is not Chromium-based or its\
+            debugger address is unreachable. The window active at that time is pinned\
+            (see `Chrome.new_context`), so commands keep targeting it.
+        """
+        if self._cdp is not None and not self._cdp.closed:
+            return self._cdp
+        if self._cdp_unavailable or not self.supports_cdp:
+            return None
+        self._pin_window()
+        try:
+            self._cdp = CDPConnection.for_driver(self._webdriver, handle=self._window_handle)
+        except (CDPError, OSError):
+            self._cdp_unavailable = True  # Fall back to WebDriver for the lifetime of the browser
+            self._cdp = None
+        return self._cdp
+
+    def evaluate(self, script: str, *args):
+        """Run a JavaScript function body and return its result, like `driver.execute_script`
+
+        Arguments and the result must be JSON-serializable (no `WebElement`s). With\
+            `TRANSPORT = "cdp"` the script goes over the DevTools websocket, skipping ChromeDriver.\
+            It then always runs in the top-level document, regardless of `switch_to.frame`.
+
+        Example:
+            ```python
+            chrome.evaluate("return document.querySelectorAll(arguments[0]).length", "a")
+            ```
+
+        Args:
+            script (str): Function body; arguments are available as `arguments[i]`.
+            *args: JSON-serializable arguments.
+
+        Returns:
+            Any: The script's return value
+        """
+        return self._script(script, *args)
+
+    def _script(self, script: str, *args):
+        cdp = self.cdp if self.TRANSPORT == "cdp" else None
+        if cdp is None:
+            return self.driver.execute_script(script, *args)
+        return cdp.evaluate(script, *args)
+
+    def _get_cookies(self) -> list[dict]:
+        """Cookies of the current page in `driver.get_cookies()` format"""
+        cdp = self.cdp if self.TRANSPORT == "cdp" else None
+        if cdp is None:
+            return self.driver.get_cookies()
+
+        cookies = []
+        for c in cdp.send("Network.getCookies")["cookies"]:
+            cookie = {
+                "name": c["name"],
+                "value": c["value"],
+                "domain": c["domain"],
+                "path": c["path"],
+                "secure": c["secure"],
+                "httpOnly": c["httpOnly"],
+            }
+            if not c.get("session") and c.get("expires", -1) > 0:
+                cookie["expiry"] = int(c["expires"])
+            cookies.append(cookie)
+        return cookies
+
+    def _cdp_cmd(self, method: str, params: dict) -> dict:
+        cdp = self.cdp if self.TRANSPORT == "cdp" else None
+        if cdp is None:
+            return self.driver.execute_cdp_cmd(method, params)
+        return cdp.send(method, params)
+
+    def get(
+        self,
+        url: str,
+        wait_until: Literal["domcontentloaded", "load", "networkidle"] | Locator | None = None,
+        timeout: float | None = None,
+        idle_time: float = 0.5,
+        max_inflight: int = 0,
+    ) -> NavigationResult:
         """Navigate to a webpage
 
+        How long `driver.get` itself blocks is set by the page load strategy (see the\
+            `page_load_strategy` argument of `Chrome`/`Firefox`). `wait_until` then adds a\
+            completion condition on top of it. Errors are reported in the result instead of raised;\
+            call `NavigationResult.raise_for_status` to raise them.
+
+        Example:
+            ```python
+            chrome = Chrome(page_load_strategy="eager")
+            result = chrome.get("https://example.com", wait_until="#content")
+            print(result.status, result.navigate_time, result.wait_time)
+            ```
+
         Args:
             url (str): Url to navigate to
+            wait_until (Literal["domcontentloaded", "load", "networkidle"] | Locator | None, optional):\
+                Completion condition: DOMContentLoaded, the load event, network idle (requires\
+                `Chrome.NETWORK_EVENTS`), or a locator/CSS selector to be present. Defaults to None.
+            timeout (float | None, optional): Seconds to wait for `wait_until`. Defaults to `MAX_WAIT_TIME`.
+            idle_time (float, optional): Quiet window for `"networkidle"`, in seconds. Defaults to 0.5.
+            max_inflight (int, optional): Requests allowed to stay open for `"networkidle"`. Defaults to 0.
+
+        Returns:
+            NavigationResult: Status and timing breakdown
         """
+        if "://" not in url and not url.startswith(("about:", "data:")):
+            url = "https://" + url
+        timeout = self.MAX_WAIT_TIME if timeout is None else timeout
+        if self.watchdog is not None:
+            self.watchdog.check()
+        result = NavigationResult(url=url)
+
+        tracker: NetworkIdleTracker | None = None
+        if wait_until == "networkidle" or self.NETWORK_EVENTS:
+            tracker = NetworkIdleTracker()
+            self._performance_log(required=wait_until == "networkidle")  # Skip older events
+
+        start = time.perf_counter()
+        try:
+            try:
+                strategy = self.driver.capabilities.get("pageLoadStrategy", "normal")
+                if strategy == "none" and wait_until in ("domcontentloaded", "load"):
+                    self.driver.execute_script(js.MARK_NAVIGATING)
+                self.driver.get(url)
+            finally:
+                result.navigate_time = time.perf_counter() - start
+            self.page_count += 1
+            if (origin := _origin(url)) is not None:
+                self._visited_origins.add(origin)
+
+            match wait_until:
+                case None:
+                    pass
+                case "domcontentloaded":
+                    self._wait_ready_state("interactive", timeout)
+                case "load":
+                    self._wait_ready_state("complete", timeout)
+                case "networkidle":
+                    self._wait_network_idle(tracker, timeout, idle_time, max_inflight)  # type: ignore[arg-type]
+                case _:
+                    self.wait_for_locator(wait_until, timeout=timeout)
+
+            if tracker is not None:
+                tracker.feed(self._performance_log())
+        except exceptions.TimeoutException as e:
+            result.status, result.error = "timeout", e.msg or str(e)
+        except exceptions.WebDriverException as e:
+            result.status, result.error = "error", e.msg or str(e)
+
+        if tracker is not None:
+            result.http_status = tracker.document_status
+        result.total_time = time.perf_counter() - start
+        result.wait_time = result.total_time - result.navigate_time
+        return result
+
+    def _wait_ready_state(self, target: Literal["interactive", "complete"], timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        if self._script_timeout < timeout + 1:
+            self.driver.set_script_timeout(timeout + 1)
+            self._script_timeout = timeout + 1
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                state = self.driver.execute_async_script(
+                    js.READY_STATE, target, int(max(remaining, 0) * 1000)
+                )
+            except exceptions.JavascriptException:
+                state = "stale"  # Document unloaded while waiting
+            if state == "ready":
+                return None
+            if state == "timeout" or time.monotonic() >= deadline:
+                raise exceptions.TimeoutException(
+                    f"Document did not reach readyState '{target}' within {timeout}s"
+                )
+            time.sleep(0.05)
+
+    def _wait_network_idle(
+        self,
+        tracker: NetworkIdleTracker,
+        timeout: float,
+        idle_time: float,
+        max_inflight: int,
+    ) -> None:
+        deadline = time.monotonic() + timeout
+        while True:
+            tracker.feed(self._performance_log())
+            if tracker.idle(idle_time, max_inflight):
+                return None
+            if time.monotonic() >= deadline:
+                raise exceptions.TimeoutException(
+                    f"Network not idle within {timeout}s ({len(tracker.inflight)} requests in flight)"
+                )
+            time.sleep(0.05)
 
+    def _performance_log(self, required: bool = True) -> list[dict]:
+        """Drain Chrome's performance log, which carries CDP `Network.*` events"""
         try:
-            if "://" not in url:
-                url = "https://" + url
-            self.driver.get(url)
-            WebDriverWait(self.driver, timeout=self.MAX_WAIT_TIME, poll_frequency=0.5)
-        except Exception as e:
-            print(str(e))
+            entries: list[dict] = self.driver.get_log("performance")
+        except (AttributeError, exceptions.WebDriverException):
+            if required:
+                raise ValueError(
+                    "Network events are unavailable. Use Chrome with `Chrome.NETWORK_EVENTS = True`."
+                ) from None
+            return []
+        return entries
@@ -0,0 +1,498 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+from urllib.parse import urldefrag
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ak_selenium.cdp import CDPError
+
+if TYPE_CHECKING:
+    from ak_selenium.browser import Browser
+    from ak_selenium.cdp import CDPConnection
+
+CacheMode = Literal["cache", "record", "replay"]
+
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+"""Not stored: bodies are kept decoded, and the length is recomputed when served"""
+
+
+class CacheMiss(requests.ConnectionError):
+    """A request was not in the cache while replaying"""
+
+
+@dataclass
+class CachedResponse:
+    """A response stored in `ResponseCache`"""
+
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    """Header name/value pairs, repeated names (e.g. `Set-Cookie`) kept"""
+    body: bytes
+    created: float
+    """`time.time()` when the response was stored"""
+
+
+@dataclass
+class CacheStats:
+    """Counters reported by `ResponseCache.stats`"""
+
+    hits: int = 0
+    """Requests served from the cache"""
+    misses: int = 0
+    """Lookups that found nothing fresh"""
+    stores: int = 0
+    """Responses written to the cache"""
+    evictions: int = 0
+    """Entries dropped to stay under `max_bytes`"""
+
+
+class ResponseCache:
+    """On-disk HTTP response cache shared by a browser and its `RequestsSession`
+
+    Bodies are stored once per content hash under `<path>/blobs`, indexed by method and url\
+        in `<path>/index.sqlite`, so identical responses (e.g. a shared script on many\
+        pages) take the space of one. Only `GET` requests are cached; `Vary` is ignored.
+
+    Modes:
+
+    - `"cache"`: serve stored responses younger than `ttl`, fetch and store the rest.
+    - `"record"`: always fetch and store, overwriting earlier captures.
+    - `"replay"`: serve stored responses regardless of age and fail everything else, so\
+        runs are offline and deterministic.
+
+    Example:
+        ```python
+        from ak_selenium import Chrome, ResponseCache
+
+        cache = ResponseCache(".http-cache", ttl=3600, max_bytes=500_000_000)
+        chrome = Chrome(headless=True)
+        with cache.attach(chrome):
+            chrome.get("https://example.com")                  # Through CDP `Fetch`
+            chrome.session.get("https://example.com/api")      # Through a requests adapter
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        mode: CacheMode = "cache",
+    ) -> None:
+        """Open or create a cache directory
+
+        Args:
+            path (str | os.PathLike): Cache directory.
+            ttl (float | None, optional): Seconds a stored response stays fresh in `"cache"` mode. Defaults to None (forever).
+            max_bytes (int | None, optional): Evict least recently used entries above this total body size. Defaults to None (no limit).
+            mode (CacheMode, optional): `"cache"`, `"record"` or `"replay"`. Defaults to "cache".
+        """
+        if mode not in ("cache", "record", "replay"):
+            raise ValueError(f"Unknown cache mode {mode!r}")
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.mode: CacheMode = mode
+        self.stats = CacheStats()
+
+        (self.path / "blobs").mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path / "index.sqlite", timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY, method TEXT, url TEXT, status INTEGER,
+                headers TEXT, digest TEXT, created REAL, accessed REAL
+            );
+            CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, size INTEGER);
+            CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+            CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+            """
+        )
+        return None
+
+    def __str__(self) -> str:
+        return f"""
+        ResponseCache.Object
+        Path: {self.path}
+        Mode: {self.mode}
+        Entries: {len(self)}
+        Size: {self.size} bytes
+        """
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(path={str(self.path)!r},\
+                ttl={self.ttl},\
+                max_bytes={self.max_bytes},\
+                mode={self.mode!r})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Total bytes of stored bodies"""
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        """Index key of a request; the url fragment is ignored"""
+        return f"{method.upper()} {urldefrag(url)[0]}"
+
+    def lookup(self, method: str, url: str) -> CachedResponse | None:
+        """Stored response to serve for a request under the current mode
+
+        Returns:
+            CachedResponse | None: None in `"record"` mode, for non-`GET` requests, or when\
+                nothing (fresh) is stored.
+        """
+        if self.mode == "record" or method.upper() != "GET":
+            return None
+        response = self.get(method, url, fresh=self.mode == "cache")
+        with self._lock:  # Looked up from the interceptor worker and adapter threads alike
+            if response is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return response
+
+    def get(self, method: str, url: str, fresh: bool = True) -> CachedResponse | None:
+        """Read a stored response
+
+        Args:
+            method (str): HTTP method.
+            url (str): Requested url.
+            fresh (bool, optional): Ignore responses older than `ttl`. Defaults to True.
+
+        Returns:
+            CachedResponse | None: The response, or None if missing or stale
+        """
+        key = self.key(method, url)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, headers, digest, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            url, status, headers, digest, created = row
+            if fresh and self.ttl is not None and time.time() - created > self.ttl:
+                return None
+            try:
+                body = self._blob_path(digest).read_bytes()
+            except FileNotFoundError:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return CachedResponse(
+            url=url,
+            status=status,
+            headers=[tuple(pair) for pair in json.loads(headers)],
+            body=body,
+            created=created,
+        )
+
+    def put(
+        self, method: str, url: str, status: int, headers: list[tuple[str, str]], body: bytes
+    ) -> None:
+        """Store a response, unless in `"replay"` mode or for a non-`GET` request
+
+        Args:
+            method (str): HTTP method.
+            url (str): Requested url.
+            status (int): HTTP status code.
+            headers (list[tuple[str, str]]): Response header name/value pairs.
+            body (bytes): Decoded response body.
+        """
+        if self.mode == "replay" or method.upper() != "GET":
+            return None
+        digest = hashlib.sha256(body).hexdigest()
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(exist_ok=True)
+            tmp = blob.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, blob)
+
+        headers = [(name, value) for name, value in headers if name.lower() not in _SKIPPED_HEADERS]
+        now = time.time()
+        key = self.key(method, url)
+        with self._lock:
+            old = self._db.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+            self._db.execute("INSERT OR IGNORE INTO blobs VALUES (?, ?)", (digest, len(body)))
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, method.upper(), url, status, json.dumps(headers), digest, now, now),
+            )
+            if old is not None and old[0] != digest:
+                self._drop_orphan(old[0])
+            self.stats.stores += 1
+            if self.max_bytes is not None:
+                self._evict(self.max_bytes)
+        return None
+
+    def clear(self) -> None:
+        """Remove all entries and bodies"""
+        with self._lock:
+            for (digest,) in self._db.execute("SELECT digest FROM blobs").fetchall():
+                self._blob_path(digest).unlink(missing_ok=True)
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM blobs")
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+        return None
+
+    def adapter(self, inner: BaseAdapter | None = None) -> "CachingAdapter":
+        """Requests transport adapter serving from and storing into this cache, see `CachingAdapter`"""
+        return CachingAdapter(self, inner)
+
+    def attach(self, browser: "Browser") -> "CacheInterceptor":
+        """Route a browser's page loads and its `Browser.session` through the cache
+
+        The session gets a `CachingAdapter` in front of its current adapters. On Chromium-based\
+            browsers with a DevTools connection (see `Browser.cdp`) the browser's window is\
+            intercepted with CDP `Fetch`; elsewhere only the session is cached.
+
+        Returns:
+            CacheInterceptor: Call `detach` (or leave its `with` block) to stop
+        """
+        interceptor = CacheInterceptor(self, browser)
+        interceptor.start()
+        return interceptor
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.path / "blobs" / digest[:2] / digest
+
+    def _drop_orphan(self, digest: str) -> int:
+        """Delete a body no entry refers to anymore and return the bytes freed. Call with `_lock` held."""
+        used = self._db.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone()
+        row = self._db.execute("SELECT size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        if used is not None or row is None:
+            return 0
+        self._db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        self._blob_path(digest).unlink(missing_ok=True)
+        return row[0]
+
+    def _evict(self, max_bytes: int) -> None:
+        """Drop least recently used entries until the bodies fit in `max_bytes`. Call with `_lock` held."""
+        total: int = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= max_bytes:
+            return None
+        for key, digest in self._db.execute(
+            "SELECT key, digest FROM entries ORDER BY accessed"
+        ).fetchall():
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.stats.evictions += 1
+            total -= self._drop_orphan(digest)
+            if total <= max_bytes:
+                break
+        return None
+
+
+class CachingAdapter(BaseAdapter):
+    """Requests transport adapter in front of another one, serving `GET`s from a `ResponseCache`
+
+    Cached responses do not set cookies in the session's jar.
+
+    Example:
+        ```python
+        session.mount("https://", cache.adapter(session.get_adapter("https://")))
+        ```
+    """
+
+    def __init__(self, cache: ResponseCache, inner: BaseAdapter | None = None) -> None:
+        """Wrap an adapter
+
+        Args:
+            cache (ResponseCache): Cache to use.
+            inner (BaseAdapter | None, optional): Adapter sending cache misses. Defaults to a new `HTTPAdapter`.
+        """
+        super().__init__()
+        self.cache = cache
+        self.inner = inner if inner is not None else requests.adapters.HTTPAdapter()
+        return None
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        method, url = request.method or "GET", request.url or ""
+        cached = self.cache.lookup(method, url)
+        if cached is not None:
+            return self._build_response(request, cached)
+        if self.cache.mode == "replay":
+            raise CacheMiss(f"Not in cache: {url}", request=request)
+
+        response = self.inner.send(request, **kwargs)
+        self.cache.put(method, url, response.status_code, list(response.headers.items()), response.content)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def _build_response(self, request: requests.PreparedRequest, cached: CachedResponse) -> requests.Response:
+        response = requests.Response()
+        response.status_code = cached.status
+        response.headers = CaseInsensitiveDict()
+        for name, value in cached.headers:
+            existing = response.headers.get(name)
+            response.headers[name] = value if existing is None else f"{existing}, {value}"
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(cached.body)
+        response._content = cached.body
+        response._content_consumed = True
+        response.url = request.url or cached.url
+        response.request = request
+        response.connection = self
+        response.reason = "Cached"
+        return response
+
+
+class CacheInterceptor:
+    """Serves a browser's window and session from a `ResponseCache`; created by `ResponseCache.attach`
+
+    Browser requests are paused with CDP `Fetch`: hits are fulfilled from the cache, misses\
+        continue to the network and their responses are stored before the page sees them\
+        (or fail with `InternetDisconnected` when replaying). Paused requests are handled\
+        on a worker thread, since CDP listeners must not block. Only the window of\
+        `Browser.cdp` is intercepted, not other tabs.
+    """
+
+    def __init__(self, cache: ResponseCache, browser: "Browser") -> None:
+        self.cache = cache
+        self.browser = browser
+        self._cdp: "CDPConnection | None" = None
+        self._unsubscribe = None
+        self._paused: queue.Queue[dict | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._adapters: dict[str, BaseAdapter] = {}
+        return None
+
+    def __repr__(self) -> str:
+        return f"CacheInterceptor({self.cache!r},\
+                browser={type(self.browser).__name__})"
+
+    def __enter__(self) -> "CacheInterceptor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.detach()
+
+    @property
+    def intercepting(self) -> bool:
+        """Whether browser requests go through the cache, not only the session's"""
+        return self._cdp is not None
+
+    def start(self) -> None:
+        self.browser._interceptors.append(self)
+        session = self.browser.session
+        for prefix in ("https://", "http://"):
+            inner = session.get_adapter(prefix)
+            self._adapters[prefix] = inner
+            session.mount(prefix, self.cache.adapter(inner))
+
+        cdp = self.browser.cdp
+        if cdp is None:
+            return None
+        self._cdp = cdp
+        self._worker = threading.Thread(target=self._work, daemon=True)
+        self._worker.start()
+        self._unsubscribe = cdp.on("Fetch.requestPaused", self._paused.put)
+        stages = ["Request"] if self.cache.mode == "replay" else ["Request", "Response"]
+        cdp.send(
+            "Fetch.enable",
+            {"patterns": [{"urlPattern": "*", "requestStage": stage} for stage in stages]},
+        )
+        return None
+
+    def detach(self) -> None:
+        """Stop caching; the browser and session go straight to the network again"""
+        if self in self.browser._interceptors:
+            self.browser._interceptors.remove(self)
+        session = self.browser.session
+        for prefix, inner in self._adapters.items():
+            session.mount(prefix, inner)
+        self._adapters = {}
+
+        if self._cdp is not None:
+            if self._unsubscribe is not None:
+                self._unsubscribe()
+            try:
+                self._cdp.send("Fetch.disable")
+            except CDPError:
+                pass  # Connection already gone
+            self._paused.put(None)
+            self._cdp = None
+        return None
+
+    def _work(self) -> None:
+        while (params := self._paused.get()) is not None:
+            try:
+                self._handle(params)
+            except CDPError:
+                pass  # Request was cancelled, e.g. the page navigated away
+        return None
+
+    def _handle(self, params: dict) -> None:
+        assert self._cdp is not None
+        cdp, cache = self._cdp, self.cache
+        request_id: str = params["requestId"]
+        method: str = params["request"]["method"]
+        url: str = params["request"]["url"]
+
+        if "responseStatusCode" in params:  # Response stage: store, then let it through
+            status: int = params["responseStatusCode"]
+            if method.upper() == "GET":
+                headers = [(h["name"], h["value"]) for h in params.get("responseHeaders", [])]
+                body = b"" if 300 <= status < 400 else self._response_body(request_id)
+                cache.put(method, url, status, headers, body)
+            cdp.send("Fetch.continueRequest", {"requestId": request_id})
+            return None
+
+        if "responseErrorReason" in params:
+            cdp.send("Fetch.continueRequest", {"requestId": request_id})
+            return None
+
+        cached = cache.lookup(method, url)
+        if cached is not None:
+            cdp.send(
+                "Fetch.fulfillRequest",
+                {
+                    "requestId": request_id,
+                    "responseCode": cached.status,
+                    "responseHeaders": [{"name": n, "value": v} for n, v in cached.headers],
+                    "body": base64.b64encode(cached.body).decode(),
+                },
+            )
+        elif cache.mode == "replay":
+            cdp.send(
+                "Fetch.failRequest", {"requestId": request_id, "errorReason": "InternetDisconnected"}
+            )
+        else:
+            cdp.send("Fetch.continueRequest", {"requestId": request_id})
+        return None
+
+    def _response_body(self, request_id: str) -> bytes:
+        assert self._cdp is not None
+        body = self._cdp.send("Fetch.getResponseBody", {"requestId": request_id})
+        if body.get("base64Encoded"):
+            return base64.b64decode(body["body"])
+        return body["body"].encode()
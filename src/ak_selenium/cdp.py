@@ -0,0 +1,238 @@
+import itertools
+import json
+import threading
+import urllib.request
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+import websocket
+from selenium.common import exceptions
+
+
+class CDPError(exceptions.WebDriverException):
+    """A DevTools command returned an error, or the connection was lost"""
+
+
+class CDPConnection:
+    """Direct Chrome DevTools Protocol websocket to one tab of a running Chrome
+
+    Commands skip ChromeDriver's HTTP endpoint and go straight to the browser over a\
+        persistent websocket. A background thread reads responses and dispatches events\
+        to the callbacks registered with `CDPConnection.on`. Safe to use from several threads.
+
+    Example:
+        ```python
+        cdp = CDPConnection.for_driver(chrome.driver)
+        cdp.send("Runtime.evaluate", {"expression": "1 + 1", "returnByValue": True})
+        cdp.on("Network.responseReceived", lambda params: print(params["response"]["url"]))
+        ```
+    """
+
+    TIMEOUT: float = 30
+    """Default seconds to wait for a command's response"""
+
+    def __init__(self, websocket_url: str, timeout: float | None = None) -> None:
+        """Connect to a DevTools websocket
+
+        Args:
+            websocket_url (str): `webSocketDebuggerUrl` of the target, e.g. from `http://<debuggerAddress>/json/list`.
+            timeout (float | None, optional): Default seconds to wait for a response. Defaults to `CDPConnection.TIMEOUT`.
+        """
+        self.websocket_url = websocket_url
+        self.timeout = self.TIMEOUT if timeout is None else timeout
+
+        # Chrome rejects websocket clients sending an Origin header unless started with
+        # --remote-allow-origins, which ChromeDriver does not set for us.
+        self._ws = websocket.create_connection(
+            websocket_url, timeout=self.timeout, suppress_origin=True
+        )
+        self._ws.settimeout(None)  # The reader blocks until a message arrives or `close`
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._pending: dict[int, tuple[threading.Event, list[dict]]] = {}
+        self._listeners: defaultdict[str, list[Callable[[dict], Any]]] = defaultdict(list)
+        self._closed: bool = False
+
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+        return None
+
+    def __repr__(self) -> str:
+        return f"CDPConnection(websocket_url={self.websocket_url},\
+                timeout={self.timeout})"
+
+    def __enter__(self) -> "CDPConnection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @classmethod
+    def for_driver(cls, driver, handle: str | None = None, timeout: float | None = None) -> "CDPConnection":
+        """Connect to a tab of a running ChromeDriver session
+
+        Args:
+            driver (webdriver.Chrome): Chrome driver, local or remote with a reachable debugger address.
+            handle (str | None, optional): Window handle of the tab. Defaults to the current window.
+            timeout (float | None, optional): Default seconds to wait for a response. Defaults to `CDPConnection.TIMEOUT`.
+
+        Raises:
+            CDPError: The session exposes no debugger address or the tab is not listed.
+
+        Returns:
+            CDPConnection: Connection to the tab
+        """
+        options: dict = driver.capabilities.get("goog:chromeOptions", {})
+        address: str | None = options.get("debuggerAddress")
+        if not address:
+            raise CDPError("The driver exposes no `goog:chromeOptions.debuggerAddress`")
+        handle = handle or driver.current_window_handle
+
+        with urllib.request.urlopen(f"http://{address}/json/list", timeout=5) as response:
+            targets: list[dict] = json.load(response)
+        for target in targets:
+            if target.get("id") == handle and target.get("webSocketDebuggerUrl"):
+                return cls(target["webSocketDebuggerUrl"], timeout=timeout)
+        raise CDPError(f"No DevTools target found for window {handle}")
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def send(self, method: str, params: dict | None = None, timeout: float | None = None) -> dict:
+        """Send a command and wait for its result
+
+        Args:
+            method (str): CDP method, e.g. `"Runtime.evaluate"`.
+            params (dict | None, optional): Command parameters. Defaults to None.
+            timeout (float | None, optional): Seconds to wait for the response. Defaults to `CDPConnection.timeout`.
+
+        Raises:
+            CDPError: The command failed or the connection is closed.
+            TimeoutException: No response within `timeout`.
+
+        Returns:
+            dict: The command's `result`
+        """
+        if self._closed:
+            raise CDPError("CDP connection is closed")
+        _id = next(self._ids)
+        done, slot = threading.Event(), []
+        self._pending[_id] = (done, slot)
+        try:
+            message = json.dumps({"id": _id, "method": method, "params": params or {}})
+            with self._send_lock:
+                self._ws.send(message)
+            if not done.wait(self.timeout if timeout is None else timeout):
+                raise exceptions.TimeoutException(f"No response to {method}")
+        except (websocket.WebSocketException, OSError) as e:
+            raise CDPError(f"{method} failed: {e}") from e
+        finally:
+            self._pending.pop(_id, None)
+
+        if not slot:
+            raise CDPError(f"CDP connection closed while waiting for {method}")
+        response = slot[0]
+        if "error" in response:
+            raise CDPError(f"{method}: {response['error'].get('message')}")
+        return response.get("result", {})
+
+    def send_nowait(self, method: str, params: dict | None = None) -> None:
+        """Send a command without waiting for its response, which is discarded
+
+        Unlike `send`, safe to call from `CDPConnection.on` callbacks.
+
+        Args:
+            method (str): CDP method, e.g. `"Fetch.continueRequest"`.
+            params (dict | None, optional): Command parameters. Defaults to None.
+
+        Raises:
+            CDPError: The connection is closed.
+        """
+        if self._closed:
+            raise CDPError("CDP connection is closed")
+        message = json.dumps({"id": next(self._ids), "method": method, "params": params or {}})
+        try:
+            with self._send_lock:
+                self._ws.send(message)
+        except (websocket.WebSocketException, OSError) as e:
+            raise CDPError(f"{method} failed: {e}") from e
+        return None
+
+    def evaluate(self, script: str, *args, timeout: float | None = None) -> Any:
+        """Run a JavaScript function body with `Runtime.evaluate`, like `driver.execute_script`
+
+        Args:
+            script (str): Function body; arguments are available as `arguments[i]`.
+            *args: JSON-serializable arguments.
+            timeout (float | None, optional): Seconds to wait for the result. Defaults to `CDPConnection.timeout`.
+
+        Raises:
+            JavascriptException: The script threw.
+
+        Returns:
+            Any: The script's return value, awaited if it is a promise
+        """
+        expression = f"(function () {{\n{script}\n}}).apply(null, {json.dumps(args)})"
+        response = self.send(
+            "Runtime.evaluate",
+            {"expression": expression, "returnByValue": True, "awaitPromise": True},
+            timeout=timeout,
+        )
+        if "exceptionDetails" in response:
+            details: dict = response["exceptionDetails"]
+            message = details.get("exception", {}).get("description") or details.get("text")
+            raise exceptions.JavascriptException(message)
+        return response["result"].get("value")
+
+    def on(self, event: str, callback: Callable[[dict], Any]) -> Callable[[], None]:
+        """Call `callback(params)` for every `event`, e.g. `"Network.requestWillBeSent"`
+
+        Events are only sent for enabled domains, e.g. after `send("Network.enable")`.\
+            Callbacks run on the reader thread and must not block on `send`; use `send_nowait`.
+
+        Args:
+            event (str): CDP event name.
+            callback (Callable[[dict], Any]): Receives the event's `params`.
+
+        Returns:
+            Callable[[], None]: Removes the callback
+        """
+        self._listeners[event].append(callback)
+        return lambda: self._listeners[event].remove(callback)
+
+    def close(self) -> None:
+        """Close the websocket. The tab itself stays open."""
+        self._closed = True
+        try:
+            self._ws.close()
+        except websocket.WebSocketException:
+            pass
+        return None
+
+    def _read_loop(self) -> None:
+        while not self._closed:
+            try:
+                raw = self._ws.recv()
+            except (websocket.WebSocketException, OSError):
+                break
+            if not raw:
+                continue
+            message: dict = json.loads(raw)
+            if "id" in message:
+                pending = self._pending.get(message["id"])
+                if pending is not None:
+                    pending[1].append(message)
+                    pending[0].set()
+                continue
+            for callback in list(self._listeners.get(message.get("method", ""), ())):
+                try:
+                    callback(message.get("params", {}))
+                except Exception:
+                    pass  # A failing listener must not stop the reader
+
+        self._closed = True
+        for done, _ in list(self._pending.values()):
+            done.set()
+        return None
@@ -1,14 +1,19 @@
 import logging
 import os
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Literal
 
-from ak_requests.utils import latest_useragent
-from helium import start_chrome
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
-from ak_selenium.browser import Browser
+from ak_selenium.browser import Browser, Locator
+from ak_selenium.context import BrowserContext
+from ak_selenium.network import ResourcePolicy
+from ak_selenium.profiles import ProfileClone, ProfileTemplate
+from ak_selenium.tabs import TabResult, TabScheduler
 
 # Disable webdriver-manager logs per https://github.com/SergeyPirogov/webdriver_manager#wdm_log
 os.environ["WDM_LOG"] = str(logging.NOTSET)
@@ -25,6 +30,9 @@ class Chrome(Browser):
         headless: bool = False,
         chrome_userdata_path: str | None = None,
         half_screen: bool = True,
+        page_load_strategy: Literal["normal", "eager", "none"] = "normal",
+        resource_policy: ResourcePolicy | None = None,
+        profile_template: ProfileTemplate | str | None = None,
     ) -> None:
         """Initialize a chrome instance
 
@@ -32,26 +40,52 @@ class Chrome(Browser):
             headless (bool, optional): Start in headless mode. Defaults to False.
             chrome_userdata_path (str | None, optional): existing `userdata` path. Defaults to None.
             half_screen (bool, optional): split to half-screen width. Defaults to True.
+            page_load_strategy (Literal["normal", "eager", "none"], optional): When `get` returns control:\
+                after the load event, after DOMContentLoaded, or right away. Defaults to "normal".
+            resource_policy (ResourcePolicy | None, optional): Requests to block. Defaults to `ResourcePolicy.default()` (images).
+            profile_template (ProfileTemplate | str | None, optional): Start from a private clone of this template\
+                instead of `chrome_userdata_path`; the clone is deleted with the `Chrome` object. Defaults to None.
 
         Returns:
             None
         """
 
-        _useragent: str = latest_useragent("Chrome")
+        _useragent: str = self.USERAGENT_RESOLVER.resolve("Chrome")
         if _useragent != "":
             self.USERAGENT = _useragent
 
+        self.profile_clone: ProfileClone | None = None
+        """Private copy of `profile_template` used as the user data dir"""
+        if profile_template is not None:
+            if chrome_userdata_path:
+                raise ValueError("Pass either `chrome_userdata_path` or `profile_template`, not both")
+            if not isinstance(profile_template, ProfileTemplate):
+                profile_template = ProfileTemplate(profile_template)
+            self.profile_clone = profile_template.clone()
+            chrome_userdata_path = str(self.profile_clone.path)
+
         self.headless = headless
         self.half_screen = half_screen
         self.chrome_userdata_path = chrome_userdata_path
+        self.page_load_strategy = page_load_strategy
+        self._resource_policy: ResourcePolicy = (
+            ResourcePolicy.default() if resource_policy is None else resource_policy
+        )
 
         self.driver: webdriver.Chrome = self._driver()
         super().__init__(driver=self.driver)
-        self._prep_driver(useragent=self.USERAGENT)
+        self._prepare()
+        return None
 
-        if half_screen:
+    def _prepare(self) -> None:
+        self._prep_driver(useragent=self.USERAGENT)  # Also applies the resource policy
+
+        if self.half_screen:
             self.halfscreen()
-        return None
+
+    def _launch(self) -> None:
+        self.driver = self._driver()
+        self._prepare()
 
     def _set_userdata_path(self, datapath: str | None) -> str | None:
         self.chrome_userdata_path: str | None = None
@@ -81,7 +115,8 @@ class Chrome(Browser):
     def __repr__(self) -> str:
         return f"Chrome(headless={self.headless},\
                 chrome_userdata_path={self.chrome_userdata_path},\
-                half_screen={self.half_screen})"
+                half_screen={self.half_screen},\
+                page_load_strategy={self.page_load_strategy})"
 
     def _driver(self) -> webdriver.Chrome:
         """
@@ -90,9 +125,16 @@ class Chrome(Browser):
         Returns:
             webdriver.Chrome: The initialized Chrome driver object.
         """
-        driver = start_chrome(
+        from helium._impl import APIImpl
+
+        from ak_selenium.helium_attribs import set_global_driver
+
+        # Started through a private Helium API object, so threads starting browsers never
+        # write Helium's global while a bound element has swapped it
+        driver = APIImpl().start_chrome_impl(
             url=None, headless=self.headless, maximize=False, options=self.options
         )
+        set_global_driver(driver)
         driver = self.__inject_antidetection_script(driver=driver)
         return driver  # type: ignore
 
@@ -105,6 +147,12 @@ class Chrome(Browser):
             options.add_argument("--headless")
             options.add_argument("--window-size=1920,1080")
         options.add_argument("start-maximized")
+        options.page_load_strategy = self.page_load_strategy
+        if self.NETWORK_EVENTS:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            options.add_experimental_option(
+                "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+            )
         options.add_experimental_option("excludeSwitches", ["enable-logging"])
         options.add_experimental_option("useAutomationExtension", False)
 
@@ -117,15 +165,117 @@ class Chrome(Browser):
             options.add_argument("--user-data-dir=" + self.chrome_userdata_path)
 
         options = self.__ram_optimization_browser_options(options)
-        options = self.__options_override_javascript_variables(options=options)
+        options = self.__options_override_javascript_variables(
+            options=options, block_images="image" in self._resource_policy.types
+        )
         return options
 
+    def new_context(self, useragent: str | None = None) -> BrowserContext:
+        """Create an isolated browser context in this Chrome process
+
+        Contexts have their own cookies, storage and useragent and their own `session`, at a\
+            fraction of the memory and startup cost of another `Chrome()`.
+
+        Example:
+            ```python
+            with chrome.new_context(useragent="Mozilla/5.0 ...") as alice:
+                alice.get("https://example.com/login")
+                alice.session.get("https://example.com/api/me")
+            ```
+
+        Args:
+            useragent (str | None, optional): Useragent of the context. Defaults to `Chrome.USERAGENT`.
+
+        Returns:
+            BrowserContext: The new context. Dispose of it with `BrowserContext.close`.
+        """
+        self._pin_window()
+        context = BrowserContext(self, useragent=useragent)
+        self._reserved_handles.add(context._window_handle)  # type: ignore[arg-type]
+        return context
+
+    def fetch_tabs(
+        self,
+        urls: Iterable[str],
+        tabs: int = 4,
+        wait_until: Literal["domcontentloaded", "load"] | Locator = "load",
+        extract: Callable[[Browser], Any] | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[TabResult]:
+        """Load several pages concurrently in background tabs and yield them in the order they become ready
+
+        Overlaps the network waits of up to `tabs` pages without starting more browser processes.\
+            Cookies are shared with this browser. See `TabScheduler` for details.
+
+        Example:
+            ```python
+            for result in chrome.fetch_tabs(urls, tabs=6, extract=lambda tab: tab.extract({"title": "h1"})):
+                if result.ok:
+                    print(result.url, result.value["title"])
+            ```
+
+        Args:
+            urls (Iterable[str]): Urls to load.
+            tabs (int, optional): Maximum number of tabs loading at once. Defaults to 4.
+            wait_until (Literal["domcontentloaded", "load"] | Locator, optional): When a tab counts as ready. Defaults to "load".
+            extract (Callable[[Browser], Any] | None, optional): Called with a `Browser` bound to the ready tab. Defaults to returning the page source.
+            timeout (float | None, optional): Seconds a tab may take to become ready. Defaults to `Browser.MAX_WAIT_TIME`.
+
+        Yields:
+            TabResult: One result per url
+        """
+        scheduler = TabScheduler(
+            self, tabs=tabs, wait_until=wait_until, extract=extract, timeout=timeout
+        )
+        yield from scheduler.run(urls)
+
+    @property
+    def resource_policy(self) -> ResourcePolicy:
+        """Requests blocked through CDP `Network.setBlockedURLs`. Assigning a new policy applies it to the following requests.
+
+        The policy is sent to every window of this Chrome open at that time (`fetch_tabs` tabs\
+            get it when they open); browser contexts start with the policy in force when they\
+            are created. Images blocked by the startup policy are also disabled through a content setting,\
+            which stays in effect for the lifetime of the browser.
+        """
+        return self._resource_policy
+
+    @resource_policy.setter
+    def resource_policy(self, policy: ResourcePolicy) -> None:
+        policy.blocked_urls()  # Validate before anything is applied
+        self._resource_policy = policy
+        self._apply_resource_policy()
+
+    @contextmanager
+    def blocking(self, policy: ResourcePolicy) -> Iterator[ResourcePolicy]:
+        """Apply a resource policy for the duration of the block, e.g. for a single navigation
+
+        Example:
+            ```python
+            with chrome.blocking(ResourcePolicy(types={"image", "font"}, url_patterns=ResourcePolicy.TRACKERS)):
+                chrome.get("https://example.com")
+            ```
+
+        Args:
+            policy (ResourcePolicy): Policy to apply.
+
+        Yields:
+            ResourcePolicy: The applied policy
+        """
+        previous = self.resource_policy
+        self.resource_policy = policy
+        try:
+            yield policy
+        finally:
+            self.resource_policy = previous
+
     @staticmethod
-    def __options_override_javascript_variables(options: Options):
+    def __options_override_javascript_variables(options: Options, block_images: bool = True):
+        if block_images:
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
         # Override JavaScript Variables: Many websites check navigator.webdriver. Override it to avoid detection:
-        options.add_experimental_option(
-            "prefs", {"profile.managed_default_content_settings.images": 2}
-        )
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--enable-blink-features=ShadowDOMV0")
         return options
@@ -0,0 +1,74 @@
+from typing import TYPE_CHECKING
+
+from ak_selenium.browser import Browser
+
+if TYPE_CHECKING:
+    from ak_selenium.chrome import Chrome
+
+
+class BrowserContext(Browser):
+    """An isolated "virtual browser" inside a running Chrome, created with CDP `Target.createBrowserContext`
+
+    Each context has its own cookies, storage, cache and useragent, and its own
+    `Browser.session` bridge to `RequestsSession`, but shares the Chrome process and its
+    WebDriver connection with the parent. Commands switch to the context's window as needed,
+    so contexts and the parent can be used in turn, but not concurrently from several threads.
+
+    Create contexts with `Chrome.new_context`.
+    """
+
+    def __init__(self, parent: "Chrome", useragent: str | None = None) -> None:
+        """Create a browser context with one window
+
+        Args:
+            parent (Chrome): Chrome instance to create the context in.
+            useragent (str | None, optional): Useragent of the context. Defaults to the parent's.
+        """
+        self.parent = parent
+        self.USERAGENT: str = useragent or parent.USERAGENT
+
+        driver = parent.driver
+        known_handles = set(driver.window_handles)
+        self.context_id: str = driver.execute_cdp_cmd(
+            "Target.createBrowserContext", {}
+        )["browserContextId"]
+        target_id: str = driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": self.context_id}
+        )["targetId"]
+        new_handles = [h for h in driver.window_handles if h not in known_handles]
+        handle = target_id if target_id in new_handles else new_handles[0]
+
+        super().__init__(driver=driver)
+        self._window_handle = handle
+        self._resource_policy = parent.resource_policy
+        self._prep_driver(useragent=self.USERAGENT)
+        return None
+
+    def __str__(self) -> str:
+        return f"""
+        BrowserContext.Object
+        Context Id: {self.context_id}
+        UserAgent:{self.USERAGENT}
+        Window: {self._window_handle}
+        """
+
+    def __repr__(self) -> str:
+        return f"BrowserContext(parent={self.parent!r},\
+                useragent={self.USERAGENT})"
+
+    def __enter__(self) -> "BrowserContext":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Dispose of the context, closing its window and discarding its cookies and storage"""
+        self.parent.driver.execute_cdp_cmd(
+            "Target.disposeBrowserContext", {"browserContextId": self.context_id}
+        )
+        self.parent._reserved_handles.discard(self._window_handle)  # type: ignore[arg-type]
+        return None
+
+    def _owned_handles(self, handles: list[str]) -> list[str]:
+        return [self._window_handle]  # type: ignore[list-item]
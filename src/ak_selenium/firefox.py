@@ -1,11 +1,11 @@
 import logging
 import os
+from typing import Any, ClassVar, Literal
 
-from ak_requests.utils import latest_useragent
-from helium import start_firefox
 from selenium import webdriver
 
 from ak_selenium.browser import Browser
+from ak_selenium.network import ResourcePolicy
 
 # Disable webdriver-manager logs per https://github.com/SergeyPirogov/webdriver_manager#wdm_log
 os.environ["WDM_LOG"] = str(logging.NOTSET)
@@ -16,28 +16,95 @@ class Firefox(Browser):
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/120.0"
     )
 
+    PERFORMANCE_PREFS: ClassVar[dict[str, Any]] = {
+        # Caches and session history kept in memory only, and small
+        "browser.cache.disk.enable": False,
+        "browser.cache.offline.enable": False,
+        "browser.sessionhistory.max_total_viewers": 0,
+        "browser.sessionstore.resume_from_crash": False,
+        "browser.sessionstore.max_tabs_undo": 0,
+        # No prefetching or speculative connections
+        "network.prefetch-next": False,
+        "network.dns.disablePrefetch": True,
+        "network.predictor.enabled": False,
+        "network.http.speculative-parallel-limit": 0,
+        "browser.urlbar.speculativeConnect.enabled": False,
+        # No telemetry, studies or background services
+        "toolkit.telemetry.enabled": False,
+        "toolkit.telemetry.unified": False,
+        "toolkit.telemetry.archive.enabled": False,
+        "datareporting.healthreport.uploadEnabled": False,
+        "datareporting.policy.dataSubmissionEnabled": False,
+        "app.shield.optoutstudies.enabled": False,
+        "app.normandy.enabled": False,
+        "app.update.auto": False,
+        "extensions.update.enabled": False,
+        "extensions.pocket.enabled": False,
+        "browser.safebrowsing.malware.enabled": False,
+        "browser.safebrowsing.phishing.enabled": False,
+        "browser.safebrowsing.downloads.enabled": False,
+        "browser.newtabpage.enabled": False,
+        "browser.startup.page": 0,
+        "browser.shell.checkDefaultBrowser": False,
+        # At most two content processes, without one per site
+        "dom.ipc.processCount": 2,
+        "fission.autostart": False,
+        # Same as Chrome's --disable-gpu and --disable-3d-apis
+        "layers.acceleration.disabled": True,
+        "webgl.disabled": True,
+    }
+    """Prefs set on every profile to cut memory, bandwidth and background work. Copy and extend\
+        the dict in a subclass to change them, e.g. a higher `dom.ipc.processCount`."""
+
     def __init__(
         self,
         headless: bool = False,
         userdata_path: str | None = None,
         half_screen: bool = True,
+        page_load_strategy: Literal["normal", "eager", "none"] = "normal",
+        resource_policy: ResourcePolicy | None = None,
     ) -> None:
+        """Initialize a firefox instance
+
+        Args:
+            headless (bool, optional): Start in headless mode. Defaults to False.
+            userdata_path (str | None, optional): existing `userdata` path. Defaults to None.
+            half_screen (bool, optional): split to half-screen width. Defaults to True.
+            page_load_strategy (Literal["normal", "eager", "none"], optional): When `get` returns control:\
+                after the load event, after DOMContentLoaded, or right away. Defaults to "normal".
+            resource_policy (ResourcePolicy | None, optional): Requests to block, applied as profile prefs.\
+                Defaults to `ResourcePolicy.default()` (images).
+
+        Returns:
+            None
+        """
 
-        _useragent: str = latest_useragent("Firefox")
+        _useragent: str = self.USERAGENT_RESOLVER.resolve("Firefox")
         if _useragent != "":
             self.USERAGENT = _useragent
 
         self.headless = headless
         self.half_screen = half_screen
         self.userdata_path = userdata_path
+        self.page_load_strategy = page_load_strategy
+        self._resource_policy: ResourcePolicy = (
+            ResourcePolicy.default() if resource_policy is None else resource_policy
+        )
 
         self.driver: webdriver.Firefox = self._driver()
         super().__init__(driver=self.driver)
+        self._prepare()
+        return None
+
+    def _prepare(self) -> None:
         self._prep_driver(useragent=self.USERAGENT)
 
-        if half_screen:
+        if self.half_screen:
             self.halfscreen()
-        return None
+
+    def _launch(self) -> None:
+        self.driver = self._driver()
+        self._prepare()
 
     def __str__(self) -> str:
         return f"""
@@ -53,7 +120,8 @@ class Firefox(Browser):
     def __repr__(self) -> str:
         return f"Firefox(headless={self.headless},\
                 userdata_path={self.userdata_path},\
-                half_screen={self.half_screen})"
+                half_screen={self.half_screen},\
+                page_load_strategy={self.page_load_strategy})"
 
     def _driver(self) -> webdriver.Firefox:
         """
@@ -62,15 +130,36 @@ class Firefox(Browser):
         Returns:
             webdriver.Firefox: The initialized Chrome driver object.
         """
-        driver = start_firefox(
+        from helium._impl import APIImpl
+
+        from ak_selenium.helium_attribs import set_global_driver
+
+        # See `Chrome._driver`
+        driver = APIImpl().start_firefox_impl(
             url=None, headless=self.headless, options=self.options, profile=self.profile
         )
+        set_global_driver(driver)
         return driver  # type: ignore
 
+    @property
+    def resource_policy(self) -> ResourcePolicy:
+        """Requests blocked through profile prefs, see `ResourcePolicy.firefox_prefs`
+
+        Prefs are read when Firefox starts, so unlike `Chrome.resource_policy` the policy\
+            cannot be changed on a running browser.
+        """
+        return self._resource_policy
+
     @property
     def profile(self) -> webdriver.FirefoxProfile:
+        """Fresh profile with `PERFORMANCE_PREFS`, the resource policy and the useragent"""
         profile = webdriver.FirefoxProfile()
-        profile.set_preference("general.useragent.override", self.USERAGENT)
+        for key, value in {
+            **self.PERFORMANCE_PREFS,
+            **self._resource_policy.firefox_prefs(),
+            "general.useragent.override": self.USERAGENT,
+        }.items():
+            profile.set_preference(key, value)
         return profile
 
     @property
@@ -81,5 +170,6 @@ class Firefox(Browser):
             options.add_argument("--width=1920")
             options.add_argument("--height=1080")
         options.add_argument("start-maximized")
+        options.page_load_strategy = self.page_load_strategy
 
         return options
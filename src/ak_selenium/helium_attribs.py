@@ -1,14 +1,91 @@
-from typing import Literal
+import functools
+import threading
+from typing import TYPE_CHECKING, Literal
 
 import helium
+from helium._impl import APIImpl
 from typing import Callable
 
+if TYPE_CHECKING:
+    from ak_selenium.browser import Browser
+
+_API_SWAP_LOCK = threading.Lock()
+
+
+def set_global_driver(driver) -> None:
+    """Make `driver` Helium's global driver, used by the module-level `Element` and `Action`
+
+    Taken under `_API_SWAP_LOCK`, so it never lands on a browser's own `APIImpl` that\
+        `HeliumBinding.element` has installed as Helium's global for a moment.
+    """
+    with _API_SWAP_LOCK:
+        helium.set_driver(driver)
+    return None
+
+
+class HeliumBinding:
+    """Routes Helium calls to one browser's own Helium API object instead of Helium's global driver
+
+    Helium keeps a single module-level driver, so `helium.click(...)` and `helium.Button(...)`\
+        from two threads act on whichever browser was started last. A binding owns a separate\
+        `helium._impl.APIImpl` for its browser: actions call it directly, and elements are\
+        constructed while it is briefly installed as Helium's global under a lock.
+
+    Without a browser the binding passes Helium's global functions and classes through unchanged.
+    """
+
+    def __init__(self, browser: "Browser | None" = None) -> None:
+        self.browser = browser
+        self.api: APIImpl | None = None
+        if browser is not None:
+            self.api = APIImpl()
+            self.api.set_driver_impl(browser._webdriver)
+        return None
+
+    def element(self, element_class: type) -> Callable:
+        """Constructor of `element_class` whose instances use this binding's browser"""
+        if self.api is None:
+            return element_class
+
+        @functools.wraps(element_class, updated=())
+        def create(*args, **kwargs):
+            self.browser.driver  # Switch to the browser's window when the driver is shared
+            with _API_SWAP_LOCK:
+                previous = helium._API_IMPL
+                helium._API_IMPL = self.api
+                try:
+                    return element_class(*args, **kwargs)
+                finally:
+                    helium._API_IMPL = previous
+
+        return create
+
+    def action(self, function: Callable, impl_name: str) -> Callable:
+        """`function` acting on this binding's browser, through the `APIImpl` method `impl_name`"""
+        if self.api is None:
+            return function
+        impl = getattr(self.api, impl_name)
+
+        @functools.wraps(function)
+        def call(*args, **kwargs):
+            self.browser.driver  # Switch to the browser's window when the driver is shared
+            return impl(*args, **kwargs)
+
+        return call
+
 
 class HeliumElements:
-    def __init__(self) -> None:
-        self.Alert: helium.Alert = helium.Alert
+    def __init__(self, binding: HeliumBinding | None = None) -> None:
+        """Helium element selectors
+
+        Args:
+            binding (HeliumBinding | None, optional): Browser the elements belong to.\
+                Defaults to None (Helium's global driver).
+        """
+        bind = binding or HeliumBinding()
+        self.Alert: helium.Alert = bind.element(helium.Alert)
         """Lets you identify and interact with JavaScript alert boxes."""
-        self.Button: helium.Button = helium.Button
+        self.Button: helium.Button = bind.element(helium.Button)
         """
 	Lets you identify a button on a web page. A typical usage of ``Button`` is::
 
@@ -26,7 +103,7 @@ class HeliumElements:
 
 		click(Button("Log In", below=TextField("Password")))
 	"""
-        self.CheckBox: helium.CheckBox = helium.CheckBox
+        self.CheckBox: helium.CheckBox = bind.element(helium.CheckBox)
         """
 	Lets you identify a check box on a web page. To tick a currently unselected
 	check box, use::
@@ -46,7 +123,7 @@ class HeliumElements:
 
 		click(CheckBox("Stay signed in", below=Button("Sign in")))
 	"""
-        self.ComboBox: helium.ComboBox = helium.ComboBox
+        self.ComboBox: helium.ComboBox = bind.element(helium.ComboBox)
         """
 	Lets you identify a combo box on a web page. This can for instance be used
 	to determine the current value of a combo box::
@@ -66,7 +143,7 @@ class HeliumElements:
 
 	This sets the Status of John Doe to Active on the page.
 	"""
-        self.Image: helium.Image = helium.Image
+        self.Image: helium.Image = bind.element(helium.Image)
         """
 	Lets you identify an image (HTML ``<img>`` element) on a web page.
 	Typically, this is done via the image's alt text. For instance::
@@ -85,7 +162,7 @@ class HeliumElements:
 
 		click(Image("Helium Logo", to_left_of=ListItem("Download")))
 	"""
-        self.Link: helium.Link = helium.Link
+        self.Link: helium.Link = bind.element(helium.Link)
         """
 	Lets you identify a link on a web page. A typical usage of ``Link`` is::
 
@@ -103,7 +180,7 @@ class HeliumElements:
 
 		click(Link("Block User", to_right_of="John Doe"))
 	"""
-        self.ListItem: helium.ListItem = helium.ListItem
+        self.ListItem: helium.ListItem = bind.element(helium.ListItem)
         """
 	Lets you identify a list item (HTML ``<li>`` element) on a web page. This is
 	often useful for interacting with elements of a navigation bar::
@@ -122,7 +199,7 @@ class HeliumElements:
 
 		click(ListItem("List item 1", below="My first list:"))
 	"""
-        self.RadioButton: helium.RadioButton = helium.RadioButton
+        self.RadioButton: helium.RadioButton = bind.element(helium.RadioButton)
         """
 	Lets you identify a radio button on a web page. To select a currently
 	unselected radio button, use::
@@ -142,7 +219,7 @@ class HeliumElements:
 
 		click(RadioButton("I accept", below="License Agreement"))
 	"""
-        self.Text: helium.Text = helium.Text
+        self.Text: helium.Text = bind.element(helium.Text)
         """
 	Lets you identify any text or label on a web page. This is most useful for
 	checking whether a particular text exists::
@@ -160,7 +237,7 @@ class HeliumElements:
 	and ``to_left_of`` can be used to search for texts above and to the left of
 	other web elements.
 	"""
-        self.TextField: helium.TextField = helium.TextField
+        self.TextField: helium.TextField = bind.element(helium.TextField)
         """
 	Lets you identify a text field on a web page. This is most typically done to
 	read the value of a text field. For example::
@@ -176,7 +253,7 @@ class HeliumElements:
 
 		TextField("Address line 1", below="Billing Address:").value
 	"""
-        self.find_all: Callable = helium.find_all
+        self.find_all: Callable = bind.action(helium.find_all, "find_all_impl")
         """
 	Lets you find all occurrences of the given GUI element predicate. For
 	instance, the following statement returns a list of all buttons with label
@@ -210,8 +287,13 @@ class HeliumElements:
 
 
 class MouseActions:
-    def __init__(self) -> None:
-        self.click: Callable = helium.click
+    def __init__(self, binding: HeliumBinding | None = None) -> None:
+        bind = binding or HeliumBinding()
+        self._scroll_up: Callable = bind.action(helium.scroll_up, "scroll_up_impl")
+        self._scroll_down: Callable = bind.action(helium.scroll_down, "scroll_down_impl")
+        self._scroll_left: Callable = bind.action(helium.scroll_left, "scroll_left_impl")
+        self._scroll_right: Callable = bind.action(helium.scroll_right, "scroll_right_impl")
+        self.click: Callable = bind.action(helium.click, "click_impl")
         """
 	:param element: The element or point to click.
 	:type element: str, unicode, :py:class:`HTMLElement`, \
@@ -224,7 +306,7 @@ class MouseActions:
 		click(Point(200, 300))
 		click(ComboBox("File type").top_left + (50, 0))
 	"""
-        self.doubleclick: Callable = helium.doubleclick
+        self.doubleclick: Callable = bind.action(helium.doubleclick, "doubleclick_impl")
         """
 	:param element: The element or point to click.
 	:type element: str, unicode, :py:class:`HTMLElement`, \
@@ -237,7 +319,7 @@ class MouseActions:
 		doubleclick(Point(200, 300))
 		doubleclick(TextField("Username").top_left - (0, 20))
 	"""
-        self.drag: Callable = helium.drag
+        self.drag: Callable = bind.action(helium.drag, "drag_impl")
         """
 	:param element: The element or point to drag.
 	:type element: str, unicode, :py:class:`HTMLElement`, \
@@ -258,9 +340,9 @@ class MouseActions:
 	If you wish to drag a file from the hard disk onto the browser window (eg.
 	to initiate a file upload), use function :py:func:`drag_file`.
 	"""
-        self.press_mouse_on: Callable = helium.press_mouse_on
-        self.release_mouse_over: Callable = helium.release_mouse_over
-        self.rightclick: Callable = helium.rightclick
+        self.press_mouse_on: Callable = bind.action(helium.press_mouse_on, "press_mouse_on_impl")
+        self.release_mouse_over: Callable = bind.action(helium.release_mouse_over, "release_mouse_over_impl")
+        self.rightclick: Callable = bind.action(helium.rightclick, "rightclick_impl")
         """
 	:param element: The element or point to click.
 	:type element: str, unicode, :py:class:`HTMLElement`, \
@@ -273,21 +355,21 @@ class MouseActions:
 		rightclick(Image("captcha"))
 	"""
 
-    @staticmethod
     def scroll(
+        self,
         direction: Literal["up", "down", "left", "right"] = "down",
         num_pixels: int = 100,
     ):
         """Scrolls in the specified direction, for the given number of pixels"""
         match direction.casefold().strip():
             case "up":
-                helium.scroll_up(num_pixels=num_pixels)
+                self._scroll_up(num_pixels=num_pixels)
             case "down":
-                helium.scroll_down(num_pixels=num_pixels)
+                self._scroll_down(num_pixels=num_pixels)
             case "left":
-                helium.scroll_left(num_pixels=num_pixels)
+                self._scroll_left(num_pixels=num_pixels)
             case "right":
-                helium.scroll_right(num_pixels=num_pixels)
+                self._scroll_right(num_pixels=num_pixels)
 
     def __str__(self) -> str:
         return "Collection of Mouse Actions from `helium` module"
@@ -297,8 +379,15 @@ class MouseActions:
 
 
 class HeliumActions:
-    def __init__(self):
-        self.highlight = helium.highlight
+    def __init__(self, binding: HeliumBinding | None = None):
+        """Helium actions
+
+        Args:
+            binding (HeliumBinding | None, optional): Browser the actions act on.\
+                Defaults to None (Helium's global driver).
+        """
+        bind = binding or HeliumBinding()
+        self.highlight = bind.action(helium.highlight, "highlight_impl")
         """
 	:param element: The element to highlight.
 
@@ -308,7 +397,7 @@ class HeliumActions:
 		highlight("Helium")
 		highlight(Button("Sign in"))
 	"""
-        self.wait_until = helium.wait_until
+        self.wait_until = bind.action(helium.wait_until, "wait_until_impl")
         """
 	:param condition_fn: A function taking no arguments that represents the \
 	condition to be waited for.
@@ -333,12 +422,12 @@ class HeliumActions:
 	``interval_secs`` specifies the number of seconds Helium waits between
 	evaluating the condition function.
 	"""
-        self.refresh = helium.refresh
+        self.refresh = bind.action(helium.refresh, "refresh_impl")
         """
 	Refreshes the current page. If an alert dialog is open, then Helium first
 	closes it.
 	"""
-        self.attach_file = helium.attach_file
+        self.attach_file = bind.action(helium.attach_file, "attach_file_impl")
         """
 	:param file_path: The path of the file to be attached.
 	:param to: The file input element to which the file should be attached.
@@ -351,7 +440,7 @@ class HeliumActions:
 	parameter, then Helium attaches the file to the first file input element it
 	finds on the page.
 	"""
-        self.drag_file = helium.drag_file
+        self.drag_file = bind.action(helium.drag_file, "drag_file_impl")
         """
 	Simulates the dragging of a file from the computer over the browser window
 	and dropping it over the given element. This allows, for example, to attach
@@ -362,7 +451,7 @@ class HeliumActions:
 		write("Email subject", into="Subject")
 		drag_file(r"C:\\Documents\\notes.txt", to="Drop files here")
 	"""
-        self.combobox_select = helium.select
+        self.combobox_select = bind.action(helium.select, "select_impl")
         """
 	:param combo_box: The combo box whose value should be changed.
 	:type combo_box: str, unicode or :py:class:`ComboBox`
@@ -373,7 +462,7 @@ class HeliumActions:
 		select("Language", "English")
 		select(ComboBox("Language"), "English")
 	"""
-        self.hover = helium.hover
+        self.hover = bind.action(helium.hover, "hover_impl")
         """
 	:param element: The element or point to hover.
 	:type element: str, unicode, :py:class:`HTMLElement`, \
@@ -387,8 +476,8 @@ class HeliumActions:
 		hover(Point(200, 300))
 		hover(ComboBox("File type").top_left + (50, 0))
 	"""
-        self.Mouse: MouseActions = MouseActions()
-        self.write = helium.write
+        self.Mouse: MouseActions = MouseActions(bind)
+        self.write = bind.action(helium.write, "write_impl")
         """
 	:param text: The text to be written.
 	:type text: one of str, unicode
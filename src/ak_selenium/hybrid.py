@@ -0,0 +1,309 @@
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Literal
+from urllib.parse import urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+from ak_selenium import js
+from ak_selenium.browser import Browser, Locator, default_soup_parser
+
+Route = Literal["session", "browser"]
+
+Detector = Callable[[requests.Response], str | None]
+"""Inspects a `RequestsSession` response and returns why the browser is needed, or None"""
+
+CHALLENGE_MARKERS: tuple[str, ...] = (
+    "cf-browser-verification",
+    "/cdn-cgi/challenge-platform/",
+    "<title>just a moment...</title>",
+    "<title>attention required! | cloudflare</title>",
+    "_incapsula_resource",
+    "px-captcha",
+    "captcha-delivery.com",
+    "checking your browser before accessing",
+    "enable javascript and cookies to continue",
+)
+"""Lower-case snippets of common bot-challenge and interstitial pages"""
+
+
+def challenge_markers(*markers: str, scan_bytes: int = 65536) -> Detector:
+    """Fire when the body contains a bot-challenge marker
+
+    Args:
+        *markers (str): Case-insensitive snippets to look for. Defaults to `CHALLENGE_MARKERS`.
+        scan_bytes (int, optional): Only the start of the body is scanned. Defaults to 65536.
+    """
+    needles = tuple(marker.lower() for marker in markers or CHALLENGE_MARKERS)
+
+    def detect(response: requests.Response) -> str | None:
+        head = response.text[:scan_bytes].lower()
+        for needle in needles:
+            if needle in head:
+                return f"challenge marker {needle!r}"
+        return None
+
+    return detect
+
+
+def blocked_status(codes: tuple[int, ...] = (401, 403, 429, 503)) -> Detector:
+    """Fire on status codes bot protection answers with"""
+
+    def detect(response: requests.Response) -> str | None:
+        return f"status {response.status_code}" if response.status_code in codes else None
+
+    return detect
+
+
+def small_body(min_bytes: int = 1024) -> Detector:
+    """Fire when the body is smaller than `min_bytes`, typical of an empty app shell"""
+
+    def detect(response: requests.Response) -> str | None:
+        size = len(response.content)
+        return f"body of {size} bytes" if size < min_bytes else None
+
+    return detect
+
+
+def missing_selectors(*selectors: str, parser: str | None = None) -> Detector:
+    """Fire when any CSS selector matches nothing, e.g. content rendered by JavaScript
+
+    Args:
+        *selectors (str): CSS selectors that must be present.
+        parser (str | None, optional): BeautifulSoup parser. Defaults to `default_soup_parser()`.
+    """
+
+    def detect(response: requests.Response) -> str | None:
+        soup = BeautifulSoup(response.text, parser or default_soup_parser())
+        for selector in selectors:
+            if soup.select_one(selector) is None:
+                return f"missing {selector!r}"
+        return None
+
+    return detect
+
+
+DEFAULT_DETECTORS: tuple[Detector, ...] = (blocked_status(), challenge_markers(), small_body())
+"""Detectors used when `HybridFetcher` is given none"""
+
+_VARIABLE_SEGMENT = re.compile(r"\d")
+
+
+def route_key(url: str, route_by: Literal["host", "path"] = "host") -> str:
+    """Key under which `HybridFetcher` remembers the route for `url`
+
+    `"host"` gives the host name. `"path"` adds the directory part of the path, with\
+        segments containing digits replaced by `*`, so `/product/123/reviews` and\
+        `/product/456/reviews` share the key `host/product/*/`.
+
+    Args:
+        url (str): Requested url.
+        route_by (Literal["host", "path"], optional): Granularity. Defaults to "host".
+
+    Returns:
+        str: Route key
+    """
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if route_by == "host":
+        return host
+    directory = parts.path.rsplit("/", 1)[0].split("/")
+    return (
+        host
+        + "/".join("*" if _VARIABLE_SEGMENT.search(segment) else segment for segment in directory)
+        + "/"
+    )
+
+
+@dataclass
+class FetchResult:
+    """Outcome of `HybridFetcher.fetch`"""
+
+    url: str
+    """Requested url"""
+    route: Route
+    """`"session"` if the page came from `RequestsSession`, `"browser"` if it was loaded in the browser"""
+    status: Literal["ok", "timeout", "error"] = "ok"
+    """`"timeout"`/`"error"` if the browser navigation failed, see `NavigationResult.status`"""
+    status_code: int | None = None
+    """HTTP status of the document, when known"""
+    html: str = ""
+    """Page source"""
+    reason: str | None = None
+    """Why the browser was used: the detector that fired, a request error, or `"remembered"`"""
+    error: str | None = None
+    """Error message when `status` is not `"ok"`"""
+    elapsed: float = 0.0
+    """Seconds from start to finish, including a discarded session attempt"""
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """Parsed `html`"""
+        return BeautifulSoup(self.html, default_soup_parser())
+
+
+@dataclass
+class HybridStats:
+    """Counters reported by `HybridFetcher.stats`"""
+
+    session: int = 0
+    """Pages served by `RequestsSession`"""
+    browser: int = 0
+    """Pages loaded in the browser"""
+    escalations: int = 0
+    """Session attempts discarded because a detector fired or the request failed"""
+
+
+class HybridFetcher:
+    """Fetches pages with the browser's `RequestsSession` and only falls back to the browser when needed
+
+    The session shares the browser's cookies and headers (see `Browser.session`). A fetch\
+        first tries the session; if the request fails or any detector fires, cookies the site\
+        set are pushed into the browser and the page is loaded there instead. The outcome is\
+        remembered per route key (see `route_key`): keys that needed the browser go straight\
+        to it from then on, keys that worked keep using the session, and are switched over\
+        as soon as a detector fires.
+
+    Example:
+        ```python
+        from ak_selenium import Chrome, HybridFetcher
+        from ak_selenium.hybrid import DEFAULT_DETECTORS, missing_selectors
+
+        fetcher = HybridFetcher(
+            Chrome(headless=True), detectors=[*DEFAULT_DETECTORS, missing_selectors(".price")]
+        )
+        page = fetcher.fetch("https://example.com/product/1", wait_until=".price")
+        print(page.route, page.reason, page.soup.select_one(".price"))
+        ```
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        detectors: list[Detector] | tuple[Detector, ...] | None = None,
+        route_by: Literal["host", "path"] | Callable[[str], str] = "host",
+        timeout: float | None = None,
+    ) -> None:
+        """Initialize a hybrid fetcher
+
+        Args:
+            browser (Browser): Browser to fall back to; its `session` is used for the cheap path.
+            detectors (list[Detector] | tuple[Detector, ...] | None, optional): Checks that send a page\
+                to the browser. Defaults to `DEFAULT_DETECTORS`.
+            route_by (Literal["host", "path"] | Callable[[str], str], optional): Granularity of the\
+                remembered routes, or a function mapping a url to its key. Defaults to "host".
+            timeout (float | None, optional): Seconds for the session request and for the browser's\
+                `wait_until`. Defaults to `Browser.MAX_WAIT_TIME`.
+        """
+        self.browser = browser
+        self.detectors = tuple(DEFAULT_DETECTORS if detectors is None else detectors)
+        self.route_by = route_by
+        self.timeout = browser.MAX_WAIT_TIME if timeout is None else timeout
+
+        self.routes: dict[str, Route] = {}
+        """Remembered route per key; edit to pin or forget a route"""
+        self.stats = HybridStats()
+        return None
+
+    def __str__(self) -> str:
+        return f"""
+        HybridFetcher.Object
+        Browser: {type(self.browser).__name__}
+        Routes: {len(self.routes)}
+        Session/Browser: {self.stats.session}/{self.stats.browser}
+        """
+
+    def __repr__(self) -> str:
+        return f"HybridFetcher({self.browser!r},\
+                route_by={self.route_by!r},\
+                timeout={self.timeout})"
+
+    def key(self, url: str) -> str:
+        """Route key of `url`"""
+        if callable(self.route_by):
+            return self.route_by(url)
+        return route_key(url, self.route_by)
+
+    def fetch(
+        self,
+        url: str,
+        wait_until: Literal["domcontentloaded", "load", "networkidle"] | Locator | None = None,
+    ) -> FetchResult:
+        """Fetch a page over the cheapest route that works for it
+
+        Args:
+            url (str): Url to fetch
+            wait_until (Literal["domcontentloaded", "load", "networkidle"] | Locator | None, optional):\
+                Completion condition when the browser is used, see `Browser.get`. Defaults to None.
+
+        Returns:
+            FetchResult: Page source and the route taken
+        """
+        if "://" not in url:
+            url = "https://" + url
+        key = self.key(url)
+        start = time.perf_counter()
+
+        if self.routes.get(key) == "browser":
+            return self._browser_fetch(url, wait_until, "remembered", start)
+
+        response, reason = self._session_fetch(url)
+        if response is not None and reason is None:
+            self.routes[key] = "session"
+            self.stats.session += 1
+            return FetchResult(
+                url=url,
+                route="session",
+                status_code=response.status_code,
+                html=response.text,
+                elapsed=time.perf_counter() - start,
+            )
+
+        self.routes[key] = "browser"
+        self.stats.escalations += 1
+        self.browser.push_cookies()  # Keep cookies the site set, e.g. a challenge token
+        return self._browser_fetch(url, wait_until, reason or "request failed", start)
+
+    def _session_fetch(self, url: str) -> tuple[requests.Response | None, str | None]:
+        """Request `url` with the session and run the detectors: `(response, reason to escalate)`"""
+        try:
+            response: requests.Response | None = self.browser.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            return None, f"request failed: {e}"
+        if response is None:  # `RequestsSession.RAISE_ERRORS` is off
+            return None, "request failed"
+        for detect in self.detectors:
+            reason = detect(response)
+            if reason is not None:
+                return response, reason
+        return response, None
+
+    def _browser_fetch(
+        self,
+        url: str,
+        wait_until: Literal["domcontentloaded", "load", "networkidle"] | Locator | None,
+        reason: str,
+        start: float,
+    ) -> FetchResult:
+        self.stats.browser += 1
+        navigation = self.browser.get(url, wait_until=wait_until, timeout=self.timeout)
+        result = FetchResult(
+            url=url,
+            route="browser",
+            status=navigation.status,
+            status_code=navigation.http_status,
+            reason=reason,
+            error=navigation.error,
+        )
+        if navigation.ok:
+            result.html = self.browser._script(js.VERSIONED_SOURCE, None)["html"]
+        result.elapsed = time.perf_counter() - start
+        return result
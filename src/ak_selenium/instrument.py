@@ -0,0 +1,354 @@
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+import selenium
+
+CommandSink = Callable[["CommandRecord"], None]
+"""Receives one `CommandRecord` per WebDriver command"""
+
+_SELENIUM_DIR = os.path.dirname(selenium.__file__) + os.sep
+_PACKAGE_DIR = os.path.dirname(__file__) + os.sep
+
+
+@dataclass
+class CommandRecord:
+    """One WebDriver command sent through an instrumented command executor"""
+
+    command: str
+    """Selenium command name, e.g. `"get"`, `"w3cExecuteScript"`, `"findElement"`, `"executeCdpCommand"`"""
+    start: float
+    """`time.time()` when the command was sent"""
+    duration: float
+    """Seconds until the response was parsed"""
+    request_bytes: int | None = None
+    """Size of the JSON request body, when measured"""
+    response_bytes: int | None = None
+    """Size of the response body, when measured"""
+    api: str | None = None
+    """Outermost ak_selenium function that issued the command, e.g. `"Browser.session"`"""
+    call_site: str | None = None
+    """`file:line in function` of the first caller outside ak_selenium and selenium"""
+    error: str | None = None
+    """Exception raised by the executor, if any"""
+
+
+def _caller(frame) -> tuple[str | None, str | None]:
+    """`(api, call_site)` for a command issued from `frame`"""
+    api = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_PACKAGE_DIR):
+            if not filename.endswith("instrument.py"):
+                api = frame.f_code.co_qualname
+        elif not filename.startswith(_SELENIUM_DIR):
+            return api, f"{filename}:{frame.f_lineno} in {frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return api, None
+
+
+class CommandInstrumentation:
+    """Wraps a driver's command executor and reports every command to the registered sinks
+
+    The executor's `execute` is replaced on the instance, so all `Browser` objects sharing\
+        the driver (e.g. browser contexts) are covered. With no sinks registered a command\
+        only pays for one extra function call. Commands sent over the DevTools websocket\
+        (`Browser.TRANSPORT = "cdp"`) bypass the executor and are not recorded.
+
+    Get it from `Browser.instrumentation`.
+    """
+
+    def __init__(self, driver, call_sites: bool = True, payload_sizes: bool = True) -> None:
+        """Instrument a driver's command executor
+
+        Args:
+            driver (WebDriver): Selenium driver.
+            call_sites (bool, optional): Record `api` and `call_site` by walking the stack. Defaults to True.
+            payload_sizes (bool, optional): Record request and response sizes. Defaults to True.
+        """
+        self.call_sites = call_sites
+        self.payload_sizes = payload_sizes
+        self.sinks: list[CommandSink] = []
+        self._local = threading.local()
+
+        executor = driver.command_executor
+        self._execute = executor.execute
+        executor.execute = self._instrumented_execute
+
+        # Body sizes are only visible on the pooled HTTP connection (`keep_alive`, the default)
+        self._conn = getattr(executor, "_conn", None)
+        if self._conn is not None:
+            self._request = self._conn.request
+            self._conn.request = self._instrumented_request
+        return None
+
+    def __repr__(self) -> str:
+        return f"CommandInstrumentation(sinks={len(self.sinks)},\
+                call_sites={self.call_sites},\
+                payload_sizes={self.payload_sizes})"
+
+    @classmethod
+    def for_driver(cls, driver) -> "CommandInstrumentation":
+        """The driver's instrumentation, installed on first use"""
+        executor = driver.command_executor
+        instrumentation = getattr(executor, "_ak_instrumentation", None)
+        if instrumentation is None:
+            instrumentation = cls(driver)
+            executor._ak_instrumentation = instrumentation
+        return instrumentation
+
+    def add_sink(self, sink: CommandSink) -> Callable[[], None]:
+        """Report commands to `sink`
+
+        Returns:
+            Callable[[], None]: Removes the sink
+        """
+        self.sinks.append(sink)
+        return lambda: self.sinks.remove(sink)
+
+    @contextmanager
+    def profile(self) -> Iterator["CommandStats"]:
+        """Collect `CommandStats` for the commands sent inside the block"""
+        stats = CommandStats()
+        remove = self.add_sink(stats)
+        try:
+            yield stats
+        finally:
+            remove()
+
+    def _instrumented_execute(self, command, params):
+        if not self.sinks:
+            return self._execute(command, params)
+
+        record = CommandRecord(command=command, start=time.time(), duration=0.0)
+        if self.call_sites:
+            record.api, record.call_site = _caller(sys._getframe(1))
+        self._local.record = record
+        start = time.perf_counter()
+        try:
+            return self._execute(command, params)
+        except Exception as e:
+            record.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record.duration = time.perf_counter() - start
+            self._local.record = None
+            for sink in list(self.sinks):
+                try:
+                    sink(record)
+                except Exception:
+                    pass  # A failing sink must not break the command
+
+    def _instrumented_request(self, method, url, *args, **kwargs):
+        response = self._request(method, url, *args, **kwargs)
+        record: CommandRecord | None = getattr(self._local, "record", None)
+        if record is not None and self.payload_sizes:
+            body = kwargs.get("body")
+            record.request_bytes = len(body) if body else 0
+            record.response_bytes = len(response.data)
+        return response
+
+
+@dataclass
+class CommandStat:
+    """Aggregated timings of one command in `CommandStats`"""
+
+    BUCKETS: ClassVar[tuple[float, ...]] = (0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    """Upper bounds of the latency histogram buckets, in seconds; the last bucket is unbounded"""
+
+    count: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(CommandStat.BUCKETS) + 1))
+    """Number of commands per latency bucket, see `BUCKETS`"""
+    call_sites: Counter[str] = field(default_factory=Counter)
+    """Commands per `api`/`call_site`"""
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the `q`-th percentile (0-100), in seconds"""
+        rank, seen = q / 100 * self.count, 0
+        for bound, n in zip((*self.BUCKETS, self.max_time), self.histogram):
+            seen += n
+            if n and seen >= rank:
+                return min(bound, self.max_time)
+        return self.max_time
+
+    def add(self, record: CommandRecord) -> None:
+        self.count += 1
+        self.errors += int(record.error is not None)
+        self.total_time += record.duration
+        self.max_time = max(self.max_time, record.duration)
+        self.request_bytes += record.request_bytes or 0
+        self.response_bytes += record.response_bytes or 0
+        self.histogram[bisect_left(self.BUCKETS, record.duration)] += 1
+        site = " @ ".join(filter(None, (record.api, record.call_site)))
+        if site:
+            self.call_sites[site] += 1
+        return None
+
+
+class CommandStats:
+    """In-memory sink aggregating latency histograms, counts and payload sizes per command
+
+    Example:
+        ```python
+        with chrome.profile() as stats:
+            chrome.get("https://example.com")
+            chrome.session
+        print(stats.report())
+        ```
+    """
+
+    def __init__(self) -> None:
+        self.commands: dict[str, CommandStat] = {}
+        self._lock = threading.Lock()
+        return None
+
+    def __call__(self, record: CommandRecord) -> None:
+        with self._lock:
+            stat = self.commands.get(record.command)
+            if stat is None:
+                stat = self.commands[record.command] = CommandStat()
+            stat.add(record)
+        return None
+
+    def __repr__(self) -> str:
+        return f"CommandStats(commands={len(self.commands)},\
+                total_count={self.total_count},\
+                total_time={self.total_time:.3f})"
+
+    @property
+    def total_count(self) -> int:
+        return sum(stat.count for stat in self.commands.values())
+
+    @property
+    def total_time(self) -> float:
+        return sum(stat.total_time for stat in self.commands.values())
+
+    def report(self, call_sites: int = 3) -> str:
+        """Table of commands by total time, with their top call sites
+
+        Args:
+            call_sites (int, optional): Call sites listed per command. Defaults to 3.
+
+        Returns:
+            str: Report
+        """
+        lines = [
+            f"{'command':<24}{'count':>7}{'total ms':>11}{'mean ms':>10}{'p95 ms':>9}{'max ms':>9}"
+            f"{'sent kB':>10}{'recv kB':>10}"
+        ]
+        ranked = sorted(self.commands.items(), key=lambda item: item[1].total_time, reverse=True)
+        for command, stat in ranked:
+            lines.append(
+                f"{command:<24}{stat.count:>7}{stat.total_time * 1000:>11.1f}"
+                f"{stat.mean_time * 1000:>10.2f}{stat.percentile(95) * 1000:>9.1f}"
+                f"{stat.max_time * 1000:>9.1f}{stat.request_bytes / 1024:>10.1f}"
+                f"{stat.response_bytes / 1024:>10.1f}"
+            )
+            for site, count in stat.call_sites.most_common(call_sites):
+                lines.append(f"    {count:>5}x {site}")
+        return "\n".join(lines)
+
+
+class LoggingSink:
+    """Sink logging one line per command"""
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG) -> None:
+        """Log commands
+
+        Args:
+            logger (logging.Logger | None, optional): Logger to use. Defaults to `logging.getLogger("ak_selenium.commands")`.
+            level (int, optional): Log level. Defaults to `logging.DEBUG`.
+        """
+        self.logger = logger or logging.getLogger("ak_selenium.commands")
+        self.level = level
+        return None
+
+    def __call__(self, record: CommandRecord) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return None
+        self.logger.log(
+            self.level,
+            "%s %.1fms sent=%s recv=%s %s%s",
+            record.command,
+            record.duration * 1000,
+            record.request_bytes,
+            record.response_bytes,
+            " @ ".join(filter(None, (record.api, record.call_site))),
+            f" error={record.error}" if record.error else "",
+        )
+        return None
+
+
+class SpanSink:
+    """Sink turning commands into OpenTelemetry-style span dicts
+
+    Each span is passed to `callback` as `{"name", "start_time_ns", "end_time_ns",\
+        "attributes", "status"}`, ready to be forwarded to a tracer.
+
+    Example:
+        ```python
+        from opentelemetry import trace
+
+        tracer = trace.get_tracer("scraper")
+
+        def export(span: dict) -> None:
+            otel_span = tracer.start_span(
+                span["name"], start_time=span["start_time_ns"], attributes=span["attributes"]
+            )
+            otel_span.end(end_time=span["end_time_ns"])
+
+        chrome.instrumentation.add_sink(SpanSink(export))
+        ```
+    """
+
+    def __init__(self, callback: Callable[[dict], None], prefix: str = "webdriver") -> None:
+        """Emit spans
+
+        Args:
+            callback (Callable[[dict], None]): Receives one span dict per command.
+            prefix (str, optional): Span name prefix. Defaults to "webdriver".
+        """
+        self.callback = callback
+        self.prefix = prefix
+        return None
+
+    def __call__(self, record: CommandRecord) -> None:
+        start_ns = int(record.start * 1e9)
+        attributes: dict[str, str | int] = {"webdriver.command": record.command}
+        if record.request_bytes is not None:
+            attributes["webdriver.request.size"] = record.request_bytes
+        if record.response_bytes is not None:
+            attributes["webdriver.response.size"] = record.response_bytes
+        if record.api:
+            attributes["ak_selenium.api"] = record.api
+        if record.call_site:
+            attributes["code.call_site"] = record.call_site
+        if record.error:
+            attributes["error.message"] = record.error
+        self.callback(
+            {
+                "name": f"{self.prefix}.{record.command}",
+                "start_time_ns": start_ns,
+                "end_time_ns": start_ns + int(record.duration * 1e9),
+                "attributes": attributes,
+                "status": "ERROR" if record.error else "OK",
+            }
+        )
+        return None
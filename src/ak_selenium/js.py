@@ -0,0 +1,304 @@
+"""JavaScript snippets run in the page by `ak_selenium.browser.Browser`
+
+Each snippet is a function body for `execute_script`: arguments arrive in `arguments`
+and the result is returned with `return`.
+"""
+
+SESSION_STATE = """
+return {
+    language: window.navigator.language,
+    ip: window.navigator.ip,
+    timezone: window.navigator.timezone,
+    userAgent: window.navigator.userAgent,
+};
+"""
+
+# `akDomKey()` keeps a DOM version counter in the page (installed on first use) and
+# returns a key that changes with the URL, the page instance and every DOM mutation.
+DOM_KEY = """
+function akDomKey() {
+    var slot = Symbol.for('ak_selenium.dom');
+    var state = window[slot];
+    if (!state) {
+        state = {token: Math.random().toString(36).slice(2), version: 0};
+        state.observer = new MutationObserver(function () { state.version += 1; });
+        state.observer.observe(document, {
+            subtree: true, childList: true, attributes: true, characterData: true
+        });
+        window[slot] = state;
+    }
+    if (state.observer.takeRecords().length) { state.version += 1; }
+    return location.href + '|' + state.token + '|' + state.version;
+}
+"""
+
+# Only serializes the document when its DOM key differs from `arguments[0]`.
+VERSIONED_SOURCE = DOM_KEY + """
+var key = akDomKey();
+return {
+    key: key,
+    html: key === arguments[0] ? null : document.documentElement.outerHTML
+};
+"""
+
+
+# `akFind(by, value, root, all)` resolves a Selenium locator (`By.*` strategy name and
+# value) inside `root` (defaults to `document`). Returns the first match or null, or
+# an array of all matches when `all` is true. Prepend it to scripts that need it.
+FIND = """
+function akFind(by, value, root, all) {
+    root = root || document;
+    var css = null;
+    switch (by) {
+        case 'css selector': css = value; break;
+        case 'tag name': css = value; break;
+        case 'id': css = '#' + CSS.escape(value); break;
+        case 'class name': css = '.' + CSS.escape(value); break;
+        case 'name': css = '[name="' + value.replace(/(["\\\\])/g, '\\\\$1') + '"]'; break;
+        case 'xpath':
+            var snapshot = document.evaluate(
+                value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                nodes.push(snapshot.snapshotItem(i));
+            }
+            return all ? nodes : (nodes[0] || null);
+        case 'link text':
+        case 'partial link text':
+            var links = Array.prototype.filter.call(root.querySelectorAll('a'), function (a) {
+                var text = a.innerText.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+            return all ? links : (links[0] || null);
+        default:
+            throw new Error('Unsupported locator strategy: ' + by);
+    }
+    return all ? Array.prototype.slice.call(root.querySelectorAll(css)) : root.querySelector(css);
+}
+"""
+
+# Serializes the first match of each locator in `arguments[0]` ({key: [by, value]}).
+OUTER_HTML = FIND + """
+var locators = arguments[0];
+var result = {};
+for (var key in locators) {
+    var element = akFind(locators[key][0], locators[key][1], null, false);
+    result[key] = element ? element.outerHTML : null;
+}
+return result;
+"""
+
+# Evaluates a compiled `Browser.extract` spec (`arguments[0]`) inside the first match of
+# the optional root locator (`arguments[1]`). Returns null when the root is missing.
+EXTRACT = FIND + """
+function akValue(element, attr) {
+    if (!element) { return null; }
+    switch (attr) {
+        case null:
+        case 'text':
+            var text = element.innerText;
+            return (text === undefined ? element.textContent : text).trim();
+        case 'textContent': return element.textContent.trim();
+        case 'html': return element.innerHTML;
+        case 'outerHTML': return element.outerHTML;
+        default: return element.getAttribute(attr);
+    }
+}
+function akExtract(node, scope) {
+    if (node.kind === 'value') {
+        return akValue(node.css ? scope.querySelector(node.css) : scope, node.attr);
+    }
+    var matches = node.css ? scope.querySelectorAll(node.css) : [scope];
+    var items = [];
+    for (var i = 0; i < matches.length; i++) {
+        if (node.fields) {
+            var item = {};
+            for (var key in node.fields) { item[key] = akExtract(node.fields[key], matches[i]); }
+            items.push(item);
+        } else {
+            items.push(akValue(matches[i], node.attr));
+        }
+        if (node.first) { break; }
+    }
+    return node.first ? (items.length ? items[0] : null) : items;
+}
+var root = arguments[1] ? akFind(arguments[1][0], arguments[1][1], null, false) : document;
+if (!root) { return null; }
+var result = {};
+for (var key in arguments[0]) { result[key] = akExtract(arguments[0][key], root); }
+return result;
+"""
+
+# Finds elements by their visible text. Arguments: needle, mode (exact|casefold|contains|regex),
+# regex flags, tag (CSS, defaults to every element), container (element or [by, value]) and
+# whether to return all matches. Without a tag only the innermost matching elements are kept.
+FIND_BY_TEXT = FIND + """
+var needle = arguments[0], mode = arguments[1], flags = arguments[2];
+var tag = arguments[3], within = arguments[4], all = arguments[5];
+var root = document;
+if (within) {
+    root = Array.isArray(within) ? akFind(within[0], within[1], null, false) : within;
+    if (!root) { return all ? [] : null; }
+}
+var pattern = mode === 'regex' ? new RegExp(needle, flags) : null;
+if (mode === 'casefold') { needle = needle.toLowerCase(); }
+function visibleText(element) {
+    if (!element.getClientRects().length) { return ''; }
+    return element.innerText.trim();
+}
+function matches(element) {
+    var text = visibleText(element);
+    switch (mode) {
+        case 'exact': return text === needle;
+        case 'casefold': return text.toLowerCase() === needle;
+        case 'contains': return text.indexOf(needle) !== -1;
+        case 'regex': return pattern.test(text);
+    }
+    throw new Error('Unsupported text match mode: ' + mode);
+}
+var found = Array.prototype.filter.call(root.querySelectorAll(tag || '*'), matches);
+if (!tag) {
+    // An element containing another match precedes it directly in document order
+    found = found.filter(function (element, i) {
+        return !(i + 1 < found.length && element.contains(found[i + 1]));
+    });
+}
+return all ? found : (found[0] || null);
+"""
+
+# Returns {index, element} for the first locator in `arguments[0]` that is present (or
+# absent, when `arguments[1]` is false), or null. One poll of `Browser.wait_for_any`.
+CHECK_ANY = FIND + """
+var locators = arguments[0], present = arguments[1];
+for (var i = 0; i < locators.length; i++) {
+    var element = akFind(locators[i][0], locators[i][1], null, false);
+    if (present ? element : !element) {
+        return {index: i, element: present ? element : null};
+    }
+}
+return null;
+"""
+
+# Async script: resolves with {index, element} as soon as one of the locators in
+# `arguments[0]` is present (or absent, when `arguments[1]` is false), re-checking on
+# every DOM mutation. Resolves with index -1 after `arguments[2]` milliseconds.
+WAIT_FOR_ANY = FIND + """
+var locators = arguments[0], present = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var observer = null, timer = null;
+function check() {
+    for (var i = 0; i < locators.length; i++) {
+        var element = akFind(locators[i][0], locators[i][1], null, false);
+        if (present ? element : !element) {
+            return {index: i, element: present ? element : null};
+        }
+    }
+    return null;
+}
+function finish(result) {
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    done(result);
+}
+var hit = check();
+if (hit) {
+    done(hit);
+} else {
+    observer = new MutationObserver(function () {
+        var result = check();
+        if (result) { finish(result); }
+    });
+    observer.observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+    timer = setTimeout(function () { finish({index: -1, element: null}); }, timeoutMs);
+}
+"""
+
+# Marks the current document before a navigation, so `READY_STATE` can tell it apart
+# from the document being navigated to when the driver does not block on page loads.
+MARK_NAVIGATING = "window[Symbol.for('ak_selenium.navigating')] = true;"
+
+# Async script: resolves with 'ready' once the document reaches `arguments[0]`
+# ('interactive' = DOMContentLoaded, 'complete' = load), 'timeout' after `arguments[1]`
+# milliseconds, or 'stale' if this is still the document marked by `MARK_NAVIGATING`.
+READY_STATE = """
+var target = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var reached = target === 'interactive'
+    ? document.readyState !== 'loading'
+    : document.readyState === 'complete';
+if (window[Symbol.for('ak_selenium.navigating')]) {
+    done('stale');
+} else if (reached) {
+    done('ready');
+} else {
+    var timer = setTimeout(function () { done('timeout'); }, timeoutMs);
+    var source = target === 'interactive' ? document : window;
+    var event = target === 'interactive' ? 'DOMContentLoaded' : 'load';
+    source.addEventListener(event, function () {
+        clearTimeout(timer);
+        done('ready');
+    }, {once: true});
+}
+"""
+
+# Whether a freshly opened tab reached `arguments[0]`: 'load', 'domcontentloaded' or a
+# [by, value] locator. The initial about:blank document never counts as ready.
+TAB_READY = FIND + """
+var condition = arguments[0];
+if (location.href === 'about:blank') { return false; }
+if (condition === 'load') { return document.readyState === 'complete'; }
+if (condition === 'domcontentloaded') { return document.readyState !== 'loading'; }
+return akFind(condition[0], condition[1], null, false) !== null;
+"""
+
+# Resolves a compiled Helium-style selector `arguments[0]` ({xpath, hidden, filters:
+# [{direction, anchor}]}) with Helium's visibility and relative-position rules. Returns
+# {key, elements}, where elements is null when the DOM key still equals `arguments[1]`.
+RESOLVE_SELECTOR = DOM_KEY + """
+function akBox(el) {
+    var r = el.getBoundingClientRect();
+    return {left: r.left, top: r.top, right: r.right, bottom: r.bottom};
+}
+function akVisible(el) {
+    var r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+}
+function akAbove(a, b) {
+    return a.top < b.top && ((a.left <= b.left && b.left < a.right) || (b.left <= a.left && a.left < b.right));
+}
+function akLeftOf(a, b) {
+    return a.left < b.left && ((a.top <= b.top && b.top < a.bottom) || (b.top <= a.top && a.top < b.bottom));
+}
+var akInRegion = {
+    below: function (el, anchor) { return akAbove(anchor, el); },
+    above: function (el, anchor) { return akAbove(el, anchor); },
+    to_right_of: function (el, anchor) { return akLeftOf(anchor, el); },
+    to_left_of: function (el, anchor) { return akLeftOf(el, anchor); }
+};
+function akResolve(spec) {
+    var snapshot = document.evaluate(
+        spec.xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    var found = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+        var node = snapshot.snapshotItem(i);
+        if (node.nodeType === 1 && found.indexOf(node) < 0 && (spec.hidden || akVisible(node))) {
+            found.push(node);
+        }
+    }
+    spec.filters.forEach(function (filter) {
+        var anchors = akResolve(filter.anchor).map(akBox);
+        var inRegion = akInRegion[filter.direction];
+        found = found.filter(function (el) {
+            var box = akBox(el);
+            return anchors.some(function (anchor) { return inRegion(box, anchor); });
+        });
+    });
+    return found;
+}
+var key = akDomKey();
+return {key: key, elements: key === arguments[1] ? null : akResolve(arguments[0])};
+"""
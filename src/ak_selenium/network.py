@@ -0,0 +1,277 @@
+import json
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+from urllib.parse import quote
+
+if TYPE_CHECKING:
+    from ak_selenium.cdp import CDPConnection
+
+
+class NetworkIdleTracker:
+    """Follows in-flight requests from CDP `Network.*` events read off Chrome's performance log"""
+
+    def __init__(self) -> None:
+        self.inflight: set[str] = set()
+        """Request ids sent but not yet finished or failed"""
+
+        self.last_activity: float = time.monotonic()
+        """`time.monotonic()` of the last request start or end"""
+
+        self.document_status: int | None = None
+        """HTTP status of the first document response seen"""
+        return None
+
+    def feed(self, entries: list[dict]) -> None:
+        """Update the tracker from `driver.get_log("performance")` entries
+
+        Args:
+            entries (list[dict]): Performance log entries.
+        """
+        for entry in entries:
+            message: dict = json.loads(entry["message"])["message"]
+            method: str = message.get("method", "")
+            params: dict = message.get("params", {})
+            match method:
+                case "Network.requestWillBeSent":
+                    self.inflight.add(params["requestId"])
+                case "Network.loadingFinished" | "Network.loadingFailed":
+                    self.inflight.discard(params["requestId"])
+                case "Network.responseReceived":
+                    if self.document_status is None and params.get("type") == "Document":
+                        self.document_status = params["response"]["status"]
+                    continue
+                case _:
+                    continue
+            self.last_activity = time.monotonic()
+        return None
+
+    def idle(self, quiet_time: float, max_inflight: int = 0) -> bool:
+        """Whether at most `max_inflight` requests are pending and nothing started or ended for `quiet_time` seconds
+
+        Args:
+            quiet_time (float): Required seconds without network activity.
+            max_inflight (int, optional): Requests allowed to stay open, e.g. long-polling. Defaults to 0.
+
+        Returns:
+            bool: True once the network is idle
+        """
+        return (
+            len(self.inflight) <= max_inflight
+            and time.monotonic() - self.last_activity >= quiet_time
+        )
+
+
+def count_blocked(entries: list[dict]) -> Counter[str]:
+    """Count requests blocked by the browser, by CDP resource type (`Image`, `Font`, ...)
+
+    Args:
+        entries (list[dict]): `driver.get_log("performance")` entries.
+
+    Returns:
+        Counter[str]: Blocked requests per resource type
+    """
+    blocked: Counter[str] = Counter()
+    for entry in entries:
+        message: dict = json.loads(entry["message"])["message"]
+        if message.get("method") != "Network.loadingFailed":
+            continue
+        params: dict = message.get("params", {})
+        if params.get("blockedReason"):
+            blocked[params.get("type", "Other")] += 1
+    return blocked
+
+
+@dataclass
+class ResourcePolicy:
+    """Which requests the browser should block
+
+    Chrome applies it through CDP `Fetch` (`RequestBlocker`): requests are matched by the\
+        resource type Chrome assigns them, whatever their URL. Firefox gets it as profile prefs\
+        at startup (`firefox_prefs`): content prefs for the resource types that have one, and a\
+        proxy auto-config script sending every blocked URL to a closed local port, where types\
+        are approximated by file extension (`blocked_urls`).
+
+    Example:
+        ```python
+        policy = ResourcePolicy(types={"image", "font"}, url_patterns=ResourcePolicy.TRACKERS)
+        chrome = Chrome(resource_policy=policy)
+        ```
+    """
+
+    types: set[Literal["image", "font", "media", "stylesheet"]] = field(default_factory=set)
+    """Resource types to block"""
+    url_patterns: list[str] = field(default_factory=list)
+    """Extra URL patterns to block, `*` is a wildcard, e.g. `"*doubleclick.net*"`"""
+
+    CDP_TYPES: ClassVar[dict[str, str]] = {
+        "image": "Image",
+        "font": "Font",
+        "media": "Media",
+        "stylesheet": "Stylesheet",
+    }
+    """CDP `Network.ResourceType` blocked for each resource type on Chromium"""
+
+    EXTENSIONS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"),
+        "font": ("woff", "woff2", "ttf", "otf", "eot"),
+        "media": ("mp4", "webm", "ogg", "mp3", "wav", "m4a", "m3u8", "mpd"),
+        "stylesheet": ("css",),
+    }
+    """File extensions blocked for each resource type where the browser's type is not available (Firefox)"""
+
+    TRACKERS: ClassVar[list[str]] = [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*googlesyndication.com*",
+        "*doubleclick.net*",
+        "*adservice.google.*",
+        "*facebook.net*",
+        "*connect.facebook.com*",
+        "*hotjar.com*",
+        "*segment.io*",
+        "*scorecardresearch.com*",
+    ]
+    """Common analytics and ad domains"""
+
+    FIREFOX_TYPE_PREFS: ClassVar[dict[str, dict[str, Any]]] = {
+        "image": {"permissions.default.image": 2},
+        "font": {"gfx.downloadable_fonts.enabled": False, "browser.display.use_document_fonts": 0},
+        "media": {"media.autoplay.default": 5, "media.autoplay.blocking_policy": 2},
+    }
+    """Firefox prefs disabling a resource type outright, on top of the URL patterns"""
+
+    BLACKHOLE_PROXY: ClassVar[str] = "PROXY 127.0.0.1:9"
+    """Where the Firefox proxy auto-config script sends blocked requests (the discard port, refused at once)"""
+
+    @classmethod
+    def default(cls) -> "ResourcePolicy":
+        """Images blocked, nothing else"""
+        return cls(types={"image"})
+
+    def fetch_patterns(self) -> list[dict]:
+        """Request patterns for CDP `Fetch.enable`: one per resource type, then one per url pattern
+
+        Returns:
+            list[dict]: `Fetch.RequestPattern`s, paused at the request stage
+        """
+        self._check_types()
+        patterns = [
+            {"urlPattern": "*", "resourceType": self.CDP_TYPES[_type], "requestStage": "Request"}
+            for _type in sorted(self.types)
+        ]
+        return patterns + [{"urlPattern": p, "requestStage": "Request"} for p in self.url_patterns]
+
+    def blocked_urls(self) -> list[str]:
+        """URL patterns approximating the policy, for browsers without CDP `Fetch`
+
+        Used for Firefox's proxy auto-config script, and on Chromium through\
+            `Network.setBlockedURLs` when its DevTools websocket is unreachable.
+
+        Returns:
+            list[str]: Extension patterns of `types` (with and without a query string) followed by `url_patterns`
+        """
+        self._check_types()
+        patterns = []
+        for _type in sorted(self.types):
+            for extension in self.EXTENSIONS[_type]:
+                patterns += [f"*.{extension}", f"*.{extension}?*"]
+        return patterns + list(self.url_patterns)
+
+    def _check_types(self) -> None:
+        unknown = set(self.types) - set(self.EXTENSIONS)
+        if unknown:
+            raise ValueError(f"Unsupported resource types: {sorted(unknown)}")
+        return None
+
+    def pac_script(self) -> str:
+        """Proxy auto-config script blocking `blocked_urls`, matched with `shExpMatch`
+
+        Returns:
+            str: JavaScript defining `FindProxyForURL`
+        """
+        return (
+            "function FindProxyForURL(url, host) {\n"
+            f"  var patterns = {json.dumps(self.blocked_urls())};\n"
+            "  for (var i = 0; i < patterns.length; i++) {\n"
+            f"    if (shExpMatch(url, patterns[i])) return {json.dumps(self.BLACKHOLE_PROXY)};\n"
+            "  }\n"
+            '  return "DIRECT";\n'
+            "}\n"
+        )
+
+    def firefox_prefs(self) -> dict[str, Any]:
+        """Firefox profile prefs applying the policy
+
+        The proxy auto-config script replaces any proxy configured in the profile, and is only\
+            installed when there is something to block. Full URLs, not just hosts, are passed\
+            to it, so extension patterns also match HTTPS requests.
+
+        Returns:
+            dict[str, Any]: Pref name to value
+        """
+        prefs: dict[str, Any] = {}
+        patterns = self.blocked_urls()
+        for _type in sorted(self.types):
+            prefs.update(self.FIREFOX_TYPE_PREFS.get(_type, {}))
+        if patterns:
+            prefs["network.proxy.type"] = 2
+            prefs["network.proxy.autoconfig_url"] = (
+                "data:application/x-ns-proxy-autoconfig," + quote(self.pac_script())
+            )
+            prefs["network.proxy.autoconfig_url.include_path"] = True
+        return prefs
+
+
+class RequestBlocker:
+    """Fails the requests of one Chromium window matching a `ResourcePolicy`, via CDP `Fetch`
+
+    Only matching requests are paused (`ResourcePolicy.fetch_patterns`), and each is failed\
+        with `BlockedByClient` from the connection's event callback. Fetch interception is\
+        per DevTools session, so this coexists with a `CacheInterceptor` on another session.
+    """
+
+    def __init__(self, cdp: "CDPConnection", on_blocked: Callable[[str], Any] | None = None) -> None:
+        """Start listening for paused requests on `cdp`
+
+        Args:
+            cdp (CDPConnection): Connection to the window, owned by the blocker from now on.
+            on_blocked (Callable[[str], Any] | None, optional): Called with the CDP resource type\
+                (`Image`, `Font`, ...) of each blocked request, on the connection's reader thread. Defaults to None.
+        """
+        self.cdp = cdp
+        self.on_blocked = on_blocked
+        self._unsubscribe = cdp.on("Fetch.requestPaused", self._paused)
+        return None
+
+    def __repr__(self) -> str:
+        return f"RequestBlocker(cdp={self.cdp!r})"
+
+    @property
+    def closed(self) -> bool:
+        return self.cdp.closed
+
+    def apply(self, policy: ResourcePolicy) -> None:
+        """Block what `policy` blocks, replacing the previous policy"""
+        patterns = policy.fetch_patterns()
+        if patterns:
+            self.cdp.send("Fetch.enable", {"patterns": patterns})
+        else:
+            self.cdp.send("Fetch.disable")
+        return None
+
+    def close(self) -> None:
+        """Stop blocking and close the connection"""
+        self._unsubscribe()
+        self.cdp.close()
+        return None
+
+    def _paused(self, params: dict) -> None:
+        self.cdp.send_nowait(
+            "Fetch.failRequest", {"requestId": params["requestId"], "errorReason": "BlockedByClient"}
+        )
+        if self.on_blocked is not None:
+            self.on_blocked(params.get("resourceType", "Other"))
+        return None
@@ -0,0 +1,268 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+
+from ak_selenium.browser import Browser
+
+
+@dataclass
+class PoolMetrics:
+    """Counters reported by `BrowserPool.metrics`"""
+
+    checkouts: int = 0
+    """Number of browsers handed out"""
+    hits: int = 0
+    """Checkouts served immediately by an idle, pre-warmed browser"""
+    misses: int = 0
+    """Checkouts that had to wait for a browser or start a new one"""
+    recycles: int = 0
+    """Browsers retired for exceeding `max_pages`/`max_uptime` or failing a reset"""
+    total_wait_time: float = 0.0
+    """Seconds spent by callers waiting for a browser"""
+    max_wait_time: float = 0.0
+    """Longest single wait for a browser, in seconds"""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of checkouts served by a warm browser"""
+        return self.hits / self.checkouts if self.checkouts else 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        """Mean seconds waited per checkout"""
+        return self.total_wait_time / self.checkouts if self.checkouts else 0.0
+
+
+class BrowserPool:
+    """Keeps a number of ready `Browser` instances and hands them out on demand
+
+    Example:
+        ```python
+        from ak_selenium import BrowserPool, Chrome
+
+        with BrowserPool(Chrome, size=4, max_pages=50, headless=True) as pool:
+            with pool.checkout() as chrome:
+                chrome.get("https://example.com")
+        ```
+    """
+
+    def __init__(
+        self,
+        browser_class: type[Browser],
+        size: int = 2,
+        max_pages: int | None = None,
+        max_uptime: float | None = None,
+        prewarm: bool = True,
+        **browser_kwargs,
+    ) -> None:
+        """Initialize a browser pool
+
+        Args:
+            browser_class (type[Browser]): `Browser` subclass to start, e.g. `Chrome` or `Firefox`.
+            size (int, optional): Maximum number of live browsers. Defaults to 2.
+            max_pages (int | None, optional): Recycle a browser after it loaded this many pages. Defaults to None.
+            max_uptime (float | None, optional): Recycle a browser after this many seconds. Defaults to None.
+            prewarm (bool, optional): Start all `size` browsers in the background right away. Defaults to True.
+            **browser_kwargs: Keyword arguments passed to `browser_class`.
+        """
+        if size < 1:
+            raise ValueError("`size` must be at least 1")
+
+        self.browser_class = browser_class
+        self.size = size
+        self.max_pages = max_pages
+        self.max_uptime = max_uptime
+        self.browser_kwargs = browser_kwargs
+
+        self._idle: deque[Browser] = deque()
+        self._live: int = 0
+        self._closed: bool = False
+        self._cond = threading.Condition()
+        self._metrics = PoolMetrics()
+
+        if prewarm:
+            for _ in range(size):
+                self._spawn()
+        return None
+
+    def __str__(self) -> str:
+        return f"""
+        BrowserPool.Object
+        Browser: {self.browser_class.__name__}
+        Size: {self.size}
+        Live: {self._live}
+        Idle: {len(self._idle)}
+        Hit Rate: {self._metrics.hit_rate:.2%}
+        """
+
+    def __repr__(self) -> str:
+        return f"BrowserPool({self.browser_class.__name__}, size={self.size},\
+                max_pages={self.max_pages},\
+                max_uptime={self.max_uptime})"
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        """Snapshot of the pool counters"""
+        with self._cond:
+            return replace(self._metrics)
+
+    def acquire(self, timeout: float | None = None) -> Browser:
+        """Take a browser out of the pool, starting one if the pool is not full yet.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait for a free browser. Defaults to None (wait forever).
+
+        Raises:
+            TimeoutError: No browser became available within `timeout`.
+
+        Returns:
+            Browser: A clean browser. Hand it back with `BrowserPool.release`.
+        """
+        start = time.perf_counter()
+        deadline = None if timeout is None else start + timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("BrowserPool is closed")
+                if self._idle:
+                    browser = self._idle.popleft()
+                    break
+                if self._live < self.size:
+                    self._live += 1
+                    browser = None
+                    break
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No browser available within {timeout}s")
+                waited = True
+                self._cond.wait(remaining)
+
+        created = browser is None
+        if browser is None:
+            try:
+                browser = self.browser_class(**self.browser_kwargs)
+            except Exception:
+                with self._cond:
+                    self._live -= 1
+                    self._cond.notify()
+                raise
+
+        wait_time = time.perf_counter() - start
+        with self._cond:
+            self._metrics.checkouts += 1
+            if waited or created:
+                self._metrics.misses += 1
+            else:
+                self._metrics.hits += 1
+            self._metrics.total_wait_time += wait_time
+            self._metrics.max_wait_time = max(self._metrics.max_wait_time, wait_time)
+        return browser
+
+    def release(self, browser: Browser) -> None:
+        """Hand a browser back to the pool.
+
+        The browser is reset for the next user, or recycled if it is past
+        `max_pages`/`max_uptime` or cannot be reset.
+
+        Args:
+            browser (Browser): Browser obtained from `BrowserPool.acquire`.
+        """
+        if not self._closed and not self._expired(browser):
+            try:
+                browser.reset()
+            except Exception:
+                pass  # Any failure discards the browser, so its slot is freed below
+            else:
+                with self._cond:
+                    if not self._closed:
+                        self._idle.append(browser)
+                        self._cond.notify()
+                        return None
+
+        self._discard(browser)
+        with self._cond:
+            if not self._closed:
+                self._metrics.recycles += 1
+                self._live -= 1
+                self._cond.notify()
+        if not self._closed:
+            self._spawn()
+        return None
+
+    @contextmanager
+    def checkout(self, timeout: float | None = None) -> Iterator[Browser]:
+        """Context manager around `BrowserPool.acquire`/`BrowserPool.release`
+
+        Args:
+            timeout (float | None, optional): Seconds to wait for a free browser. Defaults to None (wait forever).
+
+        Yields:
+            Browser: A clean browser, returned to the pool on exit.
+        """
+        browser = self.acquire(timeout=timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def close(self) -> None:
+        """Quit all idle browsers. Browsers still checked out are quit on release."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for browser in idle:
+            self._discard(browser)
+        return None
+
+    def _expired(self, browser: Browser) -> bool:
+        if self.max_pages is not None and browser.page_count >= self.max_pages:
+            return True
+        if self.max_uptime is not None and browser.uptime >= self.max_uptime:
+            return True
+        return False
+
+    def _spawn(self) -> None:
+        """Start a browser in the background and add it to the idle queue"""
+        with self._cond:
+            if self._closed or self._live >= self.size:
+                return None
+            self._live += 1
+
+        def _start() -> None:
+            try:
+                browser = self.browser_class(**self.browser_kwargs)
+            except Exception:
+                with self._cond:
+                    self._live -= 1
+                    self._cond.notify()
+                return None
+            with self._cond:
+                if not self._closed:
+                    self._idle.append(browser)
+                    self._cond.notify()
+                    return None
+                self._live -= 1
+            self._discard(browser)
+
+        threading.Thread(target=_start, daemon=True).start()
+        return None
+
+    @staticmethod
+    def _discard(browser: Browser) -> None:
+        try:
+            browser.driver.quit()
+        except Exception:
+            pass
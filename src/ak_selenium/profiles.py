@@ -0,0 +1,257 @@
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import weakref
+from pathlib import Path
+
+CACHE_PATHS: frozenset[str] = frozenset(
+    {
+        "Cache",
+        "Code Cache",
+        "GPUCache",
+        "DawnCache",
+        "DawnGraphiteCache",
+        "DawnWebGPUCache",
+        "GraphiteDawnCache",
+        "GrShaderCache",
+        "ShaderCache",
+        "Media Cache",
+        "blob_storage",
+        "Crashpad",
+        "BrowserMetrics",
+        "component_crx_cache",
+        "extensions_crx_cache",
+        "optimization_guide_model_store",
+        "OptimizationGuidePredictionModels",
+        "Safe Browsing",
+        "Service Worker/CacheStorage",
+        "Service Worker/ScriptCache",
+    }
+)
+"""Directories (or `parent/child` paths) of a Chrome user data dir that only hold caches"""
+
+SKIPPED_FILES: frozenset[str] = frozenset(
+    {
+        "SingletonLock",
+        "SingletonSocket",
+        "SingletonCookie",
+        "RunningChromeVersion",
+        "BrowserMetrics-spare.pma",
+        "lockfile",
+    }
+)
+"""Lock and runtime files a copied profile must not carry over"""
+
+IMMUTABLE_SUFFIXES: tuple[str, ...] = (".ldb", ".sst")
+"""LevelDB table files: written once and only ever deleted, so clones may share them as hardlinks"""
+
+CLONE_PREFIX = "ak_selenium-profile-"
+_OWNER_FILE = ".ak_selenium_owner"
+_FICLONE = 0x40049409  # Linux `ioctl` request for a copy-on-write clone (btrfs, xfs, ...)
+
+
+def _is_cache(parts: tuple[str, ...]) -> bool:
+    return parts[-1] in CACHE_PATHS or "/".join(parts[-2:]) in CACHE_PATHS
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Copy-on-write clone of `src` at `dst`, if the OS and filesystem support it"""
+    if sys.platform != "linux":
+        return False
+    import fcntl
+
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        try:
+            fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+        except OSError:
+            return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def prune_stale_clones(directory: str | os.PathLike | None = None) -> int:
+    """Delete clones left behind by processes that have exited without cleaning up
+
+    Only clones recording their owner process are considered; on Windows nothing is pruned.
+
+    Args:
+        directory (str | os.PathLike | None, optional): Where clones are created. Defaults to the system temp dir.
+
+    Returns:
+        int: Number of clones deleted
+    """
+    if os.name != "posix":
+        return 0
+    removed = 0
+    for path in Path(directory or tempfile.gettempdir()).glob(f"{CLONE_PREFIX}*"):
+        try:
+            pid = int((path / _OWNER_FILE).read_text())
+        except (OSError, ValueError):
+            continue
+        if pid != os.getpid() and not _pid_alive(pid):
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+class ProfileClone:
+    """A throwaway copy of a `ProfileTemplate`, deleted by `cleanup`, when garbage collected, or at exit"""
+
+    def __init__(self, path: Path, template: "ProfileTemplate") -> None:
+        self.path = path
+        self.template = template
+        self._finalizer = weakref.finalize(self, shutil.rmtree, str(path), ignore_errors=True)
+        return None
+
+    def __repr__(self) -> str:
+        return f"ProfileClone(path={str(self.path)!r},\
+                template={self.template!r})"
+
+    def __fspath__(self) -> str:
+        return str(self.path)
+
+    def __enter__(self) -> "ProfileClone":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cleanup()
+
+    @property
+    def alive(self) -> bool:
+        return self._finalizer.alive
+
+    def cleanup(self) -> None:
+        """Delete the clone. Quit the browser using it first."""
+        self._finalizer()
+        return None
+
+
+class ProfileTemplate:
+    """A captured Chrome user data dir (e.g. logged in once) that browsers start from as cheap private copies
+
+    `capture` copies a profile without its caches and lock files. `clone` then gives each\
+        browser its own copy: LevelDB table files are hardlinked (they are never modified in\
+        place), other files are reflinked where the filesystem supports copy-on-write and\
+        copied otherwise. On POSIX, template files shared by hardlinks are made read-only.
+
+    Example:
+        ```python
+        # Once: log in with a dedicated profile, quit, and capture it
+        chrome = Chrome(chrome_userdata_path="/tmp/login-profile")
+        ...  # log in
+        chrome.driver.quit()
+        template = ProfileTemplate.capture("/tmp/login-profile", "templates/shop")
+
+        # Then: any number of parallel, already logged-in browsers
+        with BrowserPool(Chrome, size=4, profile_template=template, headless=True) as pool:
+            ...
+        ```
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Open a captured template
+
+        Args:
+            path (str | os.PathLike): Template directory, as created by `ProfileTemplate.capture`.
+
+        Raises:
+            FileNotFoundError: The directory does not exist.
+        """
+        self.path = Path(path)
+        if not self.path.is_dir():
+            raise FileNotFoundError(f"Profile template not found: {self.path}")
+        return None
+
+    def __repr__(self) -> str:
+        return f"ProfileTemplate(path={str(self.path)!r})"
+
+    @classmethod
+    def capture(
+        cls, source: str | os.PathLike, path: str | os.PathLike, overwrite: bool = False
+    ) -> "ProfileTemplate":
+        """Copy a Chrome user data dir into a new template, leaving out caches and lock files
+
+        Quit every browser using `source` first, so its databases are complete.
+
+        Args:
+            source (str | os.PathLike): Chrome user data dir (the folder holding `Local State` and `Default`).
+            path (str | os.PathLike): Template directory to create.
+            overwrite (bool, optional): Replace an existing template. Defaults to False.
+
+        Raises:
+            FileExistsError: `path` exists and `overwrite` is False.
+
+        Returns:
+            ProfileTemplate: The captured template
+        """
+        source, path = Path(source), Path(path)
+        if path.exists():
+            if not overwrite:
+                raise FileExistsError(f"Profile template already exists: {path}")
+            shutil.rmtree(path)
+
+        for root, dirs, files in os.walk(source):
+            rel = Path(root).relative_to(source)
+            dirs[:] = [d for d in dirs if not _is_cache((*rel.parts, d))]
+            (path / rel).mkdir(parents=True, exist_ok=True)
+            for name in files:
+                if name in SKIPPED_FILES:
+                    continue
+                target = path / rel / name
+                shutil.copy2(Path(root) / name, target, follow_symlinks=False)
+                if name.endswith(IMMUTABLE_SUFFIXES) and os.name == "posix":
+                    target.chmod(stat.S_IMODE(target.stat().st_mode) & ~0o222)
+        return cls(path)
+
+    @property
+    def size(self) -> int:
+        """Bytes stored in the template"""
+        return sum(f.stat().st_size for f in self.path.rglob("*") if f.is_file())
+
+    def clone(self, directory: str | os.PathLike | None = None) -> ProfileClone:
+        """Create a private copy of the template for one browser
+
+        Args:
+            directory (str | os.PathLike | None, optional): Where to create the clone. Defaults to\
+                the system temp dir. Hardlinks need it on the template's filesystem; files are\
+                copied otherwise.
+
+        Returns:
+            ProfileClone: The clone; pass `clone.path` as the browser's user data dir
+        """
+        prune_stale_clones(directory)
+        target = Path(tempfile.mkdtemp(prefix=CLONE_PREFIX, dir=directory))
+        clone = ProfileClone(target, self)
+        (target / _OWNER_FILE).write_text(str(os.getpid()))
+
+        can_link, can_reflink = True, True
+        for root, dirs, files in os.walk(self.path):
+            rel = Path(root).relative_to(self.path)
+            for d in dirs:
+                (target / rel / d).mkdir(exist_ok=True)
+            for name in files:
+                src, dst = Path(root) / name, target / rel / name
+                if can_link and name.endswith(IMMUTABLE_SUFFIXES):
+                    try:
+                        os.link(src, dst)
+                        continue
+                    except OSError:
+                        can_link = False  # Different filesystem, or no hardlink support
+                if can_reflink:
+                    if _reflink(src, dst):
+                        continue
+                    can_reflink = False
+                shutil.copy2(src, dst, follow_symlinks=False)
+        return clone
@@ -0,0 +1,372 @@
+"""Batch runner: spread a URL list over a pool of browser processes and stream results as JSONL
+
+    ak-selenium-run urls.txt --extract mypackage.scrapers:product --workers 4 --output results.jsonl
+
+`extract` receives the `Browser` after the page loaded and returns JSON-serializable data.
+"""
+
+import argparse
+import importlib
+import json
+import multiprocessing.util
+import os
+import signal
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from selenium.common import exceptions
+
+from ak_selenium.browser import Browser
+
+Extract = Callable[[Browser], Any] | str
+"""An extract function, or its import path as `"package.module:function"`"""
+
+
+@dataclass
+class RunResult:
+    """Outcome of one URL processed by `BatchRunner`, written as one JSONL line"""
+
+    url: str
+    """Requested url"""
+    status: Literal["ok", "timeout", "error"] = "ok"
+    """`"timeout"` if the URL exceeded the per-URL timeout, `"error"` on navigation or `extract` errors"""
+    value: Any = None
+    """Return value of `extract`"""
+    error: str | None = None
+    """Error message when `status` is not `"ok"`"""
+    attempts: int = 1
+    """Number of tries, including retries"""
+    elapsed: float = 0.0
+    """Seconds spent on the last try"""
+    worker: int | None = None
+    """Process id of the worker that ran the last try"""
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def default_extract(browser: Browser) -> dict:
+    """Default `extract`: the page title and final url"""
+    return {"title": browser.driver.title, "url": browser.driver.current_url}
+
+
+class BatchRunner:
+    """Runs an extract function over many URLs in a pool of processes, each owning one browser
+
+    - Backpressure: URLs are read lazily and at most `max_inflight` are queued at once, so\
+        inputs of any size (including endless stdin) use constant memory.
+    - Per-URL timeouts: each try is bounded by `timeout`, covering navigation and `extract`.\
+        On POSIX a timer interrupts a stuck try and the worker restarts its browser.
+    - Retries: failed URLs are resubmitted up to `retries` more times.
+    - Resume: successful URLs are appended to `checkpoint` and skipped on the next run;\
+        URLs that still failed after their retries are tried again.
+
+    Example:
+        ```python
+        from ak_selenium.runner import BatchRunner
+
+        runner = BatchRunner("mypackage.scrapers:product", workers=4, timeout=30, checkpoint="done.txt")
+        with open("results.jsonl", "a") as output:
+            runner.write_jsonl(open("urls.txt"), output)
+        ```
+    """
+
+    def __init__(
+        self,
+        extract: Extract = default_extract,
+        workers: int = 2,
+        timeout: float = 30,
+        retries: int = 1,
+        wait_until: Literal["domcontentloaded", "load"] | str | None = None,
+        max_inflight: int | None = None,
+        checkpoint: str | Path | None = None,
+        browser: Literal["chrome", "firefox"] | Callable[..., Browser] = "chrome",
+        **browser_kwargs,
+    ) -> None:
+        """Initialize a batch runner
+
+        Args:
+            extract (Extract, optional): Picklable function (module level) or `"module:function"`,\
+                called with the browser after each page loaded. Defaults to `default_extract`.
+            workers (int, optional): Number of worker processes, i.e. browsers. Defaults to 2.
+            timeout (float, optional): Seconds per try of a URL. Defaults to 30.
+            retries (int, optional): Extra tries for failed URLs. Defaults to 1.
+            wait_until (Literal["domcontentloaded", "load"] | str | None, optional): Completion condition\
+                passed to `Browser.get`, or a CSS selector. Defaults to None.
+            max_inflight (int | None, optional): URLs queued or running at once. Defaults to `2 * workers`.
+            checkpoint (str | Path | None, optional): File of successful URLs, one per line. Defaults to None.
+            browser (Literal["chrome", "firefox"] | Callable[..., Browser], optional): Browser each worker\
+                starts, or a picklable factory returning one. Defaults to "chrome".
+            **browser_kwargs: Keyword arguments for `Chrome`/`Firefox` or the factory. `headless` defaults to True.
+        """
+        if workers < 1:
+            raise ValueError("`workers` must be at least 1")
+        self.extract = extract
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.wait_until = wait_until
+        self.max_inflight = max_inflight or 2 * workers
+        self.checkpoint = Path(checkpoint) if checkpoint else None
+        self.browser = browser
+        self.browser_kwargs = {"headless": True, **browser_kwargs}
+        return None
+
+    def __repr__(self) -> str:
+        return f"BatchRunner(extract={self.extract!r},\
+                workers={self.workers},\
+                timeout={self.timeout},\
+                retries={self.retries},\
+                checkpoint={self.checkpoint})"
+
+    def run(self, urls: Iterable[str]) -> Iterator[RunResult]:
+        """Process `urls` and yield a result for each as soon as it is final
+
+        Blank lines, `#` comments and URLs already in the checkpoint are skipped. A successful\
+            result is checkpointed once the caller asks for the next one, so a URL whose result\
+            was not handled (e.g. the process was killed) is processed again on resume.
+
+        Args:
+            urls (Iterable[str]): Urls, e.g. an open file or `sys.stdin`.
+
+        Yields:
+            RunResult: Final result per url (after retries), in completion order
+        """
+        done = self._read_checkpoint()
+        queue = (
+            url
+            for url in (line.strip() for line in urls)
+            if url and not url.startswith("#") and url not in done
+        )
+        retry: list[tuple[str, int]] = []
+        inflight: dict[Future, tuple[str, int]] = {}
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.browser, self.browser_kwargs, self.timeout),
+        ) as pool:
+
+            def submit(url: str, attempt: int) -> None:
+                future = pool.submit(_process, url, self.extract, self.timeout, self.wait_until)
+                inflight[future] = (url, attempt)
+
+            exhausted = False
+            while True:
+                while len(inflight) < self.max_inflight:
+                    if retry:
+                        submit(*retry.pop())
+                        continue
+                    url = None if exhausted else next(queue, None)
+                    if url is None:
+                        exhausted = True
+                        break
+                    submit(url, 1)
+                if not inflight:
+                    break
+
+                finished, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    url, attempt = inflight.pop(future)
+                    try:
+                        result: RunResult = future.result()
+                    except Exception as e:  # Worker process died
+                        result = RunResult(url=url, status="error", error=repr(e))
+                    result.attempts = attempt
+                    if not result.ok and attempt <= self.retries:
+                        retry.append((url, attempt + 1))
+                        continue
+                    yield result
+                    if result.ok:
+                        self._write_checkpoint(url)
+        return None
+
+    def write_jsonl(self, urls: Iterable[str], output: IO[str]) -> Counter[str]:
+        """Process `urls` and write one JSON line per result, flushed as each finishes
+
+        Args:
+            urls (Iterable[str]): Urls, e.g. an open file or `sys.stdin`.
+            output (IO[str]): Text stream to write to.
+
+        Returns:
+            Counter[str]: Number of results per status
+        """
+        counts: Counter[str] = Counter()
+        for result in self.run(urls):
+            output.write(json.dumps(asdict(result), default=str) + "\n")
+            output.flush()
+            counts[result.status] += 1
+        return counts
+
+    def _read_checkpoint(self) -> set[str]:
+        if self.checkpoint is None or not self.checkpoint.exists():
+            return set()
+        return set(self.checkpoint.read_text(encoding="utf-8").split())
+
+    def _write_checkpoint(self, url: str) -> None:
+        if self.checkpoint is None:
+            return None
+        with self.checkpoint.open("a", encoding="utf-8") as f:
+            f.write(url + "\n")
+        return None
+
+
+# Worker process state: one browser per process, started on first use
+_BROWSER: Browser | None = None
+_BROWSER_SPEC: tuple[str | Callable[..., Browser], dict, float] = ("chrome", {}, 30)
+
+
+def _init_worker(browser: str | Callable[..., Browser], browser_kwargs: dict, timeout: float) -> None:
+    global _BROWSER_SPEC
+    _BROWSER_SPEC = (browser, browser_kwargs, timeout)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # The parent handles Ctrl+C
+    return None
+
+
+def _worker_browser() -> Browser:
+    global _BROWSER
+    if _BROWSER is None:
+        name, kwargs, timeout = _BROWSER_SPEC
+        if callable(name):
+            browser_class = name
+        elif name == "firefox":
+            from ak_selenium.firefox import Firefox as browser_class
+        else:
+            from ak_selenium.chrome import Chrome as browser_class
+        _BROWSER = browser_class(**kwargs)
+        _BROWSER.driver.set_page_load_timeout(timeout)
+        multiprocessing.util.Finalize(None, _quit_browser, exitpriority=10)
+    return _BROWSER
+
+
+def _quit_browser() -> None:
+    global _BROWSER
+    if _BROWSER is not None:
+        try:
+            _BROWSER.driver.quit()
+        except Exception:
+            pass
+    _BROWSER = None
+    return None
+
+
+def _resolve_extract(extract: Extract) -> Callable[[Browser], Any]:
+    if callable(extract):
+        return extract
+    module, _, name = extract.partition(":")
+    if not name:
+        raise ValueError(f"Expected `module:function`, got {extract!r}")
+    return getattr(importlib.import_module(module), name)
+
+
+class _TryTimeout(Exception):
+    pass
+
+
+@contextmanager
+def _deadline(seconds: float) -> Iterator[None]:
+    """Interrupt the block after `seconds` on POSIX, no-op elsewhere"""
+    if not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def _expire(signum, frame):
+        raise _TryTimeout()
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _process(url: str, extract: Extract, timeout: float, wait_until: str | None) -> RunResult:
+    """Worker task: load `url` and run `extract` within `timeout` seconds"""
+    result = RunResult(url=url, worker=os.getpid())
+    start = time.perf_counter()
+    try:
+        function = _resolve_extract(extract)
+        browser = _worker_browser()  # A cold browser start is not charged to the URL
+        start = time.perf_counter()
+        with _deadline(timeout):
+            navigation = browser.get(url, wait_until=wait_until, timeout=timeout)
+            navigation.raise_for_status()
+            result.value = function(browser)
+    except (_TryTimeout, exceptions.TimeoutException) as e:
+        result.status, result.error = "timeout", str(e) or f"No result within {timeout}s"
+        _quit_browser()  # An interrupted driver may be left in an unknown state
+    except exceptions.WebDriverException as e:
+        result.status, result.error = "error", e.msg or repr(e)
+        if _BROWSER is not None and not _browser_alive(_BROWSER):
+            _quit_browser()
+    except Exception as e:
+        result.status, result.error = "error", repr(e)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _browser_alive(browser: Browser) -> bool:
+    try:
+        browser.driver.current_url
+    except exceptions.WebDriverException:
+        return False
+    return True
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Console entry point `ak-selenium-run`"""
+    parser = argparse.ArgumentParser(
+        prog="ak-selenium-run",
+        description="Run an extract function over a list of URLs in a pool of browsers and stream JSONL results.",
+    )
+    parser.add_argument("urls", nargs="?", default="-", help="File with one URL per line, `-` for stdin (default)")
+    parser.add_argument("-e", "--extract", default=None, help="`module:function` called with the browser (default: title and url)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file, appended to; `-` for stdout (default)")
+    parser.add_argument("-w", "--workers", type=int, default=2, help="Browser processes (default: 2)")
+    parser.add_argument("-t", "--timeout", type=float, default=30, help="Seconds per URL try (default: 30)")
+    parser.add_argument("-r", "--retries", type=int, default=1, help="Extra tries for failed URLs (default: 1)")
+    parser.add_argument("--wait-until", default=None, help="`domcontentloaded`, `load` or a CSS selector")
+    parser.add_argument("--max-inflight", type=int, default=None, help="URLs queued at once (default: 2 x workers)")
+    parser.add_argument("-c", "--checkpoint", default=None, help="File of successful URLs, for resuming")
+    parser.add_argument("--browser", choices=("chrome", "firefox"), default="chrome")
+    parser.add_argument("--no-headless", dest="headless", action="store_false", help="Show the browser windows")
+    args = parser.parse_args(argv)
+
+    runner = BatchRunner(
+        extract=args.extract or default_extract,
+        workers=args.workers,
+        timeout=args.timeout,
+        retries=args.retries,
+        wait_until=args.wait_until,
+        max_inflight=args.max_inflight,
+        checkpoint=args.checkpoint,
+        browser=args.browser,
+        headless=args.headless,
+    )
+    urls = sys.stdin if args.urls == "-" else open(args.urls, encoding="utf-8")
+    output = sys.stdout if args.output == "-" else open(args.output, "a", encoding="utf-8")
+    try:
+        counts = runner.write_jsonl(urls, output)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if urls is not sys.stdin:
+            urls.close()
+        if output is not sys.stdout:
+            output.close()
+    print(", ".join(f"{status}: {n}" for status, n in sorted(counts.items())) or "No URLs", file=sys.stderr)
+    return 0 if counts["ok"] == sum(counts.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING, TypeVar
+
+import helium
+from helium._impl import HTMLElementIdentifiedByXPath
+from selenium.common import exceptions
+from selenium.webdriver.remote.webelement import WebElement
+
+from ak_selenium import js
+
+if TYPE_CHECKING:
+    from ak_selenium.browser import Browser
+
+T = TypeVar("T")
+
+DIRECTIONS = ("below", "to_right_of", "above", "to_left_of")
+
+
+def compile_selector(element: helium.HTMLElement) -> dict:
+    """Turn a Helium element into a JSON spec resolved in the page by `js.RESOLVE_SELECTOR`
+
+    Uses the XPath Helium itself generates for the element, so label matching\
+        (case-insensitive prefix, `aria-label`, `title`, ...) is Helium's. Relative\
+        arguments (`below=`, `to_right_of=`, ...) are compiled recursively.
+
+    Args:
+        element (helium.HTMLElement): `Button`, `Link`, `ListItem`, `Image` or `Text`, optionally with relative arguments.
+
+    Raises:
+        TypeError: The element (or an anchor) is found by label proximity (`TextField`,\
+            `CheckBox`, `RadioButton`, `ComboBox`) or is not a Helium element.
+
+    Returns:
+        dict: Compiled selector
+    """
+    if not isinstance(element, helium.HTMLElement):
+        raise TypeError(f"Expected a Helium element, got {element!r}")
+    return _compile_impl(element._impl, repr(element))
+
+
+def _compile_impl(impl, label: str) -> dict:
+    if not isinstance(impl, HTMLElementIdentifiedByXPath):
+        raise TypeError(
+            f"{label} cannot be compiled: only Button, Link, ListItem, Image and Text are supported"
+        )
+    spec = {"xpath": impl.get_xpath(), "hidden": impl.is_findable_when_hidden, "filters": []}
+    for direction in DIRECTIONS:
+        anchor = getattr(impl, direction)
+        if anchor is not None:
+            spec["filters"].append(
+                {
+                    "direction": direction,
+                    "anchor": _compile_impl(
+                        anchor, f"{direction}={type(anchor).__name__.removesuffix('Impl')}(...)"
+                    ),
+                }
+            )
+    return spec
+
+
+class CompiledSelector:
+    """A Helium-style selector resolved by one injected script and cached per DOM version
+
+    Each lookup is a single `execute_script` round trip. While the page is unchanged (same\
+        URL and document, no DOM mutation since the last lookup) the script only returns the\
+        DOM key and the previously resolved elements are reused. Actions retry once with a\
+        fresh lookup when an element has gone stale.
+
+    Differences to Helium: only the top-level document is searched (no iframes), and\
+        visibility is approximated by a non-empty bounding box and `visibility`.
+
+    Create selectors with `Browser.compile`.
+    """
+
+    def __init__(self, browser: "Browser", element: helium.HTMLElement) -> None:
+        """Compile a Helium element for a browser
+
+        Args:
+            browser (Browser): Browser to resolve the selector in.
+            element (helium.HTMLElement): Element to compile, see `compile_selector`.
+        """
+        self.browser = browser
+        self.element = element
+        self.spec: dict = compile_selector(element)
+        self.lookups: int = 0
+        """Number of round trips spent resolving"""
+        self.cache_hits: int = 0
+        """Lookups answered from the cache because the DOM was unchanged"""
+
+        self._key: str | None = None
+        self._elements: list[WebElement] = []
+        return None
+
+    def __repr__(self) -> str:
+        return f"CompiledSelector({self.element!r})"
+
+    def resolve(self, force: bool = False) -> list[WebElement]:
+        """All matching elements, in document order
+
+        Args:
+            force (bool, optional): Ignore the cache. Defaults to False.
+
+        Returns:
+            list[WebElement]: Matching elements
+        """
+        result: dict = self.browser.driver.execute_script(
+            js.RESOLVE_SELECTOR, self.spec, None if force else self._key
+        )
+        self.lookups += 1
+        if result["elements"] is None:
+            self.cache_hits += 1
+        else:
+            self._key, self._elements = result["key"], result["elements"]
+        return list(self._elements)
+
+    def exists(self) -> bool:
+        """Whether the element is on the page"""
+        return bool(self.resolve())
+
+    @property
+    def web_element(self) -> WebElement:
+        """First matching element
+
+        Raises:
+            LookupError: Nothing matches.
+        """
+        return self._act(lambda element: element)
+
+    @property
+    def text(self) -> str:
+        """Visible text of the first match"""
+        return self._act(lambda element: element.text)
+
+    def click(self) -> None:
+        """Click the first match"""
+        return self._act(lambda element: element.click())
+
+    def _act(self, action: Callable[[WebElement], T]) -> T:
+        """Apply `action` to the first match, re-resolving once if it went stale"""
+        try:
+            return action(self._first())
+        except exceptions.StaleElementReferenceException:
+            return action(self._first(force=True))
+
+    def _first(self, force: bool = False) -> WebElement:
+        elements = self.resolve(force=force)
+        if not elements:
+            raise LookupError(repr(self.element))
+        return elements[0]
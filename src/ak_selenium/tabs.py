@@ -0,0 +1,222 @@
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from selenium.common import exceptions
+
+from ak_selenium import js
+from ak_selenium.browser import Browser, Locator, _as_locator
+from ak_selenium.cdp import CDPConnection, CDPError
+from ak_selenium.network import RequestBlocker
+
+if TYPE_CHECKING:
+    from ak_selenium.chrome import Chrome
+
+
+@dataclass
+class TabResult:
+    """Outcome of one page loaded by `TabScheduler`"""
+
+    url: str
+    """Requested url"""
+    status: Literal["ok", "timeout", "error"] = "ok"
+    """`"timeout"` if the tab did not reach `wait_until` in time, `"error"` on WebDriver or `extract` errors"""
+    value: Any = None
+    """Return value of `extract`, None unless `status` is `"ok"`"""
+    error: str | None = None
+    """Error message when `status` is not `"ok"`"""
+    elapsed: float = 0.0
+    """Seconds from opening the tab to the page being ready"""
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+class TabScheduler:
+    """Loads several pages at once in background tabs of one Chrome and yields them as they become ready
+
+    Tabs are opened with CDP `Target.createTarget` and navigated with `Page.navigate`, which\
+        returns without waiting for the page, so up to `tabs` pages download concurrently. The scheduler\
+        then polls the open tabs in turn over a DevTools session per tab, without switching\
+        windows or waiting on loading tabs, and hands each ready page to `extract`.
+
+    `extract` runs through ChromeDriver, which with the `"normal"` page load strategy first\
+        waits for the tab's load event; use `"eager"` or `"none"` to extract right after\
+        `wait_until="domcontentloaded"`.
+
+    Create schedulers with `Chrome.fetch_tabs`.
+    """
+
+    POLL_INTERVAL: float = 0.05
+    """Seconds to sleep between polling rounds in which no tab became ready"""
+
+    def __init__(
+        self,
+        parent: "Chrome",
+        tabs: int = 4,
+        wait_until: Literal["domcontentloaded", "load"] | Locator = "load",
+        extract: Callable[[Browser], Any] | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Initialize a tab scheduler
+
+        Args:
+            parent (Chrome): Chrome instance to open the tabs in.
+            tabs (int, optional): Maximum number of tabs loading at once. Defaults to 4.
+            wait_until (Literal["domcontentloaded", "load"] | Locator, optional): When a tab counts as ready:\
+                after DOMContentLoaded, after the load event, or once the locator matches. Defaults to "load".
+            extract (Callable[[Browser], Any] | None, optional): Called with a `Browser` bound to the ready tab,\
+                its return value becomes `TabResult.value`. Defaults to returning the page source.
+            timeout (float | None, optional): Seconds a tab may take to become ready. Defaults to `Browser.MAX_WAIT_TIME`.
+        """
+        if tabs < 1:
+            raise ValueError("`tabs` must be at least 1")
+        self.parent = parent
+        self.tabs = tabs
+        self.condition: str | list[str] = (
+            wait_until if wait_until in ("domcontentloaded", "load") else _as_locator(wait_until)  # type: ignore[arg-type]
+        )
+        self.extract: Callable[[Browser], Any] = extract or (lambda tab: tab.driver.page_source)
+        self.timeout: float = parent.MAX_WAIT_TIME if timeout is None else timeout
+        return None
+
+    def __repr__(self) -> str:
+        return f"TabScheduler(parent={self.parent!r},\
+                tabs={self.tabs},\
+                wait_until={self.condition},\
+                timeout={self.timeout})"
+
+    def run(self, urls: Iterable[str]) -> Iterator[TabResult]:
+        """Load `urls`, keeping up to `tabs` of them loading at once
+
+        Tabs are closed as soon as their result is yielded, and any still open when the\
+            generator is closed early. A url whose tab cannot be opened yields an `"error"`\
+            result without stopping the others. The parent's window is left active.
+
+        Args:
+            urls (Iterable[str]): Urls to load, `https://` is added when the scheme is missing.
+
+        Yields:
+            TabResult: One result per url, in the order the pages became ready
+        """
+        self.parent._pin_window()
+        queue = iter(urls)
+        active: dict[str, tuple[str, str, float, Browser]] = {}
+        try:
+            yield from self._fill(active, queue)
+            while active:
+                finished = False
+                for handle, (url, target_id, started, tab) in list(active.items()):
+                    result = self._poll(url, started, tab)
+                    if result is None:
+                        continue
+                    finished = True
+                    del active[handle]
+                    self._close(target_id, tab)
+                    yield result
+                    yield from self._fill(active, queue)
+                if not finished:
+                    time.sleep(self.POLL_INTERVAL)
+        finally:
+            for _, target_id, _, tab in active.values():
+                self._close(target_id, tab)
+        return None
+
+    def _fill(self, active: dict, queue: Iterator[str]) -> Iterator[TabResult]:
+        """Launch urls from `queue` until `tabs` are loading, yielding those that failed to launch"""
+        while len(active) < self.tabs:
+            url = next(queue, None)
+            if url is None:
+                return None
+            error = self._launch(active, url)
+            if error is not None:
+                yield error
+        return None
+
+    def _launch(self, active: dict, url: str) -> TabResult | None:
+        """Open a background tab, start navigating it to `url` and add it to `active`
+
+        Each tab gets its own DevTools session, used for setup and readiness polling so\
+            the driver's window only switches for `extract`. CDP overrides belong to the\
+            session, so the parent's useragent, resource policy and `navigator.webdriver`\
+            patch are applied through it before `Page.navigate`, which returns once the\
+            navigation has started.
+
+        Returns:
+            TabResult | None: An `"error"` result if the tab could not be opened
+        """
+        if "://" not in url and not url.startswith(("about:", "data:")):
+            url = "https://" + url
+        started = time.monotonic()
+        driver = self.parent.driver
+        target_id: str | None = None
+        session: CDPConnection | None = None
+        try:
+            known_handles = set(driver.window_handles)
+            target_id = driver.execute_cdp_cmd(
+                "Target.createTarget", {"url": "about:blank", "background": True}
+            )["targetId"]
+            new_handles = [h for h in driver.window_handles if h not in known_handles]
+            handle = target_id if target_id in new_handles else new_handles[0]
+
+            session = CDPConnection.for_driver(driver, handle=handle)
+            session.send("Network.enable")
+            session.send("Network.setUserAgentOverride", {"userAgent": self.parent.USERAGENT})
+            RequestBlocker(session, self.parent._count_blocked).apply(self.parent.resource_policy)
+            session.send(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"},
+            )
+            session.send("Page.navigate", {"url": url})
+        except Exception as e:
+            if session is not None:
+                session.close()
+            if target_id is not None:
+                self._close(target_id)
+            error = e.msg if isinstance(e, exceptions.WebDriverException) else repr(e)
+            return TabResult(url=url, status="error", error=error, elapsed=time.monotonic() - started)
+
+        tab = Browser(driver=self.parent._webdriver)
+        tab._window_handle = handle
+        tab._cdp = session
+        active[handle] = (url, target_id, started, tab)
+        return None
+
+    def _poll(self, url: str, started: float, tab: Browser) -> TabResult | None:
+        """Result of the tab if it is ready or past its timeout, otherwise None"""
+        elapsed = time.monotonic() - started
+        session: CDPConnection = tab._cdp  # type: ignore[assignment]
+        try:
+            ready: bool = session.evaluate(js.TAB_READY, self.condition)
+        except CDPError as e:
+            if session.closed:
+                return TabResult(url=url, status="error", error=e.msg, elapsed=elapsed)
+            ready = False  # The document was replaced mid-evaluation, try again next round
+        except exceptions.WebDriverException as e:
+            return TabResult(url=url, status="error", error=e.msg, elapsed=elapsed)
+        if not ready:
+            if elapsed < self.timeout:
+                return None
+            return TabResult(
+                url=url,
+                status="timeout",
+                error=f"Tab not ready after {self.timeout}s",
+                elapsed=elapsed,
+            )
+        try:
+            value = self.extract(tab)
+        except Exception as e:
+            return TabResult(url=url, status="error", error=repr(e), elapsed=elapsed)
+        return TabResult(url=url, value=value, elapsed=elapsed)
+
+    def _close(self, target_id: str, tab: Browser | None = None) -> None:
+        """Close a tab and its DevTools session, ignoring tabs that are already gone"""
+        if tab is not None and tab._cdp is not None:
+            tab._cdp.close()
+        try:
+            self.parent.driver.execute_cdp_cmd("Target.closeTarget", {"targetId": target_id})
+        except exceptions.WebDriverException:
+            pass
+        return None
@@ -0,0 +1,192 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from ak_requests.utils import latest_useragent
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_path() -> Path:
+    """Default location of the on-disk useragent cache
+
+    Returns:
+        Path: `%LOCALAPPDATA%/ak_selenium/useragent.json` on Windows, `~/.cache/ak_selenium/useragent.json` elsewhere
+    """
+    base = os.environ.get("LOCALAPPDATA") or Path.home() / ".cache"
+    return Path(base) / "ak_selenium" / "useragent.json"
+
+
+class UserAgentResolver:
+    """Resolves the latest browser useragent with an in-process memo and a TTL'd on-disk cache
+
+    The network lookup (`ak_requests.utils.latest_useragent`) only runs when the cached
+    value is missing or older than `ttl`. With `background=True` the lookup runs in a
+    daemon thread and `resolve` returns the stale value (or the fallback) immediately,
+    so browser construction never waits on the network. When the fallback is returned
+    because nothing was ever cached (e.g. the first browser on a fresh machine), a
+    warning is logged once per browser name; call `refresh` first to avoid it. After a
+    failed lookup, `resolve` waits `retry_after` seconds before trying again, so being
+    offline does not cost a lookup (or a thread) per browser started.
+    """
+
+    TTL: float = 24 * 60 * 60
+    """Default cache lifetime in seconds"""
+    RETRY_AFTER: float = 5 * 60
+    """Default seconds between lookups while they keep failing"""
+
+    def __init__(
+        self,
+        cache_path: str | Path | None = None,
+        ttl: float | None = None,
+        fetch: Callable[[str], str] = latest_useragent,
+        background: bool = True,
+        retry_after: float | None = None,
+    ) -> None:
+        """Initialize a useragent resolver
+
+        Args:
+            cache_path (str | Path | None, optional): JSON cache file. Defaults to `default_cache_path()`.
+            ttl (float | None, optional): Seconds before a cached useragent is refreshed. Defaults to `UserAgentResolver.TTL`.
+            fetch (Callable[[str], str], optional): Lookup taking a browser name and returning a useragent, or `""` on failure. Defaults to `latest_useragent`.
+            background (bool, optional): Refresh stale entries in a background thread. Defaults to True.
+            retry_after (float | None, optional): Seconds `resolve` waits after a failed lookup. Defaults to `UserAgentResolver.RETRY_AFTER`.
+        """
+        self.cache_path = Path(cache_path) if cache_path else default_cache_path()
+        self.ttl = self.TTL if ttl is None else ttl
+        self.fetch = fetch
+        self.background = background
+        self.retry_after = self.RETRY_AFTER if retry_after is None else retry_after
+
+        self._memo: dict[str, tuple[str, float]] = {}
+        self._failed_at: dict[str, float] = {}
+        self._refreshing: dict[str, threading.Thread] = {}
+        self._warned: set[str] = set()
+        self._lock = threading.Lock()
+        return None
+
+    def __repr__(self) -> str:
+        return f"UserAgentResolver(cache_path={self.cache_path},\
+                ttl={self.ttl},\
+                background={self.background})"
+
+    def resolve(self, browser: str, fallback: str = "") -> str:
+        """Return the cached useragent for `browser`, refreshing it if stale.
+
+        Args:
+            browser (str): Browser name understood by `fetch`, e.g. `"Chrome"` or `"Firefox"`.
+            fallback (str, optional): Returned when nothing is cached yet and the lookup is not awaited. Defaults to "".
+
+        Returns:
+            str: The resolved useragent, or `fallback`
+        """
+        with self._lock:
+            entry = self._memo.get(browser)
+            if entry is None:
+                entry = self._read_disk().get(browser)
+                if entry is not None:
+                    self._memo[browser] = entry
+
+        if entry is not None and time.time() - entry[1] < self.ttl:
+            return entry[0]
+
+        if time.time() - self._failed_at.get(browser, float("-inf")) < self.retry_after:
+            pass  # The last lookup failed recently
+        elif self.background:
+            self._refresh_in_background(browser)
+        else:
+            self.refresh(browser)
+            entry = self._memo.get(browser, entry)
+
+        if entry is not None:
+            return entry[0]
+        if browser not in self._warned:
+            self._warned.add(browser)
+            logger.warning(
+                "No cached %s useragent yet, using the built-in fallback%s",
+                browser,
+                " until the background lookup finishes" if self.background else "",
+            )
+        return fallback
+
+    def refresh(self, browser: str) -> str:
+        """Look up the latest useragent now and store it in the memo and on disk.
+
+        Args:
+            browser (str): Browser name understood by `fetch`.
+
+        Returns:
+            str: The fetched useragent, or `""` if the lookup failed
+        """
+        try:
+            useragent = self.fetch(browser)
+        except Exception:
+            useragent = ""
+        if useragent == "":
+            with self._lock:
+                self._failed_at[browser] = time.time()
+            return useragent
+
+        entry = (useragent, time.time())
+        with self._lock:
+            self._failed_at.pop(browser, None)
+            self._memo[browser] = entry
+            cache = self._read_disk()
+            cache[browser] = entry
+            self._write_disk(cache)
+        return useragent
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until running background refreshes finish.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait per refresh. Defaults to None.
+        """
+        for thread in list(self._refreshing.values()):
+            thread.join(timeout)
+        return None
+
+    def clear(self) -> None:
+        """Drop the in-process memo and delete the on-disk cache"""
+        with self._lock:
+            self._memo.clear()
+            self.cache_path.unlink(missing_ok=True)
+        return None
+
+    def _refresh_in_background(self, browser: str) -> None:
+        with self._lock:
+            thread = self._refreshing.get(browser)
+            if thread is not None and thread.is_alive():
+                return None
+            thread = threading.Thread(target=self.refresh, args=(browser,), daemon=True)
+            self._refreshing[browser] = thread
+        thread.start()
+        return None
+
+    def _read_disk(self) -> dict[str, tuple[str, float]]:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            return {
+                name: (value["useragent"], float(value["fetched_at"]))
+                for name, value in data.items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def _write_disk(self, cache: dict[str, tuple[str, float]]) -> None:
+        data = {
+            name: {"useragent": useragent, "fetched_at": fetched_at}
+            for name, (useragent, fetched_at) in cache.items()
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass  # A read-only cache location only costs us the disk cache
+        return None
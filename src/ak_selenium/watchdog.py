@@ -0,0 +1,237 @@
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from selenium.common import exceptions
+
+if TYPE_CHECKING:
+    from ak_selenium.browser import Browser
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+@dataclass
+class ResourceMetrics:
+    """One sample taken by `Watchdog.sample`"""
+
+    timestamp: float
+    """`time.time()` of the sample"""
+    rss: int | None = None
+    """Resident memory of the driver, browser and renderer processes, in bytes. Shared pages are counted once per process."""
+    processes: int | None = None
+    """Number of processes in the tree"""
+    cpu_percent: float | None = None
+    """CPU use of the tree since the previous sample; 100 is one full core"""
+    js_heap_used: int | None = None
+    """Used JavaScript heap of the current page, in bytes (Chromium only)"""
+    js_heap_total: int | None = None
+    """Allocated JavaScript heap of the current page, in bytes (Chromium only)"""
+
+
+class Watchdog:
+    """Tracks a browser's memory and CPU use and restarts it when a limit is crossed
+
+    Process metrics cover the driver process and all its descendants (browser, renderers,\
+        GPU and utility processes) and need `psutil` (`pip install ak_selenium[watchdog]`)\
+        and a local driver. The JS heap is read with CDP `Performance.getMetrics`.
+
+    Sampling and recycling happen in `Watchdog.check`, which `Browser.get` calls before each\
+        navigation, so a browser is only restarted between pages and never under the caller's\
+        feet. Samples are taken at most every `interval` seconds. See `Browser.restart` for the\
+        state kept across a restart.
+
+    Example:
+        ```python
+        watchdog = chrome.watch(max_rss=2 * 1024**3, max_js_heap=512 * 1024**2, interval=15)
+        for url in urls:
+            chrome.get(url)
+        print(watchdog.recycles, watchdog.peak_rss, watchdog.metrics)
+        ```
+    """
+
+    def __init__(
+        self,
+        browser: "Browser",
+        max_rss: int | None = None,
+        max_js_heap: int | None = None,
+        max_cpu_percent: float | None = None,
+        interval: float = 30.0,
+        history: int = 1000,
+        on_recycle: Callable[[str, ResourceMetrics], Any] | None = None,
+    ) -> None:
+        """Watch a browser
+
+        Args:
+            browser (Browser): Browser to watch and restart.
+            max_rss (int | None, optional): Restart above this process-tree RSS, in bytes. Defaults to None.
+            max_js_heap (int | None, optional): Restart above this used JS heap, in bytes. Defaults to None.
+            max_cpu_percent (float | None, optional): Restart when the tree used more CPU than this between two samples. Defaults to None.
+            interval (float, optional): Minimum seconds between samples. Defaults to 30.0.
+            history (int, optional): Number of samples kept in `Watchdog.history`. Defaults to 1000.
+            on_recycle (Callable[[str, ResourceMetrics], Any] | None, optional): Called with the reason and the sample before each restart. Defaults to None.
+
+        Raises:
+            NotImplementedError: The browser cannot be restarted, see `Browser.can_restart`.
+            ImportError: `max_rss` or `max_cpu_percent` is set but psutil is not installed.
+        """
+        if not browser.can_restart:
+            raise NotImplementedError(f"{type(browser).__name__} cannot be restarted, so it cannot be watched")
+        if psutil is None and (max_rss is not None or max_cpu_percent is not None):
+            raise ImportError(
+                "RSS and CPU limits require psutil: pip install ak_selenium[watchdog]"
+            )
+        self.browser = browser
+        self.max_rss = max_rss
+        self.max_js_heap = max_js_heap
+        self.max_cpu_percent = max_cpu_percent
+        self.interval = interval
+        self.on_recycle = on_recycle
+
+        self.history: deque[ResourceMetrics] = deque(maxlen=history)
+        """Recent samples, oldest first"""
+        self.recycles: int = 0
+        """Restarts triggered by the watchdog"""
+        self.last_reason: str | None = None
+        """Why the browser was last restarted"""
+
+        self._last_sample: float = float("-inf")
+        self._cpu_mark: tuple[float, float] | None = None
+        self._performance_driver = None
+        return None
+
+    def __str__(self) -> str:
+        return f"""
+        Watchdog.Object
+        Browser: {type(self.browser).__name__}
+        Max RSS: {self.max_rss}
+        Max JS Heap: {self.max_js_heap}
+        Max CPU: {self.max_cpu_percent}
+        Recycles: {self.recycles}
+        """
+
+    def __repr__(self) -> str:
+        return f"Watchdog({self.browser!r},\
+                max_rss={self.max_rss},\
+                max_js_heap={self.max_js_heap},\
+                max_cpu_percent={self.max_cpu_percent},\
+                interval={self.interval})"
+
+    @property
+    def metrics(self) -> ResourceMetrics | None:
+        """Latest sample"""
+        return self.history[-1] if self.history else None
+
+    @property
+    def peak_rss(self) -> int | None:
+        """Highest process-tree RSS in `history`, in bytes"""
+        return max((m.rss for m in self.history if m.rss is not None), default=None)
+
+    @property
+    def peak_js_heap(self) -> int | None:
+        """Highest used JS heap in `history`, in bytes"""
+        return max((m.js_heap_used for m in self.history if m.js_heap_used is not None), default=None)
+
+    def check(self, force: bool = False) -> ResourceMetrics | None:
+        """Take a sample if `interval` has passed and restart the browser if it is over a limit
+
+        Args:
+            force (bool, optional): Sample even if `interval` has not passed. Defaults to False.
+
+        Returns:
+            ResourceMetrics | None: The sample, or None if none was due
+        """
+        if not force and time.monotonic() - self._last_sample < self.interval:
+            return None
+        metrics = self.sample()
+        reason = self.exceeded(metrics)
+        if reason is not None:
+            self.recycle(reason, metrics)
+        return metrics
+
+    def sample(self) -> ResourceMetrics:
+        """Measure the browser now and add the sample to `history`"""
+        self._last_sample = time.monotonic()
+        metrics = ResourceMetrics(timestamp=time.time())
+        self._sample_processes(metrics)
+        self._sample_heap(metrics)
+        self.history.append(metrics)
+        return metrics
+
+    def exceeded(self, metrics: ResourceMetrics) -> str | None:
+        """Which limit a sample crossed, if any"""
+        if self.max_rss is not None and metrics.rss is not None and metrics.rss > self.max_rss:
+            return f"rss {metrics.rss} > {self.max_rss}"
+        if (
+            self.max_js_heap is not None
+            and metrics.js_heap_used is not None
+            and metrics.js_heap_used > self.max_js_heap
+        ):
+            return f"js heap {metrics.js_heap_used} > {self.max_js_heap}"
+        if (
+            self.max_cpu_percent is not None
+            and metrics.cpu_percent is not None
+            and metrics.cpu_percent > self.max_cpu_percent
+        ):
+            return f"cpu {metrics.cpu_percent:.0f}% > {self.max_cpu_percent:.0f}%"
+        return None
+
+    def recycle(self, reason: str, metrics: ResourceMetrics | None = None) -> None:
+        """Restart the browser now, see `Browser.restart`"""
+        if self.on_recycle is not None:
+            self.on_recycle(reason, metrics or ResourceMetrics(timestamp=time.time()))
+        self.browser.restart()
+        self.recycles += 1
+        self.last_reason = reason
+        self._cpu_mark = None
+        return None
+
+    def _sample_processes(self, metrics: ResourceMetrics) -> None:
+        service = getattr(self.browser.driver, "service", None)
+        process = getattr(service, "process", None)
+        if psutil is None or process is None:
+            return None  # psutil missing, or a remote driver
+
+        try:
+            root = psutil.Process(process.pid)
+            tree = [root, *root.children(recursive=True)]
+        except psutil.Error:
+            return None
+        rss, cpu_time = 0, 0.0
+        for proc in tree:
+            try:
+                rss += proc.memory_info().rss
+                times = proc.cpu_times()
+                cpu_time += times.user + times.system
+            except psutil.Error:
+                continue  # Process exited meanwhile
+        metrics.rss, metrics.processes = rss, len(tree)
+
+        now = time.monotonic()
+        if self._cpu_mark is not None:
+            wall, cpu = now - self._cpu_mark[0], cpu_time - self._cpu_mark[1]
+            if wall > 0:
+                metrics.cpu_percent = max(cpu, 0.0) / wall * 100
+        self._cpu_mark = (now, cpu_time)
+        return None
+
+    def _sample_heap(self, metrics: ResourceMetrics) -> None:
+        if not self.browser.supports_cdp:
+            return None
+        driver = self.browser.driver
+        try:
+            if self._performance_driver is not driver:
+                driver.execute_cdp_cmd("Performance.enable", {})
+                self._performance_driver = driver
+            response: dict = driver.execute_cdp_cmd("Performance.getMetrics", {})
+        except exceptions.WebDriverException:
+            return None
+        values = {m["name"]: m["value"] for m in response.get("metrics", [])}
+        if "JSHeapUsedSize" in values:
+            metrics.js_heap_used = int(values["JSHeapUsedSize"])
+            metrics.js_heap_total = int(values.get("JSHeapTotalSize", 0))
+        return None
@@ -1,3 +1,6 @@
+import re
+import time
+
 import pytest
 
 from ak_selenium import Chrome
@@ -35,3 +38,235 @@ def test_str_method(chrome_instance):
         Half Screen View: {chrome_instance.half_screen}
         """
     )
+
+
+def test_soup_cached_until_dom_changes(chrome_instance):
+    chrome_instance.get("https://example.com")
+    soup = chrome_instance.soup
+    assert chrome_instance.soup is soup
+
+    chrome_instance.driver.execute_script(
+        "document.body.appendChild(document.createElement('section'));"
+    )
+    changed = chrome_instance.soup
+    assert changed is not soup
+    assert changed.find("section") is not None
+
+
+def test_soup_of(chrome_instance):
+    chrome_instance.get("https://example.com")
+    heading = chrome_instance.soup_of("h1")
+    assert heading.h1.text == chrome_instance.soup.find("h1").text
+
+    parts = chrome_instance.soup_of({"title": "h1", "missing": "table#none"})
+    assert parts["title"] is not None
+    assert parts["missing"] is None
+
+
+def test_extract(chrome_instance):
+    chrome_instance.get("https://example.com")
+    data = chrome_instance.extract(
+        {
+            "title": "h1",
+            "links": {"css": "a", "fields": {"text": "@text", "href": "@href"}},
+            "missing": "table td",
+        }
+    )
+    assert data["title"] == chrome_instance.soup.find("h1").text.strip()
+    assert data["links"][0]["href"].startswith("http")
+    assert data["missing"] is None
+
+
+def test_find_by_text(chrome_instance):
+    chrome_instance.get("https://example.com")
+    heading = chrome_instance.find_by_text("Example Domain", tag="h1")
+    assert heading is not None
+    assert heading == chrome_instance.find_element_by_text(
+        chrome_instance.driver.find_elements("tag name", "h1"), "Example Domain"
+    )
+    assert chrome_instance.find_by_text("example domain", match="casefold") == heading
+    assert chrome_instance.find_all_by_text("Example", match="contains", tag="h1") == [
+        heading
+    ]
+    assert chrome_instance.find_by_text("No such text") is None
+
+
+def test_text_query_matches_page_lowercasing():
+    from ak_selenium.browser import Browser
+
+    assert Browser._text_query("Straße", "casefold", None, None)[0] == "straße"
+    assert Browser._text_query(re.compile("total", re.I | re.S), "exact", None, None)[
+        1:3
+    ] == ("regex", "is")
+    with pytest.raises(ValueError):
+        Browser._text_query(re.compile("total", re.VERBOSE), "regex", None, None)
+
+
+def test_wait_for_any_observer(chrome_instance):
+    chrome_instance.get("https://example.com")
+    chrome_instance.driver.execute_script(
+        "setTimeout(function () {"
+        " document.body.appendChild(document.createElement('aside')); }, 200);"
+    )
+    index, element = chrome_instance.wait_for_any(
+        "table#never", "aside", timeout=5, mode="observer"
+    )
+    assert index == 1
+    assert element.tag_name == "aside"
+
+    with pytest.raises(chrome_instance.EXCEPTIONS.TimeoutException):
+        chrome_instance.wait_for_locator("table#never", timeout=0.5, mode="observer")
+
+
+def test_wait_for_any_poll_ignores_implicit_wait(chrome_instance):
+    chrome_instance.get("https://example.com")
+    start = time.monotonic()
+    assert chrome_instance.wait_for_any("table#never", "h1", mode="poll")[0] == 1
+    assert chrome_instance.wait_for_any(
+        "h1", "table#never", present=False, mode="poll"
+    ) == (1, None)
+    assert time.monotonic() - start < chrome_instance.IMPLICITLY_WAIT_TIME
+
+
+def test_get_result(chrome_instance):
+    result = chrome_instance.get("https://example.com", wait_until="h1", timeout=5)
+    assert result.ok
+    assert result.total_time >= result.navigate_time
+
+    result = chrome_instance.get(
+        "https://example.com", wait_until="table#never", timeout=0.5
+    )
+    assert result.status == "timeout"
+    with pytest.raises(chrome_instance.EXCEPTIONS.TimeoutException):
+        result.raise_for_status()
+
+
+def test_fetch_tabs(chrome_instance):
+    main = chrome_instance.driver.current_window_handle
+    urls = ["https://example.com", "https://example.org", "https://example.net"]
+    results = list(
+        chrome_instance.fetch_tabs(
+            urls, tabs=2, wait_until="h1", extract=lambda tab: tab.driver.title
+        )
+    )
+    assert sorted(result.url for result in results) == sorted(urls)
+    assert all(result.ok and result.value == "Example Domain" for result in results)
+    assert chrome_instance.driver.window_handles == [main]
+
+    # A url that cannot be navigated to fails alone, and its tab is closed
+    results = list(
+        chrome_instance.fetch_tabs(
+            ["http://[invalid", "https://example.com"], wait_until="h1"
+        )
+    )
+    assert [result.status for result in results] == ["error", "ok"]
+    assert chrome_instance.driver.window_handles == [main]
+
+
+def test_async_browser(chrome_instance):
+    import asyncio
+
+    from ak_selenium import AsyncBrowser
+
+    async def main():
+        browser = AsyncBrowser(chrome_instance)
+        result = await browser.get("https://example.com", wait_until="h1", timeout=5)
+        assert result.ok
+        assert (await browser.soup()).h1.text == "Example Domain"
+        assert (
+            await browser.wait_for_locator("h1", timeout=5)
+        ).text == "Example Domain"
+        assert await browser.execute_script("return arguments[0] + 1", 1) == 2
+        with pytest.raises(TimeoutError):
+            await browser.execute_async_script(
+                "setTimeout(arguments[0], 2000)", timeout=0.1
+            )
+
+    asyncio.run(main())
+
+
+def test_cdp_transport(chrome_instance):
+    chrome_instance.get("https://example.com")
+    spec = {"title": "h1", "links": {"css": "a", "attr": "href"}}
+    expected = chrome_instance.extract(spec)
+    try:
+        chrome_instance.TRANSPORT = "cdp"
+        assert chrome_instance.cdp is not None
+        assert chrome_instance.extract(spec) == expected
+        assert chrome_instance.evaluate("return arguments[0] * 2", 21) == 42
+        with pytest.raises(chrome_instance.EXCEPTIONS.JavascriptException):
+            chrome_instance.evaluate("throw new Error('boom')")
+    finally:
+        chrome_instance.TRANSPORT = "webdriver"
+
+
+def test_bound_helium(chrome_instance):
+    import helium
+
+    chrome_instance.get("https://example.com")
+    heading = chrome_instance.Element.Text("Example Domain")
+    assert isinstance(heading, helium.Text)
+    assert heading.exists()
+    assert not chrome_instance.Element.Button("No such button").exists()
+    assert chrome_instance.Action is chrome_instance.Action
+
+
+def test_compiled_selector(chrome_instance):
+    chrome_instance.get(
+        "data:text/html,<h1>Title</h1><p>Password</p><button>Log In</button><button>Help</button>"
+    )
+    title = chrome_instance.compile("Title")
+    log_in = chrome_instance.compile(
+        chrome_instance.Element.Button("Log In", below="Password")
+    )
+    assert title.exists() and log_in.exists()
+    assert log_in.exists()
+    assert log_in.cache_hits >= 1
+    assert log_in.text == "Log In"
+    assert not chrome_instance.compile(
+        chrome_instance.Element.Button("Help", above="Password")
+    ).exists()
+
+    chrome_instance.driver.execute_script("document.querySelector('h1').remove()")
+    assert not title.exists()
+    with pytest.raises(LookupError):
+        title.click()
+    with pytest.raises(TypeError):
+        chrome_instance.compile(chrome_instance.Element.TextField("Name"))
+
+
+def test_profile(chrome_instance):
+    with chrome_instance.profile() as stats:
+        chrome_instance.get("https://example.com")
+        chrome_instance.extract({"title": "h1"})
+    assert stats.commands["get"].count == 1
+    script = stats.commands["w3cExecuteScript"]
+    assert script.response_bytes > 0
+    assert any(site.startswith("Browser.extract @ ") for site in script.call_sites)
+    assert "w3cExecuteScript" in stats.report()
+
+
+def test_resource_policy_covers_contexts(chrome_instance):
+    from ak_selenium import ResourcePolicy
+
+    fetch = (
+        "var done = arguments[0];"
+        "fetch('https://httpbin.org/image/png').then(function () { done('loaded'); },"
+        " function () { done('blocked'); });"
+    )
+    policy = ResourcePolicy(url_patterns=["*httpbin.org/image*"])
+    with chrome_instance.blocking(policy), chrome_instance.new_context() as context:
+        context.get("https://httpbin.org/html")
+        assert context.driver.execute_async_script(fetch) == "blocked"
+
+
+def test_cookie_on_page():
+    from ak_selenium.browser import _cookie_on_page
+
+    url = "https://www.example.com/account/settings"
+    assert _cookie_on_page(url, ".example.com", "/")
+    assert _cookie_on_page(url, "www.example.com", "/account")
+    assert _cookie_on_page(url, "", "/account/")
+    assert not _cookie_on_page(url, "other.com", "/")
+    assert not _cookie_on_page(url, "ample.com", "/")
+    assert not _cookie_on_page(url, ".example.com", "/acc")
@@ -0,0 +1,17 @@
+from types import SimpleNamespace
+
+import helium
+from helium._impl import APIImpl
+
+from ak_selenium.helium_attribs import HeliumActions, HeliumBinding, HeliumElements
+
+
+def test_helium_internals():
+    """Browser starts and bindings use Helium internals, so a Helium release moving them fails here"""
+    assert hasattr(helium, "_API_IMPL")
+    for name in ("start_chrome_impl", "start_firefox_impl", "set_driver_impl"):
+        assert callable(getattr(APIImpl, name))
+
+    binding = HeliumBinding(SimpleNamespace(_webdriver=None))
+    HeliumElements(binding)
+    HeliumActions(binding)  # Looks up each action's `APIImpl` method
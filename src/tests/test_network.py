@@ -0,0 +1,26 @@
+from urllib.parse import unquote
+
+from ak_selenium.network import ResourcePolicy
+
+
+def test_firefox_prefs():
+    assert ResourcePolicy().firefox_prefs() == {}
+
+    prefs = ResourcePolicy(
+        types={"image", "stylesheet"}, url_patterns=["*doubleclick.net*"]
+    ).firefox_prefs()
+    assert prefs["permissions.default.image"] == 2
+    assert prefs["network.proxy.type"] == 2
+    pac = unquote(prefs["network.proxy.autoconfig_url"].split(",", 1)[1])
+    assert '"*.css?*"' in pac and '"*doubleclick.net*"' in pac
+    assert "FindProxyForURL" in pac
+
+
+def test_fetch_patterns():
+    policy = ResourcePolicy(types={"image", "font"}, url_patterns=["*doubleclick.net*"])
+    assert policy.fetch_patterns() == [
+        {"urlPattern": "*", "resourceType": "Font", "requestStage": "Request"},
+        {"urlPattern": "*", "resourceType": "Image", "requestStage": "Request"},
+        {"urlPattern": "*doubleclick.net*", "requestStage": "Request"},
+    ]
+    assert ResourcePolicy().fetch_patterns() == []
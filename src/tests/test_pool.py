@@ -0,0 +1,49 @@
+import pytest
+
+from ak_selenium import BrowserPool, Chrome
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = BrowserPool(Chrome, size=1, max_pages=2, headless=True)
+    yield pool
+    pool.close()
+
+
+def test_checkout_resets_state(pool):
+    with pool.checkout() as chrome:
+        chrome.get("https://httpbin.org/cookies/set/pool_set/1")
+        assert chrome.driver.get_cookies() != []
+
+    with pool.checkout() as chrome:
+        assert chrome.driver.current_url == "about:blank"
+        assert chrome.driver.get_cookies() == []
+
+
+def test_reset_clears_other_origins(pool):
+    with pool.checkout() as chrome:
+        chrome.get("https://example.com")
+        chrome.driver.execute_script("window.localStorage.setItem('left', 'behind')")
+        chrome.driver.get(
+            "https://httpbin.org/html"
+        )  # Keeps the browser under `max_pages`
+
+    with pool.checkout() as chrome:
+        chrome.get("https://example.com")
+        assert (
+            chrome.driver.execute_script("return window.localStorage.getItem('left')")
+            is None
+        )
+
+
+def test_recycle_after_max_pages(pool):
+    with pool.checkout() as chrome:
+        chrome.get("https://example.com")
+        chrome.get("https://example.com")
+
+    with pool.checkout() as chrome:
+        assert chrome.page_count == 0
+
+    metrics = pool.metrics
+    assert metrics.recycles >= 1
+    assert metrics.checkouts == metrics.hits + metrics.misses
@@ -0,0 +1,60 @@
+import os
+
+from ak_selenium.profiles import CLONE_PREFIX, ProfileTemplate, prune_stale_clones
+
+
+def make_profile(root):
+    files = {
+        "Local State": "{}",
+        "SingletonLock": "host-1",
+        "Default/Cookies": "sqlite",
+        "Default/Preferences": "{}",
+        "Default/Local Storage/leveldb/000003.log": "log",
+        "Default/Local Storage/leveldb/000005.ldb": "table",
+        "Default/Cache/Cache_Data/data_0": "cached",
+        "Default/Service Worker/CacheStorage/abc": "cached",
+        "Default/Service Worker/Database/000001.log": "db",
+    }
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+def test_capture_strips_caches_and_locks(tmp_path):
+    template = ProfileTemplate.capture(
+        make_profile(tmp_path / "source"), tmp_path / "template"
+    )
+
+    captured = {
+        p.relative_to(template.path).as_posix()
+        for p in template.path.rglob("*")
+        if p.is_file()
+    }
+    assert "Default/Cookies" in captured
+    assert "Default/Service Worker/Database/000001.log" in captured
+    assert "SingletonLock" not in captured
+    assert not any("Cache/" in name or "CacheStorage" in name for name in captured)
+
+
+def test_clone_is_private_and_cleaned_up(tmp_path):
+    template = ProfileTemplate.capture(
+        make_profile(tmp_path / "source"), tmp_path / "template"
+    )
+
+    with template.clone(tmp_path) as clone:
+        table = "Default/Local Storage/leveldb/000005.ldb"
+        assert os.path.samefile(clone.path / table, template.path / table)  # Hardlinked
+
+        (clone.path / "Default/Cookies").write_text("changed")
+        assert (template.path / "Default/Cookies").read_text() == "sqlite"
+    assert not clone.path.exists()
+
+
+def test_prune_stale_clones(tmp_path):
+    stale = tmp_path / f"{CLONE_PREFIX}stale"
+    stale.mkdir()
+    (stale / ".ak_selenium_owner").write_text("999999999")
+    assert prune_stale_clones(tmp_path) == 1
+    assert not stale.exists()
@@ -1,4 +1,7 @@
+import functools
+import http.server
 import json
+import threading
 
 import pytest
 
@@ -39,3 +42,132 @@ def test_cookies(chrome_instance):
 
     cookies: dict = json.loads(chrome.soup.find("pre").text).get("cookies", {})
     assert cookies["browser_set"] == "1"
+
+
+def test_session_sync_cost(chrome_instance):
+    """Headers are read once; unchanged cookies are not re-synced"""
+    chrome = chrome_instance
+    chrome.session
+    before = chrome.session_stats.round_trips
+    skips = chrome.session_stats.cookie_skips
+
+    chrome.session
+    assert chrome.session_stats.round_trips == before + 1
+    assert chrome.session_stats.cookie_skips == skips + 1
+
+
+def test_push_cookies(chrome_instance):
+    """Confirm cookies set on the requests side are pushed to the browser"""
+    chrome = chrome_instance
+    session = chrome.session
+    session.get("https://httpbin.org/cookies/set/pushed/1")
+
+    assert chrome.push_cookies() >= 1
+    assert chrome.push_cookies() == 0
+
+    chrome.get("https://httpbin.org/cookies")
+    cookies: dict = json.loads(chrome.soup.find("pre").text).get("cookies", {})
+    assert cookies["pushed"] == "1"
+
+    session.cookies.clear(domain="httpbin.org", path="/", name="pushed")
+    chrome.push_cookies()
+    chrome.get("https://httpbin.org/cookies")
+    cookies = json.loads(chrome.soup.find("pre").text).get("cookies", {})
+    assert "pushed" not in cookies
+
+
+def test_context_isolation(chrome_instance):
+    """Browser contexts keep separate cookie jars and sessions"""
+    chrome = chrome_instance
+    with chrome.new_context() as alice, chrome.new_context() as bob:
+        alice.get("https://httpbin.org/cookies/set/identity/alice")
+        bob.get("https://httpbin.org/cookies/set/identity/bob")
+
+        assert alice.session.cookies.get("identity") == "alice"
+        assert bob.session.cookies.get("identity") == "bob"
+        assert "identity" not in chrome.session.cookies
+
+
+def test_hybrid_fetch(chrome_instance):
+    """Static pages stay on the session, pages failing a detector go to the browser"""
+    from ak_selenium import HybridFetcher
+    from ak_selenium.hybrid import missing_selectors
+
+    fetcher = HybridFetcher(
+        chrome_instance, detectors=[missing_selectors("#rendered")], route_by="path"
+    )
+    page = fetcher.fetch("https://httpbin.org/status/200")
+    assert page.route == "browser" and page.reason == "missing '#rendered'"
+    assert fetcher.fetch("https://httpbin.org/status/204").reason == "remembered"
+
+    fetcher = HybridFetcher(chrome_instance)
+    page = fetcher.fetch("https://httpbin.org/html")
+    assert page.route == "session" and page.soup.find("h1") is not None
+    assert fetcher.routes == {"httpbin.org": "session"}
+
+
+@pytest.fixture
+def local_site(tmp_path):
+    """Serves a page and a JSON document from a local `http.server`; stop it with `server.shutdown()`"""
+    root = tmp_path / "site"
+    root.mkdir()
+    (root / "page.html").write_text("<html><body><h1>Cached</h1></body></html>")
+    (root / "data.json").write_text('{"cached": true}')
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler, directory=str(root)
+    )
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_response_cache_session(local_site, tmp_path):
+    """Responses recorded through the session replay with the server gone"""
+    import requests
+
+    from ak_selenium import ResponseCache
+    from ak_selenium.cache import CacheMiss
+
+    server, base = local_site
+    cache = ResponseCache(tmp_path / "cache", mode="record")
+    session = requests.Session()
+    session.mount("http://", cache.adapter(session.get_adapter("http://")))
+    assert session.get(f"{base}/data.json").json() == {"cached": True}
+    assert len(cache) == 1 and cache.stats.stores == 1
+
+    server.shutdown()
+    cache.mode = "replay"
+    assert session.get(f"{base}/data.json").json() == {"cached": True}
+    with pytest.raises(CacheMiss):
+        session.get(f"{base}/page.html")
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    for method in ("POST", "HEAD"):  # Never cached, so never sent while replaying
+        with pytest.raises(CacheMiss):
+            session.request(method, f"{base}/data.json")
+
+
+def test_response_cache(chrome_instance, local_site, tmp_path):
+    """Traffic recorded through the browser and session replays offline"""
+    from ak_selenium import ResponseCache
+    from ak_selenium.cache import CacheMiss
+
+    chrome = chrome_instance
+    server, base = local_site
+    cache = ResponseCache(tmp_path / "cache", mode="record")
+    with cache.attach(chrome) as interceptor:
+        assert interceptor.intercepting
+        chrome.get(f"{base}/page.html")
+        chrome.session.get(f"{base}/data.json")
+    assert len(cache) >= 2
+
+    server.shutdown()
+    cache.mode = "replay"
+    with cache.attach(chrome):
+        chrome.get(f"{base}/page.html")
+        assert chrome.soup.find("h1").text == "Cached"
+        assert chrome.session.get(f"{base}/data.json").json() == {"cached": True}
+        with pytest.raises(CacheMiss):
+            chrome.session.get(f"{base}/missing.json")
+    assert cache.stats.hits >= 2
@@ -0,0 +1,146 @@
+import io
+import json
+import time
+import tomllib
+from pathlib import Path
+
+from selenium.common import exceptions
+
+from ak_selenium import runner
+from ak_selenium.runner import BatchRunner, main
+
+URLS = ["stub://ok", "# comment", "", "stub://flaky", "stub://broken", "stub://slow"]
+TRIES: dict[str, int] = {}  # Per worker process
+
+
+class StubDriver:
+    title = "Stub"
+    current_url = "stub://"
+
+    def set_page_load_timeout(self, timeout: float) -> None:
+        return None
+
+    def quit(self) -> None:
+        return None
+
+
+class StubNavigation:
+    def raise_for_status(self) -> None:
+        return None
+
+
+class StubBrowser:
+    """Stands in for `Chrome` in the workers: `stub://flaky` fails once, `stub://broken` always\
+        fails and `stub://slow` outlasts any timeout"""
+
+    def __init__(self, **kwargs) -> None:
+        self.driver = StubDriver()
+
+    def get(self, url: str, wait_until=None, timeout=None) -> StubNavigation:
+        TRIES[url] = TRIES.get(url, 0) + 1
+        if url == "stub://broken" or (url == "stub://flaky" and TRIES[url] == 1):
+            raise exceptions.WebDriverException(f"Cannot load {url}")
+        if url == "stub://slow":
+            time.sleep(30)
+        self.driver.current_url = url
+        return StubNavigation()
+
+
+def extract_url(browser) -> str:
+    return browser.driver.current_url
+
+
+def stub_runner(**kwargs) -> BatchRunner:
+    return BatchRunner(
+        extract_url, workers=1, timeout=1, retries=1, browser=StubBrowser, **kwargs
+    )
+
+
+def test_run_statuses_and_retries():
+    results = {result.url: result for result in stub_runner().run(URLS)}
+
+    assert set(results) == {"stub://ok", "stub://flaky", "stub://broken", "stub://slow"}
+    assert (
+        results["stub://ok"].value == "stub://ok" and results["stub://ok"].attempts == 1
+    )
+    assert results["stub://flaky"].ok and results["stub://flaky"].attempts == 2
+    assert (
+        results["stub://broken"].status == "error"
+        and results["stub://broken"].attempts == 2
+    )
+    assert "Cannot load" in results["stub://broken"].error
+    assert (
+        results["stub://slow"].status == "timeout"
+        and results["stub://slow"].attempts == 2
+    )
+
+
+def test_write_jsonl_and_resume(tmp_path: Path):
+    """Only successful URLs are checkpointed, so a resumed run retries the failed ones"""
+    checkpoint = tmp_path / "done.txt"
+    output = io.StringIO()
+    counts = stub_runner(checkpoint=checkpoint).write_jsonl(URLS[:5], output)
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert counts == {"ok": 2, "error": 1}
+    assert {line["url"]: line["status"] for line in lines} == {
+        "stub://ok": "ok",
+        "stub://flaky": "ok",
+        "stub://broken": "error",
+    }
+    assert sorted(checkpoint.read_text().split()) == ["stub://flaky", "stub://ok"]
+
+    resumed = [
+        result.url for result in stub_runner(checkpoint=checkpoint).run(URLS[:5])
+    ]
+    assert resumed == ["stub://broken"]
+
+
+def test_checkpoint_follows_output(tmp_path: Path):
+    """A result is not checkpointed until the caller has handled it"""
+    checkpoint = tmp_path / "done.txt"
+    results = stub_runner(checkpoint=checkpoint).run(["stub://ok", "stub://flaky"])
+    next(results)
+    results.close()  # e.g. the process was killed before the result was written
+
+    assert not checkpoint.exists()
+
+
+class StubRunner(BatchRunner):
+    def __init__(self, *args, browser, headless, **kwargs) -> None:
+        super().__init__(*args, browser=StubBrowser, **kwargs)
+
+
+def test_main(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.setattr(runner, "BatchRunner", StubRunner)
+    urls = tmp_path / "urls.txt"
+    urls.write_text("stub://ok\nstub://broken\n")
+    output = tmp_path / "results.jsonl"
+
+    argv = [
+        str(urls),
+        "-o",
+        str(output),
+        "-e",
+        "tests.test_runner:extract_url",
+        "-w",
+        "1",
+        "-r",
+        "0",
+    ]
+    assert main(argv) == 1
+    assert "error: 1, ok: 1" in capsys.readouterr().err
+    values = {
+        json.loads(line)["url"]: json.loads(line)["value"]
+        for line in output.read_text().splitlines()
+    }
+    assert values == {"stub://ok": "stub://ok", "stub://broken": None}
+
+
+def test_entry_point():
+    pyproject = tomllib.loads(
+        (Path(__file__).parents[2] / "pyproject.toml").read_text()
+    )
+    assert (
+        pyproject["project"]["scripts"]["ak-selenium-run"] == "ak_selenium.runner:main"
+    )
@@ -0,0 +1,83 @@
+import time
+
+from ak_selenium.useragent import UserAgentResolver
+
+
+class CountingFetch:
+    def __init__(self, useragent: str = "Mozilla/5.0 Test") -> None:
+        self.useragent = useragent
+        self.calls = 0
+
+    def __call__(self, browser: str) -> str:
+        self.calls += 1
+        return f"{self.useragent} {browser}"
+
+
+def test_memo_and_disk_cache(tmp_path):
+    fetch = CountingFetch()
+    cache = tmp_path / "useragent.json"
+    resolver = UserAgentResolver(cache_path=cache, fetch=fetch, background=False)
+
+    assert resolver.resolve("Chrome") == "Mozilla/5.0 Test Chrome"
+    assert resolver.resolve("Chrome") == "Mozilla/5.0 Test Chrome"
+    assert fetch.calls == 1
+
+    # A fresh resolver (new process) is served from disk
+    resolver = UserAgentResolver(cache_path=cache, fetch=fetch, background=False)
+    assert resolver.resolve("Chrome") == "Mozilla/5.0 Test Chrome"
+    assert fetch.calls == 1
+
+
+def test_stale_entry_is_refreshed(tmp_path):
+    fetch = CountingFetch()
+    resolver = UserAgentResolver(
+        cache_path=tmp_path / "useragent.json", ttl=0, fetch=fetch, background=False
+    )
+    resolver.resolve("Firefox")
+    resolver.resolve("Firefox")
+    assert fetch.calls == 2
+
+
+def test_background_refresh_does_not_block(tmp_path):
+    def slow_fetch(browser: str) -> str:
+        time.sleep(0.5)
+        return "Mozilla/5.0 Slow"
+
+    resolver = UserAgentResolver(
+        cache_path=tmp_path / "useragent.json", fetch=slow_fetch
+    )
+
+    start = time.perf_counter()
+    assert resolver.resolve("Chrome", fallback="fallback") == "fallback"
+    assert time.perf_counter() - start < 0.25
+
+    resolver.wait()
+    assert resolver.resolve("Chrome", fallback="fallback") == "Mozilla/5.0 Slow"
+
+
+def test_failed_lookup_keeps_fallback(tmp_path, caplog):
+    resolver = UserAgentResolver(
+        cache_path=tmp_path / "useragent.json", fetch=lambda _: "", background=False
+    )
+    assert resolver.resolve("Chrome", fallback="fallback") == "fallback"
+    assert resolver.resolve("Chrome", fallback="fallback") == "fallback"
+    assert [r.levelname for r in caplog.records] == ["WARNING"]  # Warned once
+
+
+def test_failed_lookup_backs_off(tmp_path):
+    calls = []
+
+    def failing_fetch(browser: str) -> str:
+        calls.append(browser)
+        return ""
+
+    resolver = UserAgentResolver(
+        cache_path=tmp_path / "useragent.json", fetch=failing_fetch, background=False
+    )
+    resolver.resolve("Chrome")
+    resolver.resolve("Chrome")
+    assert len(calls) == 1
+
+    resolver.retry_after = 0
+    resolver.resolve("Chrome")
+    assert len(calls) == 2
@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from ak_selenium import Chrome
+
+
+@pytest.fixture(scope="module")
+def chrome_instance():
+    chrome = Chrome(headless=True)
+    yield chrome
+    chrome.driver.quit()
+
+
+def test_watchdog_restart_keeps_cookies(chrome_instance):
+    """A restart triggered by the watchdog keeps the browser's cookies"""
+    chrome = chrome_instance
+    chrome.get("https://httpbin.org/cookies/set/kept/1")
+    watchdog = chrome.watch(max_js_heap=1, interval=0)
+    try:
+        chrome.get("https://httpbin.org/cookies")
+    finally:
+        chrome.watchdog = None
+
+    assert watchdog.recycles == 1 and chrome.restarts == 1
+    assert watchdog.metrics is not None and watchdog.metrics.js_heap_used > 1
+    cookies: dict = json.loads(chrome.soup.find("pre").text).get("cookies", {})
+    assert cookies["kept"] == "1"
+    assert chrome.Element.Text("kept").exists()  # Helium bindings follow the new driver
+
+
+def test_watch_rejects_contexts(chrome_instance):
+    """Browsers without their own driver cannot be restarted, so they cannot be watched"""
+    with chrome_instance.new_context() as context:
+        assert not context.can_restart
+        with pytest.raises(NotImplementedError):
+            context.watch(max_js_heap=1)